@@ -9,6 +9,7 @@ from .render.scad import (
     generate_month_calendar_scad,
     generate_monthly_calendar_scads,
     blocks_for_contributions,
+    levels_for_contributions,
     generate_gridfinity_plate_scad,
     scad_to_stl,
 )
@@ -25,6 +26,7 @@ __all__ = [
     "generate_month_calendar_scad",
     "generate_monthly_calendar_scads",
     "blocks_for_contributions",
+    "levels_for_contributions",
     "generate_gridfinity_plate_scad",
     "fetch_user_contributions",
     "load_baseplate_scad",
@@ -1,7 +1,9 @@
 import argparse
 import json
+import os
 import re
 import shutil
+import subprocess
 import sys
 from calendar import month_abbr, month_name
 from importlib import metadata
@@ -10,15 +12,34 @@ from pathlib import Path
 from .. import fetch as _fetch
 from .. import scad as _scad
 from ..baseplate import load_baseplate_scad
-from ..core.contributions import build_contribution_maps
+from ..core.archive import contribution_maps_from_store, open_contribution_store
+from ..core.contributions import (
+    ContributionAggregator,
+    build_contribution_maps,
+    rollup_contributions,
+)
+from ..core import github as _github
+from ..core.grid import ContributionGrid
+from ..core.localgit import discover_repositories
+from ..core.github import SEARCH_SOURCES, TOKEN_POOL_ENV, TokenPool, resolve_tokens
 from ..core.metadata import MetadataWriter
+from ..core.team import (
+    TEAM_WORKERS,
+    load_member_grids,
+    member_breakdowns,
+    read_logins,
+    sum_breakdowns,
+)
+from ..core.watermark import WatermarkStore, refresh_contribution_maps
 from ..readme import write_year_readme
+from ..render.levels import SCALE_NAMES, fit_scale
 
 SCAD_HEADER = "// Generated by gitshelves"
 
 __all__ = ["main"]
 
 _DEFAULT_FETCH_USER_CONTRIBUTIONS = _fetch.fetch_user_contributions
+_DEFAULT_ITER_USER_CONTRIBUTIONS = _fetch.iter_user_contributions
 _DEFAULT_RESOLVE_TOKEN = _fetch.resolve_token
 _DEFAULT_DETERMINE_YEAR_RANGE = _fetch._determine_year_range
 
@@ -38,6 +59,13 @@ def fetch_user_contributions(*args, **kwargs):
     return func(*args, **kwargs)
 
 
+def iter_user_contributions(*args, **kwargs):
+    func = getattr(
+        _fetch_module(), "iter_user_contributions", _DEFAULT_ITER_USER_CONTRIBUTIONS
+    )
+    return func(*args, **kwargs)
+
+
 def resolve_token(token: str | None) -> str | None:
     func = getattr(_fetch_module(), "resolve_token", _DEFAULT_RESOLVE_TOKEN)
     return func(token)
@@ -54,6 +82,13 @@ def blocks_for_contributions(count: int) -> int:
     return _scad_module().blocks_for_contributions(count)
 
 
+def levels_for_contributions(counts, scale=None) -> list[int]:
+    func = getattr(_scad_module(), "levels_for_contributions", None)
+    if func is None:
+        return [blocks_for_contributions(count) for count in counts]
+    return func(counts, scale)
+
+
 def generate_contrib_cube_stack_scad(levels: int) -> str:
     return _scad_module().generate_contrib_cube_stack_scad(levels)
 
@@ -354,17 +389,32 @@ def _resolve_package_version() -> str:
 
 
 def main(argv: list[str] | None = None):
+    raw_args = sys.argv[1:] if argv is None else list(argv)
+    if raw_args[:1] == ["ingest"]:
+        from .ingest import main as ingest_main
+
+        return ingest_main(raw_args[1:])
+
     parser = argparse.ArgumentParser(
         description="Generate 3D GitHub contribution charts",
         formatter_class=argparse.RawTextHelpFormatter,
     )
-    parser.add_argument("username", help="GitHub username")
+    parser.add_argument(
+        "username", help="GitHub username (or the team name with --members)"
+    )
     parser.add_argument(
         "--token",
         help=(
             "GitHub API token (fallback order: --token value, GH_TOKEN, then GITHUB_TOKEN)"
         ),
     )
+    parser.add_argument(
+        "--token-file",
+        help=(
+            "File with one GitHub token per line; together with GH_TOKENS the tokens "
+            "form a pool and each request uses the one with the most remaining quota"
+        ),
+    )
     parser.add_argument("--start-year", type=int, help="First year of contributions")
     parser.add_argument("--end-year", type=int, help="Last year of contributions")
     parser.add_argument(
@@ -420,6 +470,104 @@ def main(argv: list[str] | None = None):
         "--json",
         help="Optional run-level metadata summary file",
     )
+    parser.add_argument(
+        "--cache-dir",
+        help="Persist GitHub search pages here and revalidate them with ETags",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=None,
+        help="Seconds to trust --cache-dir entries before revalidating them",
+    )
+    parser.add_argument(
+        "--refresh-cache",
+        action="store_true",
+        help="Ignore cached search results (including closed years) and refetch them",
+    )
+    parser.add_argument(
+        "--state-dir",
+        help=(
+            "Keep per-user watermarks and aggregated counts here and only fetch "
+            "contributions created since the last run"
+        ),
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help=(
+            "Aggregate search pages as they arrive instead of buffering every "
+            "item (sequential and uncached)"
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help=(
+            "Threads, and so concurrent GitHub requests, shared by every source, "
+            "year, bisected window and page of a fetch (default 4)"
+        ),
+    )
+    parser.add_argument(
+        "--sources",
+        nargs="+",
+        choices=sorted(SEARCH_SOURCES),
+        metavar="SOURCE",
+        help=(
+            "Count these contribution types separately and merge them "
+            f"({', '.join(sorted(SEARCH_SOURCES))}); "
+            "the JSON summary gains a per-source breakdown"
+        ),
+    )
+    parser.add_argument(
+        "--local-repos",
+        nargs="+",
+        metavar="PATH",
+        help=(
+            "Count commits from these local clones (or directories of clones) with "
+            "git log instead of calling the GitHub API"
+        ),
+    )
+    parser.add_argument(
+        "--git-author",
+        help="git log --author pattern for --local-repos (defaults to the username)",
+    )
+    parser.add_argument(
+        "--contribution-store",
+        help=(
+            "Read counts ingested with 'gitshelves ingest' from this directory "
+            "(or .db/.sqlite file) instead of calling the GitHub API"
+        ),
+    )
+    parser.add_argument(
+        "--scale",
+        choices=SCALE_NAMES,
+        default="log",
+        help=(
+            "How counts map to stacked blocks: log (1 per decade, the default), "
+            "capped-log, linear or quantile bands fitted to the data"
+        ),
+    )
+    parser.add_argument(
+        "--scale-levels",
+        type=int,
+        default=None,
+        help="Highest block level for the capped-log, linear and quantile scales (default 5)",
+    )
+    parser.add_argument(
+        "--members",
+        nargs="+",
+        metavar="LOGIN",
+        help=(
+            "Chart a team: fetch these users concurrently and sum their counts; "
+            "the JSON summary gains a per-member breakdown"
+        ),
+    )
+    parser.add_argument(
+        "--members-file",
+        help="File with one team member login per line (combined with --members)",
+    )
     parser.add_argument(
         "--version",
         action="version",
@@ -451,19 +599,228 @@ def main(argv: list[str] | None = None):
     if not hasattr(args, "baseplate_template"):
         args.baseplate_template = "baseplate_2x6.scad"
 
-    token = resolve_token(args.token)
-    contribs = fetch_user_contributions(
-        args.username,
-        token=token,
-        start_year=args.start_year,
-        end_year=args.end_year,
-    )
-    start_year, end_year, counts, daily_counts = build_contribution_maps(
-        contribs,
-        args.start_year,
-        args.end_year,
-        determine_range=_determine_year_range,
-    )
+    cache_ttl = getattr(args, "cache_ttl", None)
+    if cache_ttl is not None and cache_ttl < 0:
+        parser.error("--cache-ttl must not be negative")
+
+    workers = getattr(args, "workers", None)
+    if workers is not None and workers <= 0:
+        parser.error("--workers must be positive")
+
+    stream = getattr(args, "stream", False)
+    if stream and (
+        getattr(args, "cache_dir", None) or getattr(args, "refresh_cache", False)
+    ):
+        parser.error(
+            "--stream bypasses the search cache; drop --cache-dir and --refresh-cache"
+        )
+    if stream and workers is not None:
+        parser.error("--stream fetches one page at a time; drop --workers")
+    state_dir = getattr(args, "state_dir", None)
+    if state_dir and stream:
+        parser.error("--state-dir already fetches incrementally; drop --stream")
+    if state_dir and (
+        getattr(args, "cache_dir", None) or getattr(args, "refresh_cache", False)
+    ):
+        parser.error(
+            "--state-dir keeps its own incremental state; "
+            "drop --cache-dir and --refresh-cache"
+        )
+
+    local_repos = getattr(args, "local_repos", None)
+    git_author = getattr(args, "git_author", None)
+    if git_author and not local_repos:
+        parser.error("--git-author requires --local-repos")
+    if local_repos and (stream or state_dir):
+        parser.error("--local-repos cannot be combined with --stream or --state-dir")
+    contribution_store = getattr(args, "contribution_store", None)
+    if contribution_store and (stream or state_dir or local_repos):
+        parser.error(
+            "--contribution-store cannot be combined with --stream, --state-dir "
+            "or --local-repos"
+        )
+
+    store = None
+    if contribution_store:
+        try:
+            store = open_contribution_store(contribution_store, create=False)
+        except (FileNotFoundError, ValueError) as exc:
+            parser.error(f"--contribution-store could not be opened: {exc}")
+
+    sources = getattr(args, "sources", None)
+    if sources and (stream or state_dir or local_repos or contribution_store):
+        parser.error(
+            "--sources cannot be combined with --stream, --state-dir, "
+            "--local-repos or --contribution-store"
+        )
+
+    scale_name = getattr(args, "scale", "log")
+    scale_levels = getattr(args, "scale_levels", None)
+    if scale_levels is not None:
+        if scale_levels <= 0:
+            parser.error("--scale-levels must be positive")
+        if scale_name == "log":
+            parser.error("--scale-levels needs --scale capped-log, linear or quantile")
+
+    members = list(getattr(args, "members", None) or [])
+    members_file = getattr(args, "members_file", None)
+    if members_file:
+        try:
+            members.extend(read_logins(members_file))
+        except (OSError, UnicodeDecodeError) as exc:
+            parser.error(f"--members-file could not be read: {exc}")
+        if not members:
+            parser.error("--members-file does not list any members")
+    if members and (stream or state_dir or local_repos):
+        parser.error(
+            "--members cannot be combined with --stream, --state-dir or --local-repos"
+        )
+
+    token_file = getattr(args, "token_file", None)
+    if token_file or os.getenv(TOKEN_POOL_ENV):
+        try:
+            tokens = resolve_tokens(args.token, token_file)
+        except OSError as exc:
+            parser.error(f"--token-file could not be read: {exc}")
+        if len(tokens) > 1:
+            token = TokenPool(tokens)
+        else:
+            token = tokens[0] if tokens else None
+    else:
+        token = resolve_token(args.token)
+    fetch_options = {}
+    if getattr(args, "cache_dir", None):
+        fetch_options["cache_dir"] = args.cache_dir
+        fetch_options["cache_ttl"] = cache_ttl
+    if workers is not None:
+        fetch_options["max_workers"] = workers
+    if getattr(args, "refresh_cache", False):
+        fetch_options["refresh"] = True
+    if local_repos:
+        try:
+            repositories = discover_repositories(local_repos)
+        except FileNotFoundError as exc:
+            parser.error(f"--local-repos {exc}")
+        if not repositories:
+            parser.error(
+                "--local-repos found no git repositories under "
+                + ", ".join(local_repos)
+            )
+        fetch_options["repositories"] = repositories
+        if git_author:
+            fetch_options["author"] = git_author
+    if sources:
+        fetch_options["sources"] = list(dict.fromkeys(sources))
+    aggregator = ContributionAggregator()
+    _github.fetch_metrics.reset()
+    monthly_members: dict = {}
+    daily_members: dict = {}
+    if members:
+        start_year, end_year = _determine_year_range(args.start_year, args.end_year)
+        member_aggregators: dict[str, ContributionAggregator] = {}
+
+        def load_member(member: str) -> ContributionGrid:
+            if store is not None:
+                _start, _end, member_counts, member_daily = (
+                    contribution_maps_from_store(
+                        store,
+                        member,
+                        start_year,
+                        end_year,
+                        determine_range=_determine_year_range,
+                    )
+                )
+            else:
+                member_aggregator = member_aggregators[member] = (
+                    ContributionAggregator()
+                )
+                _start, _end, member_counts, member_daily = build_contribution_maps(
+                    fetch_user_contributions(
+                        member,
+                        token=token,
+                        start_year=start_year,
+                        end_year=end_year,
+                        **fetch_options,
+                    ),
+                    start_year,
+                    end_year,
+                    determine_range=_determine_year_range,
+                    aggregator=member_aggregator,
+                )
+            return ContributionGrid.from_maps(
+                start_year, end_year, member_counts, member_daily
+            )
+
+        member_grids = load_member_grids(
+            members, load_member, max_workers=workers or TEAM_WORKERS
+        )
+        grid = ContributionGrid.merge(member_grids.values())
+        monthly_members, daily_members = member_breakdowns(member_grids)
+        source_maps = [
+            member_aggregator.source_maps(start_year, end_year)
+            for member_aggregator in member_aggregators.values()
+        ]
+        monthly_sources = sum_breakdowns(maps[0] for maps in source_maps)
+        daily_sources = sum_breakdowns(maps[1] for maps in source_maps)
+    elif store is not None:
+        start_year, end_year, counts, daily_counts = contribution_maps_from_store(
+            store,
+            args.username,
+            args.start_year,
+            args.end_year,
+            determine_range=_determine_year_range,
+        )
+    elif state_dir:
+        refresh_options = {} if workers is None else {"max_workers": workers}
+        start_year, end_year, counts, daily_counts = refresh_contribution_maps(
+            args.username,
+            WatermarkStore(Path(state_dir)),
+            token,
+            args.start_year,
+            args.end_year,
+            determine_range=_determine_year_range,
+            **refresh_options,
+        )
+    else:
+        if stream:
+            contribs = iter_user_contributions(
+                args.username,
+                token=token,
+                start_year=args.start_year,
+                end_year=args.end_year,
+            )
+        else:
+            try:
+                contribs = fetch_user_contributions(
+                    args.username,
+                    token=token,
+                    start_year=args.start_year,
+                    end_year=args.end_year,
+                    **fetch_options,
+                )
+            except subprocess.CalledProcessError as exc:
+                detail = (exc.stderr or "").strip() or f"exit status {exc.returncode}"
+                parser.error(f"--local-repos could not be scanned: {detail}")
+        start_year, end_year, counts, daily_counts = build_contribution_maps(
+            contribs,
+            args.start_year,
+            args.end_year,
+            determine_range=_determine_year_range,
+            aggregator=aggregator,
+        )
+    if not members:
+        monthly_sources, daily_sources = aggregator.source_maps(start_year, end_year)
+        grid = ContributionGrid.from_maps(start_year, end_year, counts, daily_counts)
+    rollup = rollup_contributions(grid)
+    counts, daily_counts = grid.monthly, grid.daily
+    monthly_scale = daily_scale = None
+    if scale_name != "log":
+        monthly_scale = fit_scale(scale_name, counts.values(), scale_levels)
+        daily_scale = fit_scale(scale_name, daily_counts.values(), scale_levels)
+    # Generators only receive ``scale`` when one was chosen, so replacement
+    # ``gitshelves.scad`` modules with the original signatures keep working.
+    monthly_scale_kwargs = {"scale": monthly_scale} if monthly_scale else {}
+    daily_scale_kwargs = {"scale": daily_scale} if daily_scale else {}
 
     metadata_writer = MetadataWriter(
         username=args.username,
@@ -478,6 +835,14 @@ def main(argv: list[str] | None = None):
         gridfinity_columns=args.gridfinity_columns,
         gridfinity_cubes=args.gridfinity_cubes,
         baseplate_template=args.baseplate_template,
+        monthly_sources=monthly_sources,
+        daily_sources=daily_sources,
+        monthly_members=monthly_members,
+        daily_members=daily_members,
+        fetch_stats=_github.fetch_metrics.snapshot().to_json(),
+        rollup=rollup,
+        monthly_scale=monthly_scale,
+        daily_scale=daily_scale,
     )
 
     output_path = Path(args.output)
@@ -501,11 +866,18 @@ def main(argv: list[str] | None = None):
                 layout_note += " and `gridfinity_plate.stl`"
             layout_note += " (auto-generated)"
             extras.append(layout_note)
+        month_levels = dict(
+            zip(
+                range(1, 13),
+                levels_for_contributions(
+                    [counts.get((year, month), 0) for month in range(1, 13)],
+                    monthly_scale,
+                ),
+            )
+        )
         if args.gridfinity_cubes:
             months_with_cubes = [
-                month
-                for month in range(1, 13)
-                if blocks_for_contributions(counts.get((year, month), 0)) > 0
+                month for month in range(1, 13) if month_levels[month] > 0
             ]
             if months_with_cubes:
                 labels = ", ".join(month_abbr[m] for m in months_with_cubes)
@@ -518,11 +890,16 @@ def main(argv: list[str] | None = None):
             extras=extras or None,
             include_baseplate_stl=render_yearly_stl,
             calendar_slug=calendar_slug,
+            stats=rollup.year_stats[year],
+            **monthly_scale_kwargs,
         )
         year_dir = readme_path.parent
         _write_year_baseplate(year_dir, render_yearly_stl, metadata_writer, year)
         calendars = generate_monthly_calendar_scads(
-            daily_counts, year, days_per_row=args.calendar_days_per_row
+            daily_counts,
+            year,
+            days_per_row=args.calendar_days_per_row,
+            **daily_scale_kwargs,
         )
         _cleanup_calendar_directories(year_dir, calendar_slug)
         calendar_dir = year_dir / calendar_slug
@@ -548,7 +925,7 @@ def main(argv: list[str] | None = None):
         layout_stl_path = layout_path.with_suffix(".stl")
         if args.gridfinity_layouts:
             layout_text = generate_gridfinity_plate_scad(
-                counts, year, columns=args.gridfinity_columns
+                counts, year, columns=args.gridfinity_columns, **monthly_scale_kwargs
             )
             layout_path.write_text(layout_text)
             print(f"Wrote {layout_path}")
@@ -577,7 +954,7 @@ def main(argv: list[str] | None = None):
             year_dir = readme_path.parent
             generated_cube_months: set[int] = set()
             for month in range(1, 13):
-                levels = blocks_for_contributions(counts.get((year, month), 0))
+                levels = month_levels[month]
                 cube_scad_path = year_dir / f"contrib_cube_{month:02d}.scad"
                 cube_stl_path = cube_scad_path.with_suffix(".stl")
                 if levels <= 0:
@@ -623,7 +1000,9 @@ def main(argv: list[str] | None = None):
                     cube_stl_path.unlink(missing_ok=True)
 
     if args.colors == 1:
-        scad_text = generate_scad_monthly(counts, months_per_row=args.months_per_row)
+        scad_text = generate_scad_monthly(
+            counts, months_per_row=args.months_per_row, **monthly_scale_kwargs
+        )
         output_path.parent.mkdir(parents=True, exist_ok=True)
         output_path.write_text(scad_text)
         print(f"Wrote {output_path}")
@@ -657,7 +1036,7 @@ def main(argv: list[str] | None = None):
         output_path.unlink(missing_ok=True)
         MetadataWriter.unlink_for(output_path)
         level_scads = generate_scad_monthly_levels(
-            counts, months_per_row=args.months_per_row
+            counts, months_per_row=args.months_per_row, **monthly_scale_kwargs
         )
         color_groups = min(args.colors, 4) if args.colors > 1 else 1
         grouped, level_mapping = group_scad_levels_with_mapping(
@@ -0,0 +1,87 @@
+"""``gitshelves ingest``: merge GH Archive dumps into a contribution store."""
+
+from __future__ import annotations
+
+import argparse
+from ..core.archive import ingest_archives, open_contribution_store
+from ..core.team import read_logins
+
+__all__ = ["main"]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="gitshelves ingest",
+        description=(
+            "Stream GH Archive event dumps (*.json.gz) and merge per-user daily "
+            "counts into a contribution store readable with --contribution-store"
+        ),
+    )
+    parser.add_argument(
+        "archives", nargs="+", help="Archive files or directories to scan"
+    )
+    parser.add_argument(
+        "--store",
+        required=True,
+        help=(
+            "Directory holding the per-user store, or a .db/.sqlite file for the "
+            "SQLite store"
+        ),
+    )
+    parser.add_argument(
+        "--actor",
+        action="append",
+        default=[],
+        help="GitHub login to keep (repeatable)",
+    )
+    parser.add_argument(
+        "--actors-file", help="File with one GitHub login per line to keep"
+    )
+    parser.add_argument(
+        "--event-type",
+        action="append",
+        help=(
+            "Count every event of this type (repeatable); defaults to opened "
+            "issues and pull requests, matching the Search API"
+        ),
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Worker processes (default: CPUs)"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help=(
+            "Re-read archives the store has already ingested and replace the "
+            "actors' stored counts with the recomputed totals"
+        ),
+    )
+    args = parser.parse_args(argv)
+
+    actors = list(args.actor)
+    if args.actors_file:
+        try:
+            actors.extend(read_logins(args.actors_file))
+        except (OSError, UnicodeDecodeError) as exc:
+            parser.error(f"--actors-file could not be read: {exc}")
+    if not actors:
+        parser.error("pass at least one --actor or an --actors-file")
+    if args.workers is not None and args.workers <= 0:
+        parser.error("--workers must be positive")
+
+    try:
+        report = ingest_archives(
+            args.archives,
+            open_contribution_store(args.store),
+            actors,
+            event_types=args.event_type,
+            max_workers=args.workers,
+            force=args.force,
+        )
+    except FileNotFoundError as exc:
+        parser.error(str(exc))
+    print(
+        f"Ingested {report.events} events for {report.users} users from "
+        f"{report.files} archives ({report.skipped} already ingested)"
+    )
+    return 0
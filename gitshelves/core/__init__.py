@@ -2,24 +2,79 @@
 
 from __future__ import annotations
 
+from .archive import ContributionStore, ingest_archives, open_contribution_store
+from .cache import SearchCache
 from .contributions import build_contribution_maps, DailyKey, MonthlyKey
+from .grid import ContributionGrid
+from .instrumentation import FetchMetrics, FetchStats
+from .localgit import fetch_local_contributions
+from .memory import ContributionCache
 from .metadata import MetadataWriter
+from .ratelimit import RateLimiter, TokenPool
+from .singleflight import SingleFlight
+from .sqlstore import SQLiteContributionStore
+from .team import load_member_grids, member_breakdowns, read_logins
+from .transport import Cassette, RecordingTransport, ReplayTransport
+from .watermark import WatermarkStore, refresh_contribution_maps
+from .workers import WorkerBudget
 from .github import (
     GITHUB_API,
+    SEARCH_SOURCES,
     TOKEN_FALLBACK_ORDER,
+    SearchSource,
     determine_year_range,
+    fetch_contribution_days,
+    fetch_metrics,
     fetch_user_contributions,
+    fetch_user_contributions_async,
+    invalidate_user_cache,
+    iter_contribution_pages_async,
     resolve_token,
+    resolve_tokens,
+    set_transport,
+    use_transport,
 )
 
 __all__ = [
     "GITHUB_API",
+    "SEARCH_SOURCES",
     "TOKEN_FALLBACK_ORDER",
+    "Cassette",
+    "ContributionCache",
+    "ContributionGrid",
+    "ContributionStore",
     "DailyKey",
+    "FetchMetrics",
+    "FetchStats",
     "MonthlyKey",
     "MetadataWriter",
+    "RateLimiter",
+    "RecordingTransport",
+    "ReplayTransport",
+    "TokenPool",
+    "WatermarkStore",
+    "WorkerBudget",
+    "SearchCache",
+    "SearchSource",
+    "SingleFlight",
+    "SQLiteContributionStore",
     "build_contribution_maps",
     "determine_year_range",
+    "fetch_contribution_days",
+    "fetch_local_contributions",
+    "fetch_metrics",
     "fetch_user_contributions",
+    "fetch_user_contributions_async",
+    "ingest_archives",
+    "invalidate_user_cache",
+    "load_member_grids",
+    "iter_contribution_pages_async",
+    "member_breakdowns",
+    "open_contribution_store",
+    "read_logins",
+    "refresh_contribution_maps",
     "resolve_token",
+    "resolve_tokens",
+    "set_transport",
+    "use_transport",
 ]
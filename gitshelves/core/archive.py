@@ -0,0 +1,422 @@
+"""Bulk ingestion of GH Archive event dumps into a per-user contribution store.
+
+GH Archive publishes one gzipped NDJSON file per hour, each line holding a
+public GitHub event. :func:`ingest_archives` streams those files on a process
+pool, keeps the events of the requested actors and merges their daily counts
+into a :class:`ContributionStore`, which the CLI can read instead of calling
+the Search API.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Callable, Collection, Dict, Iterable, List, Mapping
+
+from .contributions import ContributionAggregator, DailyKey, MonthlyKey
+from .github import determine_year_range
+from .sqlstore import SQLITE_SUFFIXES, SQLiteContributionStore
+
+STORE_VERSION = 1
+ARCHIVE_SUFFIX = ".json.gz"
+# Match the Search API's ``author:`` query, which counts opened issues and PRs.
+DEFAULT_EVENT_TYPES = frozenset({"IssuesEvent", "PullRequestEvent"})
+_OPENED_ACTIONS = frozenset({"opened"})
+_MANIFEST_NAME = "_ingested.json"
+_JOURNAL_NAME = "_pending.json"
+_ACTOR_MARKER = '"actor":{'
+_LOGIN_MARKER = '"login":"'
+
+__all__ = [
+    "ARCHIVE_SUFFIX",
+    "DEFAULT_EVENT_TYPES",
+    "ContributionStore",
+    "IngestReport",
+    "contribution_maps_from_store",
+    "discover_archives",
+    "ingest_archives",
+    "open_contribution_store",
+    "scan_archive",
+]
+
+
+def _actor_login(line: str) -> str | None:
+    """Return the actor login from a raw event line without parsing JSON.
+
+    GH Archive emits compact JSON with ``actor`` before ``payload``, so the
+    first ``"login"`` after ``"actor":{`` belongs to the actor. Lines in any
+    other layout return ``None`` and are parsed in full instead.
+    """
+
+    start = line.find(_ACTOR_MARKER)
+    if start < 0:
+        return None
+    start = line.find(_LOGIN_MARKER, start)
+    if start < 0:
+        return None
+    start += len(_LOGIN_MARKER)
+    end = line.find('"', start)
+    return line[start:end] if end > start else None
+
+
+def _counts_event(event: Dict, event_types: Collection[str] | None) -> bool:
+    kind = event.get("type")
+    if event_types is not None:
+        return kind in event_types
+    if kind not in DEFAULT_EVENT_TYPES:
+        return False
+    payload = event.get("payload") or {}
+    return payload.get("action") in _OPENED_ACTIONS
+
+
+def scan_archive(
+    path: Path | str,
+    actors: Collection[str] | None = None,
+    event_types: Collection[str] | None = None,
+) -> Dict[str, Dict[DailyKey, int]]:
+    """Return daily event counts per lower-cased actor login in one dump.
+
+    ``actors`` (case-insensitive) limits the scan; lines from other actors
+    are skipped before JSON decoding, which is where most of the time would
+    otherwise go. By default opened issues and pull requests are counted;
+    pass ``event_types`` to count every event of those types instead.
+    Malformed lines are ignored.
+    """
+
+    wanted = {actor.lower() for actor in actors} if actors is not None else None
+    counts: Dict[str, Counter] = {}
+    with gzip.open(path, "rt", encoding="utf-8") as handle:
+        for line in handle:
+            login = _actor_login(line)
+            if wanted is not None and login is not None and login.lower() not in wanted:
+                continue
+            try:
+                event = json.loads(line)
+                login = event["actor"]["login"].lower()
+                created_at = event["created_at"]
+                day = date.fromisoformat(created_at[:10])
+            except (ValueError, KeyError, TypeError, AttributeError):
+                continue
+            if wanted is not None and login not in wanted:
+                continue
+            if not _counts_event(event, event_types):
+                continue
+            counts.setdefault(login, Counter())[(day.year, day.month, day.day)] += 1
+    return {login: dict(days) for login, days in counts.items()}
+
+
+def discover_archives(paths: Iterable[Path | str]) -> List[Path]:
+    """Expand ``paths`` into sorted ``*.json.gz`` files, searching directories."""
+
+    found: set[Path] = set()
+    for path in paths:
+        path = Path(path).expanduser()
+        if path.is_dir():
+            found.update(path.rglob(f"*{ARCHIVE_SUFFIX}"))
+        elif path.is_file():
+            found.add(path)
+        else:
+            raise FileNotFoundError(f"{path} does not exist")
+    return sorted(found)
+
+
+@dataclass(slots=True)
+class ContributionStore:
+    """Persist aggregated daily counts as one JSON document per username.
+
+    A manifest records which archive files were merged so re-running an
+    ingest over a growing directory only reads the new hours. Opening a store
+    finishes any :meth:`merge_ingested` call that was interrupted after its
+    journal was written.
+    """
+
+    directory: Path
+
+    def __post_init__(self) -> None:
+        self.directory = Path(self.directory).expanduser()
+        self.recover()
+
+    def path_for(self, username: str) -> Path:
+        return self.directory / f"{username.replace(os.sep, '_').lower()}.json"
+
+    def _write(self, path: Path, payload: Dict) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(payload))
+        os.replace(tmp_path, path)
+
+    def load(self, username: str) -> Dict[DailyKey, int] | None:
+        """Return stored daily counts for ``username`` or ``None`` when absent."""
+
+        try:
+            data = json.loads(self.path_for(username).read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if data.get("version") != STORE_VERSION:
+            return None
+        try:
+            return {
+                (int(year), int(month), int(day)): int(count)
+                for year, month, day, count in data.get("daily", [])
+            }
+        except (TypeError, ValueError):
+            return None
+
+    def load_range(
+        self,
+        username: str,
+        start_year: int | None = None,
+        end_year: int | None = None,
+    ) -> Dict[DailyKey, int] | None:
+        """Return ``username``'s daily counts between the years (inclusive)."""
+
+        daily = self.load(username)
+        if daily is None:
+            return None
+        return {
+            key: count
+            for key, count in daily.items()
+            if (start_year is None or key[0] >= start_year)
+            and (end_year is None or key[0] <= end_year)
+        }
+
+    def save(self, username: str, daily: Dict[DailyKey, int]) -> Path:
+        path = self.path_for(username)
+        self._write(
+            path,
+            {
+                "version": STORE_VERSION,
+                "username": username.lower(),
+                "daily": [[*key, count] for key, count in sorted(daily.items())],
+            },
+        )
+        return path
+
+    def merge(self, username: str, daily: Dict[DailyKey, int]) -> Dict[DailyKey, int]:
+        """Add ``daily`` to the stored counts and return the merged result."""
+
+        merged = Counter(self.load(username) or {})
+        merged.update(daily)
+        result = dict(merged)
+        self.save(username, result)
+        return result
+
+    def merge_many(self, totals: Mapping[str, Mapping[DailyKey, int]]) -> None:
+        for username, daily in totals.items():
+            self.merge(username, daily)
+
+    def usernames(self) -> List[str]:
+        return sorted(
+            path.stem
+            for path in self.directory.glob("*.json")
+            if path.name not in (_MANIFEST_NAME, _JOURNAL_NAME)
+        )
+
+    def ingested(self) -> set[str]:
+        """Return the names of archive files already merged into the store."""
+
+        try:
+            data = json.loads((self.directory / _MANIFEST_NAME).read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return set()
+        return set(data.get("files", []))
+
+    def mark_ingested(self, names: Iterable[str]) -> None:
+        files = self.ingested() | set(names)
+        self._write(
+            self.directory / _MANIFEST_NAME,
+            {"version": STORE_VERSION, "files": sorted(files)},
+        )
+
+    def merge_ingested(
+        self,
+        totals: Mapping[str, Mapping[DailyKey, int]],
+        names: Iterable[str],
+        *,
+        reset: Iterable[str] = (),
+    ) -> None:
+        """Merge ``totals`` and record archive ``names`` as one atomic step.
+
+        The stored counts of the users in ``reset`` are dropped first, so
+        ``totals`` replaces them. The merged counts and the new manifest are
+        written to a journal first, then applied. A crash before the journal
+        lands leaves the store untouched; a crash after it is finished by
+        :meth:`recover`, so archives are never counted twice or marked
+        without their counts.
+        """
+
+        users: Dict[str, list] = {}
+        for username in reset:
+            if self.load(username) is not None:
+                users[username.lower()] = []
+        for username, daily in totals.items():
+            login = username.lower()
+            merged = Counter() if login in users else Counter(self.load(login) or {})
+            merged.update(daily)
+            users[login] = [[*key, count] for key, count in sorted(merged.items())]
+        self._write(
+            self.directory / _JOURNAL_NAME,
+            {
+                "version": STORE_VERSION,
+                "users": users,
+                "files": sorted(self.ingested() | set(names)),
+            },
+        )
+        self.recover()
+
+    def recover(self) -> bool:
+        """Apply a pending :meth:`merge_ingested` journal; return whether one ran.
+
+        A journal that cannot be parsed never committed and is discarded.
+        """
+
+        journal = self.directory / _JOURNAL_NAME
+        try:
+            data = json.loads(journal.read_text())
+            users = {
+                username: {
+                    (int(year), int(month), int(day)): int(count)
+                    for year, month, day, count in rows
+                }
+                for username, rows in data["users"].items()
+            }
+            files = sorted(str(name) for name in data["files"])
+        except FileNotFoundError:
+            return False
+        except (AttributeError, KeyError, TypeError, ValueError):
+            journal.unlink()
+            return False
+        for username, daily in users.items():
+            self.save(username, daily)
+        self._write(
+            self.directory / _MANIFEST_NAME,
+            {"version": STORE_VERSION, "files": files},
+        )
+        journal.unlink()
+        return True
+
+
+def open_contribution_store(
+    path: Path | str, *, create: bool = True
+) -> ContributionStore | SQLiteContributionStore:
+    """Return the store at ``path``: SQLite for ``.db``/``.sqlite`` files.
+
+    Any other path is treated as a directory of per-user JSON documents. With
+    ``create=False`` a missing store raises :class:`FileNotFoundError` instead
+    of being opened empty, so a mistyped path is not read as a store without
+    users.
+    """
+
+    path = Path(path).expanduser()
+    if not create and not path.exists():
+        raise FileNotFoundError(f"contribution store {path} does not exist")
+    if path.suffix.lower() in SQLITE_SUFFIXES:
+        return SQLiteContributionStore(path)
+    return ContributionStore(path)
+
+
+@dataclass(slots=True)
+class IngestReport:
+    """Summary of one :func:`ingest_archives` run."""
+
+    files: int
+    skipped: int
+    users: int
+    events: int
+
+
+def _scan_job(
+    args: tuple[Path, Collection[str] | None, Collection[str] | None],
+) -> Dict[str, Dict[DailyKey, int]]:
+    return scan_archive(*args)
+
+
+def ingest_archives(
+    paths: Iterable[Path | str],
+    store: ContributionStore | SQLiteContributionStore,
+    actors: Collection[str] | None = None,
+    *,
+    event_types: Collection[str] | None = None,
+    max_workers: int | None = None,
+    force: bool = False,
+) -> IngestReport:
+    """Scan GH Archive dumps in parallel and merge the counts into ``store``.
+
+    ``paths`` may name files or directories of ``*.json.gz`` dumps. Files
+    already recorded in the store's manifest are skipped unless ``force`` is
+    set, in which case every dump is re-read and the counts of ``actors``
+    (every stored user when ``actors`` is ``None``) are replaced by the
+    recomputed totals rather than added to. Dumps are fanned out across up to ``max_workers`` processes (the
+    CPU count by default) and each worker returns only compact per-actor
+    daily counts.
+    """
+
+    if max_workers is not None and max_workers < 1:
+        raise ValueError("max_workers must be positive")
+    archives = discover_archives(paths)
+    done = set() if force else store.ingested()
+    pending = [path for path in archives if path.name not in done]
+    frozen_actors = frozenset(actors) if actors is not None else None
+    frozen_types = frozenset(event_types) if event_types is not None else None
+    jobs = [(path, frozen_actors, frozen_types) for path in pending]
+
+    workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        totals = _merge_results(map(_scan_job, jobs))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            totals = _merge_results(pool.map(_scan_job, jobs))
+
+    reset: Collection[str] = ()
+    if force:
+        reset = store.usernames() if actors is None else frozen_actors
+    store.merge_ingested(totals, [path.name for path in pending], reset=reset)
+    events = sum(sum(daily.values()) for daily in totals.values())
+    return IngestReport(
+        files=len(pending),
+        skipped=len(archives) - len(pending),
+        users=len(totals),
+        events=events,
+    )
+
+
+def _merge_results(
+    results: Iterable[Dict[str, Dict[DailyKey, int]]],
+) -> Dict[str, Counter]:
+    totals: Dict[str, Counter] = {}
+    for result in results:
+        for login, daily in result.items():
+            totals.setdefault(login, Counter()).update(daily)
+    return totals
+
+
+def contribution_maps_from_store(
+    store: ContributionStore | SQLiteContributionStore,
+    username: str,
+    start_year: int | None = None,
+    end_year: int | None = None,
+    *,
+    determine_range: Callable[
+        [int | None, int | None], tuple[int, int]
+    ] = determine_year_range,
+) -> tuple[int, int, Dict[MonthlyKey, int], Dict[DailyKey, int]]:
+    """Return contribution maps for ``username`` from ingested counts.
+
+    Users missing from the store yield empty maps. The return value matches
+    :func:`~gitshelves.core.contributions.build_contribution_maps`.
+    """
+
+    start_year, end_year = determine_range(start_year, end_year)
+    aggregator = ContributionAggregator()
+    daily = store.load_range(username, start_year, end_year) or {}
+    for (year, month, day), count in daily.items():
+        aggregator.monthly[(year, month)] += count
+        aggregator.daily[(year, month, day)] += count
+    monthly, daily = aggregator.maps(start_year, end_year)
+    return start_year, end_year, monthly, daily
@@ -0,0 +1,231 @@
+"""Persistent on-disk cache for GitHub search responses."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List
+
+CACHE_VERSION = 1
+
+__all__ = [
+    "CACHE_VERSION",
+    "CachedPage",
+    "CacheEntry",
+    "SearchCache",
+]
+
+
+def _token_fingerprint(token: str | None) -> str | None:
+    """Return a short, non-reversible fingerprint for ``token``."""
+
+    if not token:
+        return None
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass(slots=True)
+class CachedPage:
+    """A single search API page together with its validators."""
+
+    items: List[Dict[str, Any]]
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "items": self.items,
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "CachedPage":
+        return cls(
+            items=list(data.get("items", [])),
+            etag=data.get("etag"),
+            last_modified=data.get("last_modified"),
+        )
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    """Cached pages for one ``username`` and date window."""
+
+    username: str
+    start: str
+    end: str
+    pages: List[CachedPage]
+    fetched_at: float
+    auth: str | None = None
+    validated_at: float = field(default=0.0)
+    namespace: str | None = None
+
+    def __post_init__(self) -> None:
+        if not self.validated_at:
+            self.validated_at = self.fetched_at
+
+    @property
+    def items(self) -> List[Dict[str, Any]]:
+        return [item for page in self.pages for item in page.items]
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Return ``If-None-Match``/``If-Modified-Since`` headers for page one."""
+
+        if not self.pages:
+            return {}
+        first = self.pages[0]
+        headers: Dict[str, str] = {}
+        if first.etag:
+            headers["If-None-Match"] = first.etag
+        if first.last_modified:
+            headers["If-Modified-Since"] = first.last_modified
+        return headers
+
+    def is_fresh(self, ttl: float | None, *, now: float | None = None) -> bool:
+        """Return ``True`` when the entry was validated within ``ttl`` seconds."""
+
+        if ttl is None or ttl <= 0:
+            return False
+        current = time.time() if now is None else now
+        return current - self.validated_at < ttl
+
+    def is_settled(self) -> bool:
+        """Return ``True`` when the entry was validated after its window ended.
+
+        Contributions in closed windows (for example past calendar years)
+        practically never change, so settled entries are reused without
+        revalidation until an explicit refresh.
+        """
+
+        closed_at = datetime.fromisoformat(self.end).replace(tzinfo=UTC) + timedelta(
+            days=1
+        )
+        return self.validated_at >= closed_at.timestamp()
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "version": CACHE_VERSION,
+            "username": self.username,
+            "window": [self.start, self.end],
+            "auth": self.auth,
+            "fetched_at": self.fetched_at,
+            "validated_at": self.validated_at,
+            "pages": [page.to_json() for page in self.pages],
+            "namespace": self.namespace,
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "CacheEntry":
+        start, end = data["window"]
+        return cls(
+            username=data["username"],
+            start=start,
+            end=end,
+            pages=[CachedPage.from_json(page) for page in data.get("pages", [])],
+            fetched_at=float(data.get("fetched_at", 0.0)),
+            auth=data.get("auth"),
+            validated_at=float(data.get("validated_at", 0.0)),
+            namespace=data.get("namespace"),
+        )
+
+
+@dataclass(slots=True)
+class SearchCache:
+    """Store raw search pages on disk keyed by username and date window.
+
+    Entries live at ``<directory>/<username>/<start>_<end>.json``. Each entry
+    keeps the page validators so callers can revalidate with
+    ``If-None-Match``; an unchanged result then costs a single ``304`` response,
+    which GitHub does not count against the rate limit. ``ttl`` (seconds) skips
+    revalidation entirely while an entry is younger than the limit.
+    """
+
+    directory: Path
+    ttl: float | None = None
+
+    def __post_init__(self) -> None:
+        self.directory = Path(self.directory).expanduser()
+
+    def path_for(
+        self, username: str, start: str, end: str, namespace: str | None = None
+    ) -> Path:
+        safe_user = username.replace(os.sep, "_").lower()
+        directory = self.directory / safe_user
+        if namespace:
+            directory /= namespace
+        return directory / f"{start}_{end}.json"
+
+    def load(
+        self,
+        username: str,
+        start: str,
+        end: str,
+        *,
+        token: str | None = None,
+        namespace: str | None = None,
+    ) -> CacheEntry | None:
+        """Return the cached entry, or ``None`` when missing or unusable.
+
+        ``namespace`` separates query families (such as commit searches) that
+        share a username and window.
+        """
+
+        path = self.path_for(username, start, end, namespace)
+        try:
+            data = json.loads(path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if data.get("version") != CACHE_VERSION:
+            return None
+        try:
+            entry = CacheEntry.from_json(data)
+        except (KeyError, TypeError, ValueError):
+            return None
+        if entry.auth != _token_fingerprint(token):
+            return None
+        return entry
+
+    def store(
+        self,
+        username: str,
+        start: str,
+        end: str,
+        pages: List[CachedPage],
+        *,
+        token: str | None = None,
+        namespace: str | None = None,
+    ) -> CacheEntry:
+        """Persist ``pages`` and return the written entry."""
+
+        now = time.time()
+        entry = CacheEntry(
+            username=username,
+            start=start,
+            end=end,
+            pages=pages,
+            fetched_at=now,
+            auth=_token_fingerprint(token),
+            validated_at=now,
+            namespace=namespace,
+        )
+        self._write(entry)
+        return entry
+
+    def touch(self, entry: CacheEntry) -> None:
+        """Record a successful revalidation of ``entry``."""
+
+        entry.validated_at = time.time()
+        self._write(entry)
+
+    def _write(self, entry: CacheEntry) -> None:
+        path = self.path_for(entry.username, entry.start, entry.end, entry.namespace)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(entry.to_json()))
+        os.replace(tmp_path, path)
@@ -2,19 +2,36 @@
 
 from __future__ import annotations
 
+import calendar
+import math
+from array import array
 from collections import Counter
-from datetime import datetime
-from typing import Callable, Dict, Iterable, Tuple
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, Mapping, Sequence, Tuple
 
+from . import vectorized as _vectorized
+from .events import date_from_epoch_day
 from .github import determine_year_range
+from .grid import ContributionGrid, DailyView, MonthlyView
 
 MonthlyKey = Tuple[int, int]
 DailyKey = Tuple[int, int, int]
+WeeklyKey = Tuple[int, int]
+STATS_PERCENTILES = (50, 75, 90, 99)
+"""Percentiles of active-day counts reported by :class:`ContributionStats`."""
 
 __all__ = [
     "MonthlyKey",
     "DailyKey",
+    "STATS_PERCENTILES",
+    "WeeklyKey",
+    "ContributionAggregator",
+    "ContributionDelta",
+    "ContributionRollup",
+    "ContributionStats",
     "build_contribution_maps",
+    "rollup_contributions",
 ]
 
 
@@ -24,36 +41,524 @@ def _normalise_timestamp(value: str) -> datetime:
     return datetime.fromisoformat(value[:10])
 
 
+@dataclass(frozen=True, slots=True)
+class ContributionDelta:
+    """Months and days whose counts changed, from :meth:`ContributionAggregator.pop_changes`."""
+
+    months: frozenset[MonthlyKey] = frozenset()
+    days: frozenset[DailyKey] = frozenset()
+
+    def __bool__(self) -> bool:
+        return bool(self.months or self.days)
+
+    @property
+    def years(self) -> frozenset[int]:
+        return frozenset(year for year, _month in self.months)
+
+
+def _bump_counter(counter: Counter, key, count: int) -> None:
+    """Add ``count`` to ``counter[key]``, dropping the key once it reaches zero."""
+
+    value = counter[key] + count
+    if value:
+        counter[key] = value
+    else:
+        del counter[key]
+
+
+class ContributionAggregator:
+    """Incrementally count contribution events by month and day.
+
+    Events are reduced to counter bumps as they arrive, so callers can feed a
+    stream of search items and drop each one once it has been counted. Items
+    carrying a ``source`` key (see ``fetch_user_contributions(sources=...)``)
+    are also counted per source.
+
+    Counts are updated in place, so :meth:`retract` undoes earlier events in
+    time proportional to the retraction. The months and days touched since
+    the last :meth:`pop_changes` are tracked, letting callers re-render only
+    the affected artifacts.
+    """
+
+    __slots__ = (
+        "monthly",
+        "daily",
+        "monthly_sources",
+        "daily_sources",
+        "_changed_months",
+        "_changed_days",
+    )
+
+    def __init__(self) -> None:
+        self.monthly: Counter = Counter()
+        self.daily: Counter = Counter()
+        self.monthly_sources: Dict[MonthlyKey, Counter] = {}
+        self.daily_sources: Dict[DailyKey, Counter] = {}
+        self._changed_months: set[MonthlyKey] = set()
+        self._changed_days: set[DailyKey] = set()
+
+    @staticmethod
+    def _item_day(item: Dict) -> DailyKey | None:
+        created_at = item.get("created_at")
+        if not created_at:
+            return None
+        try:
+            dt = _normalise_timestamp(created_at)
+        except ValueError:
+            return None
+        return dt.year, dt.month, dt.day
+
+    def _bump(self, day_key: DailyKey, count: int, source: str | None) -> None:
+        month_key = day_key[:2]
+        _bump_counter(self.monthly, month_key, count)
+        _bump_counter(self.daily, day_key, count)
+        if source:
+            for counters, key in (
+                (self.monthly_sources, month_key),
+                (self.daily_sources, day_key),
+            ):
+                counter = counters.setdefault(key, Counter())
+                _bump_counter(counter, source, count)
+                if not counter:
+                    del counters[key]
+        self._changed_months.add(month_key)
+        self._changed_days.add(day_key)
+
+    def add(self, item: Dict) -> bool:
+        """Count ``item``; return ``False`` when it has no usable timestamp."""
+
+        day_key = self._item_day(item)
+        if day_key is None:
+            return False
+        source = item.get("source")
+        if source:
+            self._bump(day_key, 1, source)
+            return True
+        # Additions never empty a counter, so the common path skips _bump.
+        month_key = day_key[:2]
+        self.monthly[month_key] += 1
+        self.daily[day_key] += 1
+        self._changed_months.add(month_key)
+        self._changed_days.add(day_key)
+        return True
+
+    def _check_removable(
+        self, day_key: DailyKey, source: str | None, count: int
+    ) -> None:
+        """Raise ``ValueError`` unless ``count`` items can leave ``day_key``.
+
+        Sourced items are drawn from that source's count and sourceless ones
+        from the part of the day no source accounts for.
+        """
+
+        sources = self.daily_sources.get(day_key, {})
+        if source:
+            available = sources.get(source, 0)
+        else:
+            available = self.daily.get(day_key, 0) - sum(sources.values())
+        if available < count:
+            raise ValueError(f"no contribution on {day_key} to retract")
+
+    def remove(self, item: Dict) -> bool:
+        """Retract one previously counted ``item``.
+
+        Returns ``False`` when it has no usable timestamp and raises
+        ``ValueError`` when nothing matching it was counted on its day,
+        leaving every count untouched.
+        """
+
+        day_key = self._item_day(item)
+        if day_key is None:
+            return False
+        source = item.get("source") or None
+        self._check_removable(day_key, source, 1)
+        self._bump(day_key, -1, source)
+        return True
+
+    def retract(self, items: Iterable[Dict]) -> int:
+        """Retract every item in ``items`` and return how many were removed.
+
+        The whole batch is checked before any count changes, so a
+        ``ValueError`` leaves the aggregator as it was.
+        """
+
+        wanted: Counter = Counter()
+        for item in items:
+            day_key = self._item_day(item)
+            if day_key is not None:
+                wanted[day_key, item.get("source") or None] += 1
+        for (day_key, source), count in wanted.items():
+            self._check_removable(day_key, source, count)
+        for (day_key, source), count in wanted.items():
+            self._bump(day_key, -count, source)
+        return sum(wanted.values())
+
+    def pop_changes(self) -> ContributionDelta:
+        """Return the months and days changed since the last call and reset them."""
+
+        delta = ContributionDelta(
+            frozenset(self._changed_months), frozenset(self._changed_days)
+        )
+        self._changed_months.clear()
+        self._changed_days.clear()
+        return delta
+
+    def apply(
+        self, added: Iterable[Dict] = (), removed: Iterable[Dict] = ()
+    ) -> ContributionDelta:
+        """Count ``added``, retract ``removed`` and return what they changed.
+
+        Changes recorded before the call are included in the result.
+        """
+
+        self.update(added)
+        self.retract(removed)
+        return self.pop_changes()
+
+    def update(self, items: Iterable[Dict]) -> int:
+        """Count every item in ``items`` and return how many were usable."""
+
+        added = 0
+        for item in items:
+            added += self.add(item)
+        return added
+
+    def update_batch(self, items: Sequence[Dict]) -> int:
+        """Count ``items`` with NumPy; the result matches :meth:`update`.
+
+        Timestamps are parsed and binned as arrays (see
+        :mod:`gitshelves.core.vectorized`). Raises ``RuntimeError`` when
+        NumPy is not installed.
+        """
+
+        _vectorized.require_numpy()
+        days, kept = _vectorized.parse_epoch_days(
+            [item.get("created_at") for item in items], _normalise_timestamp
+        )
+        self._merge_bins(self.monthly, self.daily, days)
+        by_source: Dict[str, list] = {}
+        for position in kept.tolist():
+            source = items[position].get("source")
+            if source:
+                by_source.setdefault(source, []).append(position)
+        if by_source:
+            index = _vectorized.np.full(len(items), -1, dtype=_vectorized.np.int64)
+            index[kept] = _vectorized.np.arange(len(kept))
+            for source, positions in by_source.items():
+                monthly, daily = _vectorized.bin_epoch_days(days[index[positions]])
+                for key, count in monthly.items():
+                    self.monthly_sources.setdefault(key, Counter())[source] += count
+                for key, count in daily.items():
+                    self.daily_sources.setdefault(key, Counter())[source] += count
+        return len(days)
+
+    def _merge_bins(self, monthly: Counter, daily: Counter, days) -> None:
+        binned_monthly, binned_daily = _vectorized.bin_epoch_days(days)
+        monthly.update(binned_monthly)
+        daily.update(binned_daily)
+        self._changed_months.update(binned_monthly)
+        self._changed_days.update(binned_daily)
+
+    def update_days(self, days: Iterable[int], *, vectorize: bool = False) -> int:
+        """Count packed epoch ``days`` and return how many were added.
+
+        With ``vectorize`` the days are binned with NumPy instead.
+        """
+
+        if vectorize:
+            _vectorized.require_numpy()
+            packed = _vectorized.np.asarray(days, dtype=_vectorized.np.int64)
+            self._merge_bins(self.monthly, self.daily, packed)
+            return len(packed)
+        added = 0
+        for day, count in Counter(days).items():
+            dt = date_from_epoch_day(day)
+            self._bump((dt.year, dt.month, dt.day), count, None)
+            added += count
+        return added
+
+    def maps(
+        self, start_year: int, end_year: int
+    ) -> tuple[Dict[MonthlyKey, int], Dict[DailyKey, int]]:
+        """Return monthly counts expanded over the range and the daily counts."""
+
+        expanded_monthly: Dict[MonthlyKey, int] = {
+            (year, month): self.monthly.get((year, month), 0)
+            for year in range(start_year, end_year + 1)
+            for month in range(1, 13)
+        }
+        return expanded_monthly, dict(self.daily)
+
+    def grid(self, start_year: int, end_year: int) -> ContributionGrid:
+        """Return the counts within the range as a dense :class:`ContributionGrid`."""
+
+        return ContributionGrid.from_maps(
+            start_year, end_year, self.monthly, self.daily
+        )
+
+    def rollup(self, start_year: int, end_year: int) -> "ContributionRollup":
+        """Return :func:`rollup_contributions` for :meth:`grid` over the range."""
+
+        return rollup_contributions(self.grid(start_year, end_year))
+
+    def source_maps(
+        self, start_year: int, end_year: int
+    ) -> tuple[Dict[MonthlyKey, Dict[str, int]], Dict[DailyKey, Dict[str, int]]]:
+        """Return per-source counts keyed like :meth:`maps`, within the range."""
+
+        monthly = {
+            key: dict(counts)
+            for key, counts in sorted(self.monthly_sources.items())
+            if start_year <= key[0] <= end_year
+        }
+        daily = {
+            key: dict(counts)
+            for key, counts in sorted(self.daily_sources.items())
+            if start_year <= key[0] <= end_year
+        }
+        return monthly, daily
+
+
 def build_contribution_maps(
-    items: Iterable[Dict],
+    items: Iterable[Dict] | array | memoryview,
     start_year: int | None,
     end_year: int | None,
     *,
     determine_range: Callable[
         [int | None, int | None], tuple[int, int]
     ] = determine_year_range,
+    aggregator: ContributionAggregator | None = None,
+    vectorize: bool | None = None,
 ) -> tuple[int, int, Dict[MonthlyKey, int], Dict[DailyKey, int]]:
-    """Aggregate raw GitHub events into monthly and daily contribution maps."""
+    """Aggregate raw GitHub events into monthly and daily contribution maps.
+
+    ``items`` may be any iterable, including the generator returned by
+    :func:`~gitshelves.core.github.iter_user_contributions`, or the packed
+    epoch days returned by
+    :func:`~gitshelves.core.github.fetch_contribution_days`. Pass an
+    ``aggregator`` to read further views, such as
+    :meth:`ContributionAggregator.source_maps`, after the single pass.
+
+    ``vectorize`` selects the NumPy path, which parses and bins timestamps as
+    arrays and returns the same maps. By default it is used for lists,
+    tuples and packed days of at least
+    :data:`~gitshelves.core.vectorized.VECTORIZE_THRESHOLD` items when NumPy
+    is installed; iterators stay on the pure-Python path so streams are never
+    buffered. ``True`` forces it (materialising iterators) and raises
+    ``RuntimeError`` without NumPy; ``False`` disables it.
+    """
 
     start_year, end_year = determine_range(start_year, end_year)
-    monthly = Counter()
-    daily = Counter()
+    if aggregator is None:
+        aggregator = ContributionAggregator()
+    if vectorize is None:
+        vectorize = (
+            _vectorized.HAVE_NUMPY
+            and isinstance(items, (list, tuple, array, memoryview))
+            and len(items) >= _vectorized.VECTORIZE_THRESHOLD
+        )
+    elif vectorize:
+        _vectorized.require_numpy()
+    if isinstance(items, (array, memoryview)):
+        aggregator.update_days(items, vectorize=vectorize)
+    elif vectorize:
+        aggregator.update_batch(items if isinstance(items, Sequence) else list(items))
+    else:
+        aggregator.update(items)
+    monthly, daily = aggregator.maps(start_year, end_year)
+    return start_year, end_year, monthly, daily
 
-    for item in items:
-        created_at = item.get("created_at")
-        if not created_at:
-            continue
-        try:
-            dt = _normalise_timestamp(created_at)
-        except ValueError:
-            continue
-        monthly[(dt.year, dt.month)] += 1
-        daily[(dt.year, dt.month, dt.day)] += 1
 
-    expanded_monthly: Dict[MonthlyKey, int] = {
-        (year, month): monthly.get((year, month), 0)
-        for year in range(start_year, end_year + 1)
-        for month in range(1, 13)
-    }
+@dataclass(frozen=True, slots=True)
+class ContributionStats:
+    """Summary of a span of days, produced by :func:`rollup_contributions`.
+
+    Streaks count consecutive days with at least one contribution; ties for
+    the longest streak and the busiest day or month keep the earliest.
+    ``percentiles`` maps each of :data:`STATS_PERCENTILES` to the
+    nearest-rank percentile of the non-zero daily counts.
+    """
+
+    total: int = 0
+    active_days: int = 0
+    longest_streak: int = 0
+    longest_streak_start: date | None = None
+    longest_streak_end: date | None = None
+    busiest_day: date | None = None
+    busiest_day_count: int = 0
+    busiest_month: MonthlyKey | None = None
+    busiest_month_count: int = 0
+    percentiles: Mapping[int, int] = field(default_factory=dict)
+
+    def to_json(self) -> dict[str, Any]:
+        def iso(value: date | None) -> str | None:
+            return value.isoformat() if value is not None else None
+
+        month = self.busiest_month
+        return {
+            "total": self.total,
+            "active_days": self.active_days,
+            "longest_streak": {
+                "days": self.longest_streak,
+                "start": iso(self.longest_streak_start),
+                "end": iso(self.longest_streak_end),
+            },
+            "busiest_day": {
+                "date": iso(self.busiest_day),
+                "count": self.busiest_day_count,
+            },
+            "busiest_month": {
+                "year": month[0] if month else None,
+                "month": month[1] if month else None,
+                "count": self.busiest_month_count,
+            },
+            "percentiles": {f"p{p}": value for p, value in self.percentiles.items()},
+        }
+
+
+class _StatsAccumulator:
+    """Running :class:`ContributionStats` fed one day (by ordinal) at a time."""
+
+    __slots__ = (
+        "total",
+        "active",
+        "run",
+        "run_start",
+        "best",
+        "best_start",
+        "best_end",
+        "busiest",
+        "busiest_count",
+        "busiest_month",
+        "busiest_month_count",
+        "histogram",
+    )
+
+    def __init__(self) -> None:
+        self.total = self.active = self.run = self.best = 0
+        self.run_start = self.best_start = self.best_end = self.busiest = 0
+        self.busiest_count = self.busiest_month_count = 0
+        self.busiest_month: MonthlyKey | None = None
+        self.histogram: Counter = Counter()
+
+    def day(self, ordinal: int, count: int) -> None:
+        if not count:
+            self.run = 0
+            return
+        self.total += count
+        self.active += 1
+        self.histogram[count] += 1
+        if not self.run:
+            self.run_start = ordinal
+        self.run += 1
+        if self.run > self.best:
+            self.best, self.best_start, self.best_end = (
+                self.run,
+                self.run_start,
+                ordinal,
+            )
+        if count > self.busiest_count:
+            self.busiest, self.busiest_count = ordinal, count
+
+    def month(self, key: MonthlyKey, count: int) -> None:
+        if count > self.busiest_month_count:
+            self.busiest_month, self.busiest_month_count = key, count
+
+    def finish(self) -> ContributionStats:
+        if not self.active:
+            return ContributionStats(
+                busiest_month=self.busiest_month,
+                busiest_month_count=self.busiest_month_count,
+            )
+        percentiles = {}
+        ranks = sorted((math.ceil(p / 100 * self.active), p) for p in STATS_PERCENTILES)
+        seen = 0
+        for value, days in sorted(self.histogram.items()):
+            seen += days
+            while ranks and ranks[0][0] <= seen:
+                percentiles[ranks.pop(0)[1]] = value
+        return ContributionStats(
+            total=self.total,
+            active_days=self.active,
+            longest_streak=self.best,
+            longest_streak_start=date.fromordinal(self.best_start),
+            longest_streak_end=date.fromordinal(self.best_end),
+            busiest_day=date.fromordinal(self.busiest),
+            busiest_day_count=self.busiest_count,
+            busiest_month=self.busiest_month,
+            busiest_month_count=self.busiest_month_count,
+            percentiles=dict(sorted(percentiles.items())),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ContributionRollup:
+    """Every resolution of a grid's counts plus overall and per-year stats.
+
+    ``weekly`` is keyed by ISO ``(year, week)`` and covers every week that
+    overlaps the grid, counting only days inside it, so the first and last
+    weeks can be partial. ``monthly`` and ``daily`` are the grid's views.
+    """
+
+    grid: ContributionGrid
+    weekly: Dict[WeeklyKey, int]
+    yearly: Dict[int, int]
+    stats: ContributionStats
+    year_stats: Dict[int, ContributionStats]
+
+    @property
+    def monthly(self) -> MonthlyView:
+        return self.grid.monthly
+
+    @property
+    def daily(self) -> DailyView:
+        return self.grid.daily
+
+
+def rollup_contributions(grid: ContributionGrid) -> ContributionRollup:
+    """Bucket ``grid`` by ISO week and year and summarise it in a single pass.
+
+    The dense day array is walked once, in order, feeding the weekly buckets
+    and the overall and per-year :class:`ContributionStats` together, so the
+    metadata and README writers never rescan the counts. Monthly and yearly
+    totals are read from the grid's month array as each month is passed.
+    """
 
-    return start_year, end_year, expanded_monthly, dict(daily)
+    overall = _StatsAccumulator()
+    weekly: Dict[WeeklyKey, int] = {}
+    yearly: Dict[int, int] = {}
+    year_stats: Dict[int, ContributionStats] = {}
+    ordinal = date(grid.start_year, 1, 1).toordinal()
+    iso_year, week, weekday = date.fromordinal(ordinal).isocalendar()
+    week_key, week_total = (iso_year, week), 0
+    for year in range(grid.start_year, grid.end_year + 1):
+        per_year = _StatsAccumulator()
+        days = grid.year_days(year)
+        month_counts = grid.year_months(year)
+        position = 0
+        for month in range(1, 13):
+            length = calendar.monthrange(year, month)[1]
+            for count in days[position : position + length]:
+                if weekday > 7:
+                    weekly[week_key] = weekly.get(week_key, 0) + week_total
+                    week_key = tuple(date.fromordinal(ordinal).isocalendar()[:2])
+                    weekday, week_total = 1, 0
+                week_total += count
+                overall.day(ordinal, count)
+                per_year.day(ordinal, count)
+                ordinal += 1
+                weekday += 1
+            position += length
+            month_count = month_counts[month - 1]
+            overall.month((year, month), month_count)
+            per_year.month((year, month), month_count)
+        yearly[year] = sum(month_counts)
+        year_stats[year] = per_year.finish()
+    weekly[week_key] = weekly.get(week_key, 0) + week_total
+    return ContributionRollup(
+        grid=grid,
+        weekly=weekly,
+        yearly=yearly,
+        stats=overall.finish(),
+        year_stats=year_stats,
+    )
@@ -0,0 +1,58 @@
+"""Compact representations of contribution events."""
+
+from __future__ import annotations
+
+from array import array
+from datetime import date
+from typing import Dict, Iterable
+
+EPOCH = date(1970, 1, 1)
+EPOCH_ORDINAL = EPOCH.toordinal()
+EPOCH_DAY_TYPECODE = "I"
+
+__all__ = [
+    "EPOCH",
+    "EPOCH_DAY_TYPECODE",
+    "date_from_epoch_day",
+    "epoch_day",
+    "pack_event_days",
+]
+
+
+def epoch_day(created_at: str) -> int:
+    """Return the number of days between 1970-01-01 and ``created_at``.
+
+    Only the ``YYYY-MM-DD`` prefix is read. Raises ``ValueError`` for
+    malformed or pre-epoch dates.
+    """
+
+    day = date.fromisoformat(created_at[:10]).toordinal() - EPOCH_ORDINAL
+    if day < 0:
+        raise ValueError(f"{created_at!r} predates the Unix epoch")
+    return day
+
+
+def date_from_epoch_day(day: int) -> date:
+    """Return the calendar date ``day`` days after 1970-01-01."""
+
+    return date.fromordinal(EPOCH_ORDINAL + day)
+
+
+def pack_event_days(items: Iterable[Dict]) -> array:
+    """Pack the ``created_at`` day of each item into an ``array('I')``.
+
+    Items without a parseable ``created_at`` are dropped, matching
+    :func:`~gitshelves.core.contributions.build_contribution_maps`. Each event
+    costs four bytes instead of a full search result dictionary.
+    """
+
+    days = array(EPOCH_DAY_TYPECODE)
+    for item in items:
+        created_at = item.get("created_at")
+        if not created_at:
+            continue
+        try:
+            days.append(epoch_day(created_at))
+        except ValueError:
+            continue
+    return days
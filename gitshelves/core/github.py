@@ -2,22 +2,70 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
-from datetime import UTC, datetime
-from functools import lru_cache
-from typing import Dict, Iterable, List
+from array import array
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from typing import AsyncIterator, Dict, Iterable, Iterator, List, Sequence, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from .cache import CachedPage, SearchCache
+from .events import EPOCH_DAY_TYPECODE, pack_event_days
+from .instrumentation import FetchMetrics
+from .localgit import fetch_local_contributions
+from .memory import ContributionCache
+from .ratelimit import RateLimiter, TokenPool
+from .singleflight import SingleFlight
+from .transport import Transport
+from .workers import WorkerBudget, current_budget
 
 GITHUB_API = "https://api.github.com/search/issues"
 TOKEN_FALLBACK_ORDER = ("GH_TOKEN", "GITHUB_TOKEN")
+TOKEN_POOL_ENV = "GH_TOKENS"
+DEFAULT_MAX_WORKERS = 4
+REQUEST_TIMEOUT = 10
+SEARCH_RESULT_CAP = 1000
+ASYNC_MAX_CONCURRENCY = 16
+
+Auth = Union[str, TokenPool, None]
 
 __all__ = [
     "GITHUB_API",
     "TOKEN_FALLBACK_ORDER",
+    "DEFAULT_MAX_WORKERS",
+    "SEARCH_RESULT_CAP",
+    "ContributionCache",
+    "FetchMetrics",
+    "RateLimiter",
+    "SEARCH_SOURCES",
+    "SearchSource",
+    "TOKEN_POOL_ENV",
+    "TokenPool",
+    "contribution_cache",
     "determine_year_range",
+    "fetch_contributions_since",
+    "fetch_metrics",
+    "get_transport",
+    "http_session",
+    "invalidate_user_cache",
+    "rate_limiter",
     "resolve_token",
+    "resolve_tokens",
+    "set_transport",
+    "use_transport",
+    "fetch_contribution_days",
     "fetch_user_contributions",
+    "fetch_user_contributions_async",
+    "iter_contribution_pages_async",
+    "iter_user_contributions",
 ]
 
 
@@ -33,8 +81,11 @@ def determine_year_range(
     return start, end
 
 
-def resolve_token(explicit: str | None) -> str | None:
-    """Resolve an API token using the documented fallback order."""
+def resolve_token(explicit: Auth) -> Auth:
+    """Resolve an API token using the documented fallback order.
+
+    A :class:`TokenPool` passed explicitly is returned unchanged.
+    """
 
     if explicit:
         return explicit
@@ -45,59 +96,1151 @@ def resolve_token(explicit: str | None) -> str | None:
     return None
 
 
-def _search_api(url: str, headers: dict, params: dict) -> Iterable[Dict]:
-    """Yield items across paginated GitHub search API responses."""
+def _split_tokens(text: str) -> list[str]:
+    return [token for token in text.replace(",", " ").split() if token]
+
+
+def resolve_tokens(
+    explicit: str | None = None, token_file: Path | str | None = None
+) -> list[str]:
+    """Collect every configured API token for bulk fetches.
+
+    Tokens come from ``explicit``, the comma- or whitespace-separated
+    ``GH_TOKENS`` variable, ``token_file`` (one token per line; blank lines
+    and ``#`` comments are ignored), then ``GH_TOKEN`` and ``GITHUB_TOKEN``.
+    Duplicates are dropped while preserving that order.
+    """
+
+    tokens: list[str] = []
+    if explicit:
+        tokens.append(explicit)
+    tokens.extend(_split_tokens(os.getenv(TOKEN_POOL_ENV, "")))
+    if token_file:
+        for line in Path(token_file).expanduser().read_text().splitlines():
+            line = line.split("#", 1)[0].strip()
+            if line:
+                tokens.append(line)
+    for env_var in TOKEN_FALLBACK_ORDER:
+        value = os.getenv(env_var)
+        if value:
+            tokens.append(value)
+    return list(dict.fromkeys(tokens))
+
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+_pool_size = DEFAULT_MAX_WORKERS
+_active_budgets: Dict[WorkerBudget, int] = {}
+_transport: Transport | None = None
+
+rate_limiter = RateLimiter()
+"""Scheduler shared by every fetcher in the process; replace to retune pacing."""
+
+_flights = SingleFlight()
+"""Coalesces concurrent identical fetches into one in-flight request."""
+
+contribution_cache = ContributionCache()
+"""In-memory result cache bounded by bytes; replace to change the budget."""
+
+fetch_metrics = FetchMetrics()
+"""Latency, size, retry, pagination, cache and quota metrics for every fetch."""
+
+
+def _mount_adapter(session: requests.Session, pool_size: int) -> None:
+    adapter = HTTPAdapter(pool_connections=DEFAULT_MAX_WORKERS, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+
+def http_session() -> requests.Session:
+    """Return the process-wide keep-alive session shared by all fetchers.
+
+    Each host keeps as many connections as the worker budgets that were ever
+    active at the same time add up to (see :func:`_connections_for`), so
+    concurrent fetches do not overflow the pool.
+    """
+
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            _mount_adapter(session, _pool_size)
+            _session = session
+        return _session
+
+
+@contextmanager
+def _connections_for(budget: WorkerBudget) -> Iterator[None]:
+    """Grow the connection pool to cover ``budget`` and every other active one.
+
+    Each budget is counted once however many fan-outs share it, so the pool
+    holds one connection for every thread that can be issuing a request. The
+    pool never shrinks.
+    """
+
+    global _pool_size
+    with _session_lock:
+        refs = _active_budgets.get(budget, 0)
+        _active_budgets[budget] = refs + 1
+        if not refs:
+            total = sum(active.max_workers for active in _active_budgets)
+            if total > _pool_size:
+                _pool_size = total
+                if _session is not None:
+                    _mount_adapter(_session, total)
+    try:
+        yield
+    finally:
+        with _session_lock:
+            if _active_budgets[budget] == 1:
+                del _active_budgets[budget]
+            else:
+                _active_budgets[budget] -= 1
+
+
+def get_transport() -> Transport:
+    """Return the transport used for API requests.
+
+    Defaults to :func:`http_session`; see :func:`set_transport`.
+    """
+
+    return _transport if _transport is not None else http_session()
 
-    page = 1
-    while True:
-        resp = requests.get(
-            url, headers=headers, params={**params, "page": page}, timeout=10
+
+def set_transport(transport: Transport | None) -> Transport | None:
+    """Route every API request through ``transport`` and return the previous one.
+
+    ``transport`` only needs a ``requests``-compatible ``get`` method, for
+    example :class:`~gitshelves.core.transport.ReplayTransport`. Pass ``None``
+    to restore the shared keep-alive session.
+    """
+
+    global _transport
+    with _session_lock:
+        previous, _transport = _transport, transport
+    return previous
+
+
+@contextmanager
+def use_transport(transport: Transport | None) -> Iterator[Transport | None]:
+    """Temporarily route API requests through ``transport``."""
+
+    previous = set_transport(transport)
+    try:
+        yield transport
+    finally:
+        set_transport(previous)
+
+
+def _auth_identity(auth: Auth) -> str | None:
+    """Return the string that scopes cache entries to ``auth``."""
+
+    if isinstance(auth, TokenPool):
+        return auth.identity
+    return auth
+
+
+def _get(url: str, auth: Auth, params: dict, extra_headers: dict | None = None):
+    """Issue a paced GET request through the shared session.
+
+    A plain token (or ``None``) is paced by :data:`rate_limiter`; a
+    :class:`TokenPool` picks the token with the most remaining quota for each
+    attempt. Throttled responses are retried once the limiter has waited out
+    ``Retry-After`` or the quota reset; when retries are exhausted the last
+    response is returned so callers surface the error via
+    ``raise_for_status``. Every attempt is recorded in :data:`fetch_metrics`.
+    """
+
+    retries = auth.max_retries if isinstance(auth, TokenPool) else None
+    if retries is None:
+        retries = rate_limiter.max_retries
+    attempts = max(retries, 0) + 1
+    for attempt in range(attempts):
+        queued = time.perf_counter()
+        if isinstance(auth, TokenPool):
+            token, limiter = auth.acquire()
+        else:
+            token, limiter = auth, rate_limiter
+            limiter.acquire()
+        headers = {"Authorization": f"token {token}"} if token else {}
+        if extra_headers:
+            headers.update(extra_headers)
+        started = time.perf_counter()
+        fetch_metrics.record_wait(started - queued)
+        resp = get_transport().get(
+            url, headers=headers, params=params, timeout=REQUEST_TIMEOUT
         )
+        fetch_metrics.record_response(url, resp, time.perf_counter() - started)
+        if not limiter.observe(resp):
+            break
+        if attempt + 1 < attempts:
+            fetch_metrics.record_retry()
+    return resp
+
+
+def _year_windows(start_year: int, end_year: int) -> list[tuple[str, str]]:
+    """Return one inclusive ``created:`` date window per calendar year."""
+
+    return [
+        (f"{year:04d}-01-01", f"{year:04d}-12-31")
+        for year in range(start_year, end_year + 1)
+    ]
+
+
+def _page_from_response(resp, payload: dict | None = None) -> CachedPage:
+    """Return a :class:`CachedPage` holding ``resp`` items and validators."""
+
+    if payload is None:
+        payload = resp.json()
+    return CachedPage(
+        items=list(payload.get("items", [])),
+        etag=resp.headers.get("ETag"),
+        last_modified=resp.headers.get("Last-Modified"),
+    )
+
+
+def _last_page(payload: dict, params: dict) -> int | None:
+    """Return the final reachable page number implied by ``total_count``."""
+
+    total = payload.get("total_count")
+    per_page = params.get("per_page")
+    if not isinstance(total, int) or not per_page:
+        return None
+    reachable = min(total, SEARCH_RESULT_CAP)
+    return max(1, -(-reachable // per_page))
+
+
+def _search_pages(
+    url: str,
+    auth: Auth,
+    params: dict,
+    *,
+    first_response=None,
+    max_workers: int = 1,
+) -> Iterable[CachedPage]:
+    """Yield pages across paginated GitHub search API responses.
+
+    ``first_response`` lets callers that already requested page one (for
+    example to revalidate a cache entry) continue pagination from it. Once
+    page one reports ``total_count`` the remaining pages are known, so with
+    ``max_workers > 1`` they are requested concurrently and yielded in page
+    order. Otherwise, or when ``total_count`` is missing, ``Link: next``
+    headers are followed one request at a time. The number of pages fetched
+    is recorded in :data:`fetch_metrics` once pagination stops.
+    """
+
+    def fetch_page(page: int):
+        resp = _get(url, auth, {**params, "page": page})
         resp.raise_for_status()
-        data = resp.json()
-        yield from data.get("items", [])
+        return resp
+
+    pages = 0
+    try:
+        resp = first_response if first_response is not None else fetch_page(1)
+        payload = resp.json()
+        pages = 1
+        yield _page_from_response(resp, payload)
         if "next" not in resp.links:
-            break
-        page += 1
+            return
+
+        last = _last_page(payload, params)
+        if max_workers > 1 and last is not None and last > 2:
+            responses = _map_concurrently(fetch_page, range(2, last + 1), max_workers)
+            for resp in responses:
+                pages += 1
+                yield _page_from_response(resp)
+            return
+
+        while "next" in resp.links:
+            resp = fetch_page(pages + 1)
+            pages += 1
+            yield _page_from_response(resp)
+    finally:
+        if pages:
+            fetch_metrics.record_query(pages)
+
+
+@dataclass(frozen=True, slots=True)
+class SearchSource:
+    """A family of search queries whose results count as contributions.
+
+    ``query`` is formatted with ``username``, ``start`` and ``end``;
+    ``endpoint`` names the search API (``issues`` or ``commits``) and
+    ``date_path`` locates the timestamp exposed as ``created_at``.
+    """
+
+    name: str
+    endpoint: str
+    query: str
+    date_path: tuple[str, ...] = ("created_at",)
+
+    @property
+    def url(self) -> str:
+        return f"{GITHUB_API.rsplit('/', 1)[0]}/{self.endpoint}"
+
+    def params(self, username: str, start: str, end: str) -> dict:
+        query = self.query.format(username=username, start=start, end=end)
+        return {"q": query, "per_page": 100}
+
+    def normalise(self, item: Dict) -> Dict:
+        """Return a copy of ``item`` tagged with this source and ``created_at``."""
+
+        value = item
+        for part in self.date_path:
+            value = value.get(part) if isinstance(value, dict) else None
+        return {**item, "created_at": value, "source": self.name}
+
+
+DEFAULT_SOURCE = SearchSource(
+    "authored", "issues", "author:{username} created:{start}..{end}"
+)
+"""The historical query: every issue and pull request authored by the user."""
+
+SEARCH_SOURCES = {
+    source.name: source
+    for source in (
+        SearchSource(
+            "issues", "issues", "author:{username} type:issue created:{start}..{end}"
+        ),
+        SearchSource(
+            "prs", "issues", "author:{username} type:pr created:{start}..{end}"
+        ),
+        SearchSource(
+            "commits",
+            "commits",
+            "author:{username} author-date:{start}..{end}",
+            ("commit", "author", "date"),
+        ),
+        # Search cannot filter by review date, so reviews are dated by the PR.
+        SearchSource(
+            "reviews", "issues", "reviewed-by:{username} type:pr created:{start}..{end}"
+        ),
+    )
+}
+
+
+def _search_params(
+    username: str, start: str, end: str, source: SearchSource = DEFAULT_SOURCE
+) -> dict:
+    """Return search parameters for ``username`` within ``start..end``."""
+
+    return source.params(username, start, end)
+
+
+def _iter_leaf_windows(
+    username: str,
+    auth: Auth,
+    start: str,
+    end: str,
+    *,
+    first_response=None,
+    source: SearchSource = DEFAULT_SOURCE,
+) -> Iterator[tuple[str, str, object]]:
+    """Bisect ``start..end`` until every window fits under the result cap.
+
+    Yields ``(start, end, first_response)`` leaves in chronological order.
+    Each leaf keeps the page-one response used to read ``total_count`` so the
+    probe doubles as the first page of results. Single-day windows are never
+    split further. Leaves are planned lazily, so streaming callers only hold
+    the probes along the current bisection path.
+    """
+
+    if first_response is None:
+        first_response = _get(
+            source.url,
+            auth,
+            {**_search_params(username, start, end, source), "page": 1},
+        )
+        first_response.raise_for_status()
+    total = first_response.json().get("total_count", 0)
+    start_date = date.fromisoformat(start)
+    end_date = date.fromisoformat(end)
+    if total <= SEARCH_RESULT_CAP or start_date >= end_date:
+        yield start, end, first_response
+        return
+
+    middle = start_date + (end_date - start_date) // 2
+    yield from _iter_leaf_windows(
+        username, auth, start, middle.isoformat(), source=source
+    )
+    yield from _iter_leaf_windows(
+        username, auth, (middle + timedelta(days=1)).isoformat(), end, source=source
+    )
+
+
+def _plan_windows(
+    username: str,
+    auth: Auth,
+    start: str,
+    end: str,
+    *,
+    first_response=None,
+    source: SearchSource = DEFAULT_SOURCE,
+) -> list[tuple[str, str, object]]:
+    """Return every bisected leaf window for ``start..end``."""
+
+    return list(
+        _iter_leaf_windows(
+            username, auth, start, end, first_response=first_response, source=source
+        )
+    )
+
+
+def _fetch_planned_pages(
+    username: str,
+    auth: Auth,
+    start: str,
+    end: str,
+    max_workers: int,
+    *,
+    first_response=None,
+    source: SearchSource = DEFAULT_SOURCE,
+) -> list[CachedPage]:
+    """Return every page for ``start..end``, bisecting past the result cap."""
+
+    leaves = _plan_windows(
+        username, auth, start, end, first_response=first_response, source=source
+    )
+
+    def collect(leaf: tuple[str, str, object]) -> list[CachedPage]:
+        leaf_start, leaf_end, leaf_response = leaf
+        params = _search_params(username, leaf_start, leaf_end, source)
+        return list(
+            _search_pages(
+                source.url,
+                auth,
+                params,
+                first_response=leaf_response,
+                max_workers=max_workers,
+            )
+        )
+
+    batches = _map_concurrently(collect, leaves, max_workers)
+    pages = [page for batch in batches for page in batch]
+
+    if len(leaves) > 1 and first_response is not None and pages:
+        # Keep the whole window's validators so later runs revalidate with one
+        # request instead of one per leaf.
+        root = _page_from_response(first_response)
+        pages[0] = replace(pages[0], etag=root.etag, last_modified=root.last_modified)
+    return pages
+
+
+def _fetch_window(
+    username: str,
+    token: Auth,
+    start: str,
+    end: str,
+    cache: SearchCache | None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    *,
+    refresh: bool = False,
+    source: SearchSource = DEFAULT_SOURCE,
+) -> tuple[Dict, ...]:
+    """Return search items for ``start..end``, consulting ``cache`` when given.
+
+    Settled entries (validated after their window closed, such as past years)
+    and entries younger than ``cache.ttl`` are returned without a request.
+    Other entries are revalidated with the stored page-one validators; a
+    ``304 Not Modified`` answer reuses every cached page. ``refresh`` ignores
+    any stored entry and overwrites it. Windows whose
+    ``total_count`` exceeds :data:`SEARCH_RESULT_CAP` are bisected by date and
+    the resulting leaves are fetched concurrently. Within each leaf, pages
+    after the first are requested concurrently once ``total_count`` is known.
+    Leaves and pages share the caller's ``max_workers`` threads (see
+    :func:`_map_concurrently`).
+    """
+
+    namespace = None if source is DEFAULT_SOURCE else source.name
+    entry = None
+    if cache is not None and not refresh:
+        entry = cache.load(
+            username, start, end, token=_auth_identity(token), namespace=namespace
+        )
+        if entry is not None and (entry.is_settled() or entry.is_fresh(cache.ttl)):
+            fetch_metrics.record_cache("disk", "hit")
+            return tuple(entry.items)
+
+    validators = entry.conditional_headers() if entry is not None else {}
+    first_response = _get(
+        source.url,
+        token,
+        {**_search_params(username, start, end, source), "page": 1},
+        validators,
+    )
+    if entry is not None and first_response.status_code == 304:
+        fetch_metrics.record_cache("disk", "revalidated")
+        cache.touch(entry)
+        return tuple(entry.items)
+    first_response.raise_for_status()
+    if cache is not None:
+        fetch_metrics.record_cache("disk", "miss")
+
+    pages = _fetch_planned_pages(
+        username,
+        token,
+        start,
+        end,
+        max_workers,
+        first_response=first_response,
+        source=source,
+    )
+    if cache is not None:
+        cache.store(
+            username,
+            start,
+            end,
+            pages,
+            token=_auth_identity(token),
+            namespace=namespace,
+        )
+    return tuple(item for page in pages for item in page.items)
+
+
+def _map_concurrently(func, args: Iterable, max_workers: int) -> list:
+    """Return ``[func(arg) for arg in args]`` computed on a bounded pool.
+
+    Calls nested inside another fan-out (years inside sources, leaves inside
+    years, pages inside leaves) join the caller's :class:`WorkerBudget`, so a
+    whole fetch issues at most ``max_workers`` concurrent requests. Only the
+    outermost call opens a budget, sized by its own ``max_workers``.
+    """
+
+    budget = current_budget()
+    if budget is None:
+        with WorkerBudget(max_workers) as budget, _connections_for(budget):
+            return budget.map(func, args)
+    with _connections_for(budget):
+        return budget.map(func, args)
+
+
+def _fetch_windows(
+    username: str,
+    token: Auth,
+    windows: list[tuple[str, str]],
+    cache: SearchCache | None,
+    max_workers: int,
+) -> list[tuple[Dict, ...]]:
+    """Fetch ``windows`` concurrently and return their results in order."""
+
+    return _map_concurrently(
+        lambda window: _fetch_window(username, token, *window, cache, max_workers),
+        windows,
+        max_workers,
+    )
+
+
+def _fetch_year(
+    username: str,
+    token: Auth,
+    year: int,
+    cache_dir: str | None,
+    cache_ttl: float | None,
+    max_workers: int,
+    source: SearchSource = DEFAULT_SOURCE,
+    *,
+    refresh: bool = False,
+) -> tuple[Dict, ...]:
+    """Fetch one calendar year through the on-disk cache tier, if configured."""
+
+    cache = SearchCache(Path(cache_dir), ttl=cache_ttl) if cache_dir else None
+    start, end = _year_windows(year, year)[0]
+    return _fetch_window(
+        username,
+        token,
+        start,
+        end,
+        cache,
+        max_workers,
+        refresh=refresh,
+        source=source,
+    )
+
+
+def _year_key(
+    username: str,
+    token: Auth,
+    year: int,
+    cache_dir: str | None,
+    cache_ttl: float | None,
+    source: SearchSource = DEFAULT_SOURCE,
+) -> tuple:
+    return ("year", username, token, year, cache_dir, cache_ttl, source.name)
+
+
+def _compute_and_store(key: tuple, func, *args):
+    """Run ``func`` as the single in-flight leader for ``key`` and memoize it.
+
+    The cache is checked again because an earlier leader may have stored the
+    value between the caller's miss and this flight starting.
+    """
+
+    value = contribution_cache.peek(key)
+    if value is None:
+        value = func(*args)
+        contribution_cache.put(key, value)
+    return value
+
+
+def _memoized(key: tuple, func, *args):
+    """Return ``func(*args)`` through the in-memory cache and single-flight."""
+
+    value = contribution_cache.get(key)
+    if value is None:
+        fetch_metrics.record_cache("memory", "miss")
+        value = _flights.do(key, _compute_and_store, key, func, *args)
+    else:
+        fetch_metrics.record_cache("memory", "hit")
+    return value
 
 
-@lru_cache(maxsize=32)
 def _cached_fetch(
     username: str,
-    token: str | None,
+    token: Auth,
+    year: int,
+    cache_dir: str | None = None,
+    cache_ttl: float | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    source: SearchSource = DEFAULT_SOURCE,
+) -> tuple[Dict, ...]:
+    """Return cached GitHub search results for one calendar year.
+
+    Keying the in-memory cache per year lets overlapping ranges reuse every
+    year they share. Concurrent misses for the same year share one fetch.
+    """
+
+    return _memoized(
+        _year_key(username, token, year, cache_dir, cache_ttl, source),
+        _fetch_year,
+        username,
+        token,
+        year,
+        cache_dir,
+        cache_ttl,
+        max_workers,
+        source,
+    )
+
+
+def invalidate_user_cache(username: str) -> int:
+    """Drop every in-memory entry for ``username``; return how many were removed.
+
+    The on-disk :class:`~gitshelves.core.cache.SearchCache` is left alone;
+    pass ``refresh=True`` to :func:`fetch_user_contributions` to rewrite it.
+    """
+
+    name = username.lower()
+    return contribution_cache.invalidate_where(
+        lambda key: isinstance(key[1], str) and key[1].lower() == name
+    )
+
+
+def _fetch_shards(
+    username: str,
+    token: Auth,
     start_year: int,
     end_year: int,
-) -> tuple[Dict, ...]:
-    """Return cached GitHub search results for the provided parameters."""
+    cache_dir: str | None,
+    cache_ttl: float | None,
+    max_workers: int,
+    *,
+    refresh: bool = False,
+    source: SearchSource = DEFAULT_SOURCE,
+) -> list[tuple[Dict, ...]]:
+    """Return search results for each year of the range, in chronological order.
+
+    Years are fetched concurrently on the caller's worker budget and routed
+    through the in-memory cache. ``refresh`` ignores both cache tiers,
+    rewrites the on-disk entries and replaces the user's memoized results
+    with the fresh ones.
+    """
 
-    start_date = datetime(start_year, 1, 1)
-    end_date = datetime(end_year, 12, 31)
-    query = (
-        f"author:{username} "
-        f"created:{start_date.strftime('%Y-%m-%d')}..{end_date.strftime('%Y-%m-%d')}"
+    years = list(range(start_year, end_year + 1))
+    if refresh:
+        shards = _map_concurrently(
+            lambda year: _fetch_year(
+                username,
+                token,
+                year,
+                cache_dir,
+                cache_ttl,
+                max_workers,
+                source,
+                refresh=True,
+            ),
+            years,
+            max_workers,
+        )
+        invalidate_user_cache(username)
+        for year, shard in zip(years, shards):
+            contribution_cache.put(
+                _year_key(username, token, year, cache_dir, cache_ttl, source), shard
+            )
+        return shards
+    return _map_concurrently(
+        lambda year: _cached_fetch(
+            username, token, year, cache_dir, cache_ttl, max_workers, source
+        ),
+        years,
+        max_workers,
     )
-    headers = {"Authorization": f"token {token}"} if token else {}
-    params = {"q": query, "per_page": 100}
-    return tuple(_search_api(GITHUB_API, headers, params))
+
+
+def _fetch_days(
+    username: str,
+    token: Auth,
+    start_year: int,
+    end_year: int,
+    cache_dir: str | None = None,
+    cache_ttl: float | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> memoryview:
+    """Return packed epoch days for the provided parameters.
+
+    Each year is packed by the worker that fetched it as soon as the year
+    finishes, so full search items are only held for the years in flight and
+    four bytes per event are retained afterwards.
+    """
+
+    def packed_year(year: int) -> array:
+        return pack_event_days(
+            _fetch_year(username, token, year, cache_dir, cache_ttl, max_workers)
+        )
+
+    days = array(EPOCH_DAY_TYPECODE)
+    for packed in _map_concurrently(
+        packed_year, range(start_year, end_year + 1), max_workers
+    ):
+        days.extend(packed)
+    return memoryview(days).toreadonly()
+
+
+def _resolve_sources(names: Iterable[str]) -> list[SearchSource]:
+    """Return the :data:`SEARCH_SOURCES` entries for ``names`` without repeats."""
+
+    selected = []
+    for name in dict.fromkeys(names):
+        try:
+            selected.append(SEARCH_SOURCES[name])
+        except KeyError:
+            known = ", ".join(SEARCH_SOURCES)
+            raise ValueError(f"unknown source {name!r} (expected {known})") from None
+    if not selected:
+        raise ValueError("sources must name at least one source")
+    return selected
+
+
+def _merge_sources(
+    sources: list[SearchSource], per_source: list[list[tuple[Dict, ...]]]
+) -> List[Dict]:
+    """Merge per-source shards into one chronological, deduplicated feed.
+
+    The same commit can be found once per fork, so items are deduplicated by
+    ``sha`` (commits) or ``id`` within each source. The same pull request
+    still counts once as authored and once as reviewed.
+    """
+
+    seen: set[tuple[str, object]] = set()
+    merged: List[Dict] = []
+    for source, shards in zip(sources, per_source):
+        for shard in shards:
+            merged.extend(_new_source_items(source, shard, seen))
+    merged.sort(key=lambda item: item.get("created_at") or "")
+    return merged
+
+
+def _new_source_items(
+    source: SearchSource, items: Iterable[Dict], seen: set[tuple[str, object]]
+) -> List[Dict]:
+    """Return ``items`` normalised for ``source``, skipping identities in ``seen``."""
+
+    fresh = []
+    for item in items:
+        identity = item.get("sha") or item.get("id")
+        if identity is not None:
+            if (source.name, identity) in seen:
+                continue
+            seen.add((source.name, identity))
+        fresh.append(source.normalise(item))
+    return fresh
 
 
 def fetch_user_contributions(
     username: str,
-    token: str | None = None,
+    token: Auth = None,
     start_year: int | None = None,
     end_year: int | None = None,
+    *,
+    cache_dir: Path | str | None = None,
+    cache_ttl: float | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    refresh: bool = False,
+    repositories: Sequence[Path | str] | None = None,
+    author: str | None = None,
+    sources: Iterable[str] | None = None,
 ) -> List[Dict]:
     """Fetch contribution data for a user using GitHub's Search API.
 
     Parameters can specify a range of years to query. If no range is provided,
     only the current year is fetched. When ``token`` is omitted the fallback
     order is explicit ``--token`` value, ``GH_TOKEN``, then ``GITHUB_TOKEN``.
-    Results are cached in-memory for the lifetime of the process.
+    ``token`` may also be a :class:`TokenPool`, in which case every request
+    uses the pooled token with the most remaining quota.
+    Results are memoized in :data:`contribution_cache`, an LRU cache bounded
+    by an estimated byte budget (see
+    :class:`~gitshelves.core.memory.ContributionCache`). Pass
+    ``cache_dir`` to also persist raw pages on disk (see
+    :class:`~gitshelves.core.cache.SearchCache`); ``cache_ttl`` is the number
+    of seconds a stored result is trusted before it is revalidated with
+    ``If-None-Match``. Both caches are segmented per calendar year: closed
+    years fetched after they ended are reused indefinitely, only the current
+    year is revalidated, and overlapping ranges share every common year. Pass
+    ``refresh=True`` to bypass the caches and refetch the whole range.
+    Multi-year ranges are fetched as one sub-query per year sharing a
+    keep-alive HTTP session; sources, years, bisected windows and pages all
+    share ``max_workers`` threads, which bounds the concurrent requests.
+
+    Pass ``repositories`` (local clones or directories of clones) to read
+    commits with ``git log`` instead of calling the API; ``author`` is the
+    ``--author`` pattern and defaults to ``username``. Local scans run on up
+    to ``max_workers`` processes and bypass the caches and token entirely.
+
+    By default one ``author:`` issue search counts issues and pull requests
+    together. Pass ``sources`` (names from :data:`SEARCH_SOURCES`: ``issues``,
+    ``prs``, ``commits``, ``reviews``) to run those query families
+    concurrently instead. Their results are merged into one deduplicated,
+    chronological feed in which every item carries ``source`` and
+    ``created_at`` keys.
+    """
+
+    if max_workers < 1:
+        raise ValueError("max_workers must be positive")
+    start, end = determine_year_range(start_year, end_year)
+    if repositories is not None:
+        return fetch_local_contributions(
+            author or username, repositories, start, end, max_workers=max_workers
+        )
+    selected = _resolve_sources(sources) if sources is not None else None
+    resolved_token = resolve_token(token)
+    directory = str(Path(cache_dir).expanduser()) if cache_dir else None
+    if selected is not None:
+        per_source = _map_concurrently(
+            lambda source: _fetch_shards(
+                username,
+                resolved_token,
+                start,
+                end,
+                directory,
+                cache_ttl,
+                max_workers,
+                refresh=refresh,
+                source=source,
+            ),
+            selected,
+            max_workers,
+        )
+        return _merge_sources(selected, per_source)
+    shards = _fetch_shards(
+        username,
+        resolved_token,
+        start,
+        end,
+        directory,
+        cache_ttl,
+        max_workers,
+        refresh=refresh,
+    )
+    return [item.copy() for shard in shards for item in shard]
+
+
+def fetch_contribution_days(
+    username: str,
+    token: Auth = None,
+    start_year: int | None = None,
+    end_year: int | None = None,
+    *,
+    cache_dir: Path | str | None = None,
+    cache_ttl: float | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> memoryview:
+    """Fetch contributions as a read-only view of packed epoch days.
+
+    This lean variant of :func:`fetch_user_contributions` keeps only what
+    :func:`~gitshelves.core.contributions.build_contribution_maps` needs: the
+    ``created_at`` day of each event, stored as days since 1970-01-01 in an
+    ``array('I')``. Cache hits return the cached buffer without copying.
+    """
+
+    if max_workers < 1:
+        raise ValueError("max_workers must be positive")
+    start, end = determine_year_range(start_year, end_year)
+    resolved_token = resolve_token(token)
+    directory = str(Path(cache_dir).expanduser()) if cache_dir else None
+    return _memoized(
+        ("days", username, resolved_token, start, end, directory, cache_ttl),
+        _fetch_days,
+        username,
+        resolved_token,
+        start,
+        end,
+        directory,
+        cache_ttl,
+        max_workers,
+    )
+
+
+def fetch_contributions_since(
+    username: str,
+    since: date,
+    token: Auth = None,
+    *,
+    until: date | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> List[Dict]:
+    """Fetch items created between ``since`` and ``until`` (default today).
+
+    The window is split at calendar-year boundaries like
+    :func:`fetch_user_contributions`, but results are never cached because
+    incremental callers only ask for each delta once.
+    """
+
+    if max_workers < 1:
+        raise ValueError("max_workers must be positive")
+    end = datetime.now(UTC).date() if until is None else until
+    if since > end:
+        return []
+    windows = [
+        (
+            max(since, date(year, 1, 1)).isoformat(),
+            min(end, date(year, 12, 31)).isoformat(),
+        )
+        for year in range(since.year, end.year + 1)
+    ]
+    resolved_token = resolve_token(token)
+    shards = _fetch_windows(username, resolved_token, windows, None, max_workers)
+    return [item for shard in shards for item in shard]
+
+
+def iter_user_contributions(
+    username: str,
+    token: Auth = None,
+    start_year: int | None = None,
+    end_year: int | None = None,
+) -> Iterator[Dict]:
+    """Yield search items page by page without materialising the result.
+
+    Years are walked in chronological order and each page is released once
+    its items are consumed, so peak memory depends on the page size rather
+    than the user's history. Streams bypass the in-memory and on-disk caches;
+    use :func:`fetch_user_contributions` when results should be reused.
+    """
+
+    start, end = determine_year_range(start_year, end_year)
+    resolved_token = resolve_token(token)
+    for window_start, window_end in _year_windows(start, end):
+        for leaf_start, leaf_end, leaf_response in _iter_leaf_windows(
+            username, resolved_token, window_start, window_end
+        ):
+            for page in _search_pages(
+                GITHUB_API,
+                resolved_token,
+                _search_params(username, leaf_start, leaf_end),
+                first_response=leaf_response,
+            ):
+                yield from page.items
+
+
+_async_executors: Dict[str, ThreadPoolExecutor] = {}
+
+
+def _async_pool(name: str) -> ThreadPoolExecutor:
+    """Return the process-wide pool called ``name``, capped at the async limit."""
+
+    with _session_lock:
+        executor = _async_executors.get(name)
+        if executor is None:
+            executor = _async_executors[name] = ThreadPoolExecutor(
+                max_workers=ASYNC_MAX_CONCURRENCY,
+                thread_name_prefix=f"gitshelves-{name}",
+            )
+        return executor
+
+
+def _async_fetch_executor() -> ThreadPoolExecutor:
+    """Return the bounded pool that runs blocking fetches for event loops."""
+
+    return _async_pool("async")
+
+
+def _async_year_executor() -> ThreadPoolExecutor:
+    """Return the bounded pool that runs year fetches led by coroutines.
+
+    Range fetches on :func:`_async_fetch_executor` block on in-flight years,
+    so a year leader queued behind them on the same pool would never start.
+    Year fetches never wait on another flight, so this pool always drains.
+    """
+
+    return _async_pool("async-year")
+
+
+def _freeze_options(options: Dict) -> tuple[Dict, tuple]:
+    """Return ``options`` with iterables as tuples, plus a hashable key for them.
+
+    ``sources`` is keyed as a frozenset because its order does not change
+    which items are fetched.
+    """
+
+    frozen = {
+        name: (
+            tuple(value)
+            if isinstance(value, Iterable) and not isinstance(value, (str, bytes))
+            else value
+        )
+        for name, value in options.items()
+    }
+    key = tuple(
+        sorted(
+            (name, frozenset(value) if name == "sources" and value else value)
+            for name, value in frozen.items()
+        )
+    )
+    return frozen, key
+
+
+async def fetch_user_contributions_async(
+    username: str,
+    token: Auth = None,
+    start_year: int | None = None,
+    end_year: int | None = None,
+    **options,
+) -> List[Dict]:
+    """Asynchronously fetch contribution data for a user.
+
+    Accepts the same arguments as :func:`fetch_user_contributions` and shares
+    its in-memory and on-disk caches, HTTP session and rate limiter. The
+    blocking page loop runs on a process-wide pool capped at
+    :data:`ASYNC_MAX_CONCURRENCY` threads, so one event loop can await
+    hundreds of users while only that many fetches are in flight.
+    Concurrent awaits for the same arguments share a single fetch; each
+    caller still receives its own copies of the items.
+    """
+
+    resolved_token = resolve_token(token)
+    options, option_key = _freeze_options(options)
+    key = ("range", username, resolved_token, start_year, end_year, option_key)
+    items = await _flights.do_async(
+        key,
+        fetch_user_contributions,
+        username,
+        resolved_token,
+        start_year,
+        end_year,
+        executor=_async_fetch_executor(),
+        **options,
+    )
+    return [item.copy() for item in items]
+
+
+async def _memoized_async(key: tuple, executor, func, *args):
+    """Async counterpart of :func:`_memoized`; misses run on ``executor``."""
+
+    value = contribution_cache.get(key)
+    if value is None:
+        fetch_metrics.record_cache("memory", "miss")
+        value = await _flights.do_async(
+            key, _compute_and_store, key, func, *args, executor=executor
+        )
+    else:
+        fetch_metrics.record_cache("memory", "hit")
+    return value
+
+
+def _refresh_year(
+    key: tuple,
+    username: str,
+    token: Auth,
+    year: int,
+    cache_dir: str | None,
+    cache_ttl: float | None,
+    max_workers: int,
+    source: SearchSource,
+) -> tuple[Dict, ...]:
+    """Refetch one year past both cache tiers and memoize the fresh result."""
+
+    shard = _fetch_year(
+        username, token, year, cache_dir, cache_ttl, max_workers, source, refresh=True
+    )
+    contribution_cache.put(key, shard)
+    return shard
+
+
+async def _tagged(source: SearchSource, pending) -> tuple[SearchSource, tuple]:
+    return source, await pending
+
+
+async def iter_contribution_pages_async(
+    username: str,
+    token: Auth = None,
+    start_year: int | None = None,
+    end_year: int | None = None,
+    *,
+    cache_dir: Path | str | None = None,
+    cache_ttl: float | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    refresh: bool = False,
+    sources: Iterable[str] | None = None,
+) -> AsyncIterator[List[Dict]]:
+    """Yield each year's search items as soon as that year finishes.
+
+    Years are fetched concurrently on a shared async pool and yielded in
+    completion order, so callers can start aggregating before the slowest
+    year arrives. Years already in flight for another caller, threaded or
+    async, are awaited rather than fetched again.
+
+    ``max_workers``, ``refresh`` and ``sources`` behave as for
+    :func:`fetch_user_contributions`. With ``sources`` every batch holds one
+    source's year, normalised and deduplicated like the merged feed; local
+    ``repositories`` are only supported by the non-streaming fetchers.
     """
 
+    if max_workers < 1:
+        raise ValueError("max_workers must be positive")
+    selected = _resolve_sources(sources) if sources is not None else [DEFAULT_SOURCE]
     start, end = determine_year_range(start_year, end_year)
     resolved_token = resolve_token(token)
-    return [item.copy() for item in _cached_fetch(username, resolved_token, start, end)]
+    directory = str(Path(cache_dir).expanduser()) if cache_dir else None
+    executor = _async_year_executor()
+    if refresh:
+        invalidate_user_cache(username)
+    pending = []
+    for source in selected:
+        for year in range(start, end + 1):
+            key = _year_key(
+                username, resolved_token, year, directory, cache_ttl, source
+            )
+            args = (
+                username,
+                resolved_token,
+                year,
+                directory,
+                cache_ttl,
+                max_workers,
+                source,
+            )
+            if refresh:
+                fetch = _flights.do_async(
+                    ("refresh", *key), _refresh_year, key, *args, executor=executor
+                )
+            else:
+                fetch = _memoized_async(key, executor, _fetch_year, *args)
+            pending.append(_tagged(source, fetch))
+    seen: set[tuple[str, object]] = set()
+    for next_done in asyncio.as_completed(pending):
+        source, items = await next_done
+        if sources is None:
+            yield [item.copy() for item in items]
+        else:
+            yield _new_source_items(source, items, seen)
 
 
 # Backwards compatibility for legacy imports.
@@ -0,0 +1,338 @@
+"""Dense, array-backed storage for monthly and daily contribution counts."""
+
+from __future__ import annotations
+
+import calendar
+from array import array
+from collections.abc import Mapping
+from datetime import date
+from typing import Dict, Iterable, Iterator, Tuple
+
+from . import vectorized as _vectorized
+
+MonthlyKey = Tuple[int, int]
+DailyKey = Tuple[int, int, int]
+COUNT_TYPECODE = "I"
+
+__all__ = [
+    "COUNT_TYPECODE",
+    "ContributionGrid",
+    "DailyView",
+    "MonthlyView",
+]
+
+
+class ContributionGrid:
+    """Contribution counts for whole years held in two contiguous arrays.
+
+    Days are indexed by their offset from January 1st of ``start_year`` and
+    months by ``(year - start_year) * 12 + month - 1``, so every lookup is a
+    single index computation. :meth:`year_days`, :meth:`month_days` and
+    :meth:`year_months` return zero-copy ``memoryview`` slices. The
+    :attr:`monthly` and :attr:`daily` views behave like the tuple-keyed
+    dictionaries returned by
+    :func:`~gitshelves.core.contributions.build_contribution_maps`, so
+    existing consumers accept a grid unchanged.
+    """
+
+    __slots__ = ("start_year", "end_year", "_origin", "_days", "_months")
+
+    def __init__(self, start_year: int, end_year: int) -> None:
+        if start_year > end_year:
+            raise ValueError("start_year cannot be after end_year")
+        self.start_year = start_year
+        self.end_year = end_year
+        self._origin = date(start_year, 1, 1).toordinal()
+        span = date(end_year + 1, 1, 1).toordinal() - self._origin
+        self._days = array(COUNT_TYPECODE, bytes(span * 4))
+        self._months = array(COUNT_TYPECODE, bytes((end_year - start_year + 1) * 48))
+
+    @classmethod
+    def from_maps(
+        cls,
+        start_year: int,
+        end_year: int,
+        monthly: Mapping[MonthlyKey, int] | None = None,
+        daily: Mapping[DailyKey, int] | None = None,
+    ) -> "ContributionGrid":
+        """Build a grid from tuple-keyed maps, ignoring keys outside the range.
+
+        When ``monthly`` is omitted the monthly totals are summed from
+        ``daily``; otherwise both maps are copied as given.
+        """
+
+        grid = cls(start_year, end_year)
+        for (year, month, day), count in (daily or {}).items():
+            if start_year <= year <= end_year and count:
+                grid._days[grid._day_index(year, month, day)] += count
+                if monthly is None:
+                    grid._months[grid._month_index(year, month)] += count
+        for (year, month), count in (monthly or {}).items():
+            if start_year <= year <= end_year:
+                grid._months[grid._month_index(year, month)] = count
+        return grid
+
+    @classmethod
+    def merge(cls, grids: Iterable["ContributionGrid"]) -> "ContributionGrid":
+        """Return the element-wise sum of ``grids``, which must share a range.
+
+        The arrays are added with NumPy when it is installed and column by
+        column otherwise; either way no per-key dictionary work is done.
+        """
+
+        grids = list(grids)
+        if not grids:
+            raise ValueError("merge needs at least one grid")
+        first = grids[0]
+        for grid in grids[1:]:
+            if (grid.start_year, grid.end_year) != (first.start_year, first.end_year):
+                raise ValueError("grids must cover the same years")
+        merged = cls(first.start_year, first.end_year)
+        merged._days = _sum_arrays([grid._days for grid in grids])
+        merged._months = _sum_arrays([grid._months for grid in grids])
+        return merged
+
+    def __add__(self, other: object) -> "ContributionGrid":
+        if not isinstance(other, ContributionGrid):
+            return NotImplemented
+        return ContributionGrid.merge([self, other])
+
+    def __repr__(self) -> str:
+        return (
+            f"ContributionGrid(start_year={self.start_year}, "
+            f"end_year={self.end_year}, total={self.total})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ContributionGrid):
+            return NotImplemented
+        return (
+            self.start_year == other.start_year
+            and self.end_year == other.end_year
+            and self._days == other._days
+            and self._months == other._months
+        )
+
+    def _check_year(self, year: int) -> None:
+        if not self.start_year <= year <= self.end_year:
+            raise KeyError(year)
+
+    @staticmethod
+    def _check_month(month: int | None) -> None:
+        if month is not None and not 1 <= month <= 12:
+            raise ValueError(f"month must be in 1..12, not {month}")
+
+    def _month_index(self, year: int, month: int) -> int:
+        self._check_year(year)
+        if not 1 <= month <= 12:
+            raise KeyError((year, month))
+        return (year - self.start_year) * 12 + month - 1
+
+    def _day_index(self, year: int, month: int, day: int) -> int:
+        self._check_year(year)
+        try:
+            return date(year, month, day).toordinal() - self._origin
+        except ValueError:
+            raise KeyError((year, month, day)) from None
+
+    def _date_at(self, index: int) -> date:
+        return date.fromordinal(self._origin + index)
+
+    @property
+    def total(self) -> int:
+        return sum(self._days)
+
+    @property
+    def monthly(self) -> "MonthlyView":
+        return MonthlyView(self)
+
+    @property
+    def daily(self) -> "DailyView":
+        return DailyView(self)
+
+    def add(self, year: int, month: int, day: int, count: int = 1) -> None:
+        """Add ``count`` (which may be negative) to one day and its month."""
+
+        day_index = self._day_index(year, month, day)
+        month_index = self._month_index(year, month)
+        if self._days[day_index] + count < 0:
+            raise ValueError(f"count for {year}-{month:02}-{day:02} cannot go negative")
+        self._days[day_index] += count
+        self._months[month_index] += count
+
+    def count(self, year: int, month: int, day: int | None = None) -> int:
+        """Return the count for a month, or for one day when ``day`` is given."""
+
+        if day is None:
+            return self._months[self._month_index(year, month)]
+        return self._days[self._day_index(year, month, day)]
+
+    def year_days(self, year: int) -> memoryview:
+        """Return the daily counts of ``year`` (January 1st first) without copying."""
+
+        start = self._day_index(year, 1, 1)
+        end = self._day_index(year, 12, 31) + 1
+        return memoryview(self._days)[start:end]
+
+    def month_days(self, year: int, month: int) -> memoryview:
+        """Return the daily counts of one month without copying."""
+
+        start = self._day_index(year, month, 1)
+        return memoryview(self._days)[
+            start : start + calendar.monthrange(year, month)[1]
+        ]
+
+    def year_months(self, year: int) -> memoryview:
+        """Return the twelve monthly counts of ``year`` without copying."""
+
+        start = self._month_index(year, 1)
+        return memoryview(self._months)[start : start + 12]
+
+    def iter_months(
+        self, year: int | None = None, month: int | None = None
+    ) -> Iterator[tuple[MonthlyKey, int]]:
+        """Yield ``((year, month), count)`` in order, including empty months.
+
+        Raises ``ValueError`` when ``month`` is outside ``1..12``.
+        """
+
+        self._check_month(month)
+        years = range(self.start_year, self.end_year + 1) if year is None else [year]
+        months = range(1, 13) if month is None else [month]
+        for current_year in years:
+            if not self.start_year <= current_year <= self.end_year:
+                continue
+            counts = self.year_months(current_year)
+            for current_month in months:
+                yield (current_year, current_month), counts[current_month - 1]
+
+    def iter_days(
+        self, year: int | None = None, month: int | None = None
+    ) -> Iterator[tuple[DailyKey, int]]:
+        """Yield ``((year, month, day), count)`` in order for non-empty days.
+
+        Raises ``ValueError`` when ``month`` is outside ``1..12``.
+        """
+
+        self._check_month(month)
+        if year is not None and not self.start_year <= year <= self.end_year:
+            return
+        if year is None:
+            start, counts = 0, memoryview(self._days)
+        elif month is None:
+            start, counts = self._day_index(year, 1, 1), self.year_days(year)
+        else:
+            start = self._day_index(year, month, 1)
+            counts = self.month_days(year, month)
+        for offset, count in enumerate(counts):
+            if count:
+                current = self._date_at(start + offset)
+                if month is not None and year is None and current.month != month:
+                    continue
+                yield (current.year, current.month, current.day), count
+
+    def to_maps(self) -> tuple[Dict[MonthlyKey, int], Dict[DailyKey, int]]:
+        """Return plain dictionaries shaped like ``build_contribution_maps``."""
+
+        return dict(self.iter_months()), dict(self.iter_days())
+
+
+def _sum_arrays(arrays: list[array]) -> array:
+    """Add equally sized count arrays element-wise."""
+
+    if len(arrays) == 1:
+        return array(COUNT_TYPECODE, arrays[0])
+    np = _vectorized.np
+    if np is None:
+        return array(COUNT_TYPECODE, map(sum, zip(*arrays)))
+    total = np.zeros(len(arrays[0]), dtype=np.uint64)
+    for counts in arrays:
+        total += np.frombuffer(counts, dtype=np.uintc)
+    if total.size and int(total.max()) > np.iinfo(np.uintc).max:
+        raise OverflowError("merged counts exceed the grid's integer width")
+    return array(COUNT_TYPECODE, total.astype(np.uintc).tobytes())
+
+
+class MonthlyView(Mapping):
+    """Read-only ``{(year, month): count}`` view covering every month of a grid."""
+
+    __slots__ = ("grid",)
+
+    def __init__(self, grid: ContributionGrid) -> None:
+        self.grid = grid
+
+    def __getitem__(self, key: MonthlyKey) -> int:
+        try:
+            year, month = key
+        except (TypeError, ValueError):
+            raise KeyError(key) from None
+        return self.grid.count(year, month)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __iter__(self) -> Iterator[MonthlyKey]:
+        for key, _count in self.grid.iter_months():
+            yield key
+
+    def __len__(self) -> int:
+        return (self.grid.end_year - self.grid.start_year + 1) * 12
+
+    def __repr__(self) -> str:
+        return f"MonthlyView({dict(self.items())!r})"
+
+    def select(
+        self, year: int | None = None, month: int | None = None
+    ) -> Iterator[tuple[MonthlyKey, int]]:
+        """Yield sorted items for one year and/or month without scanning others."""
+
+        return self.grid.iter_months(year, month)
+
+
+class DailyView(Mapping):
+    """Read-only ``{(year, month, day): count}`` view of a grid's non-empty days.
+
+    Like the dictionaries it replaces, days without contributions are absent:
+    ``view[key]`` raises ``KeyError`` and ``view.get(key, 0)`` returns ``0``.
+    """
+
+    __slots__ = ("grid",)
+
+    def __init__(self, grid: ContributionGrid) -> None:
+        self.grid = grid
+
+    def __getitem__(self, key: DailyKey) -> int:
+        try:
+            year, month, day = key
+        except (TypeError, ValueError):
+            raise KeyError(key) from None
+        count = self.grid.count(year, month, day)
+        if not count:
+            raise KeyError(key)
+        return count
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __iter__(self) -> Iterator[DailyKey]:
+        for key, _count in self.grid.iter_days():
+            yield key
+
+    def __len__(self) -> int:
+        return sum(1 for count in self.grid._days if count)
+
+    def __repr__(self) -> str:
+        return f"DailyView({dict(self.items())!r})"
+
+    def select(
+        self, year: int | None = None, month: int | None = None
+    ) -> Iterator[tuple[DailyKey, int]]:
+        """Yield sorted items for one year and/or month without scanning others."""
+
+        return self.grid.iter_days(year, month)
@@ -0,0 +1,242 @@
+"""Counters and histograms describing how the fetch layer spent its time."""
+
+from __future__ import annotations
+
+import bisect
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Iterable, Mapping
+from urllib.parse import urlsplit
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+"""Upper bounds, in seconds, of the request latency histogram buckets."""
+
+BYTES_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576)
+"""Upper bounds of the response size histogram buckets."""
+
+PAGES_BUCKETS = (1, 2, 3, 5, 10)
+"""Upper bounds of the pages-per-query histogram buckets."""
+
+CACHE_OUTCOMES = ("hit", "miss", "revalidated")
+
+__all__ = [
+    "BYTES_BUCKETS",
+    "CACHE_OUTCOMES",
+    "LATENCY_BUCKETS",
+    "PAGES_BUCKETS",
+    "FetchMetrics",
+    "FetchStats",
+    "Histogram",
+    "response_size",
+]
+
+
+class Histogram:
+    """Fixed-bucket histogram that also tracks count, sum, min and max.
+
+    ``bounds`` are inclusive upper bounds; values above the last bound land
+    in an overflow bucket reported as ``"+Inf"``. Not thread-safe on its own;
+    :class:`FetchMetrics` serialises access.
+    """
+
+    __slots__ = ("bounds", "counts", "count", "total", "minimum", "maximum")
+
+    def __init__(self, bounds: Iterable[float]) -> None:
+        self.bounds = tuple(sorted(bounds))
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.minimum: float | None = None
+        self.maximum: float | None = None
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def to_json(self) -> dict[str, Any]:
+        labels = [str(bound) for bound in self.bounds] + ["+Inf"]
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.minimum,
+            "max": self.maximum,
+            "mean": self.mean,
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+def response_size(resp) -> int:
+    """Return the size of ``resp`` as sent, falling back to the decoded body."""
+
+    length = resp.headers.get("Content-Length")
+    if length is not None:
+        try:
+            return int(length)
+        except (TypeError, ValueError):
+            pass
+    content = getattr(resp, "content", None)
+    return len(content) if isinstance(content, (bytes, bytearray)) else 0
+
+
+def _endpoint(url: str) -> str:
+    return urlsplit(url).path or url
+
+
+@dataclass(slots=True, frozen=True)
+class FetchStats:
+    """Point-in-time snapshot reported by :meth:`FetchMetrics.snapshot`."""
+
+    requests: int
+    retries: int
+    queries: int
+    pages: int
+    bytes: int
+    wait_seconds: float
+    statuses: Mapping[int, int]
+    latency: Mapping[str, Mapping[str, Any]]
+    response_bytes: Mapping[str, Any]
+    pages_per_query: Mapping[str, Any]
+    cache: Mapping[str, Mapping[str, int]]
+    quota_remaining: int | None
+    quota_min_remaining: int | None
+    quota_reset_at: float | None
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "queries": self.queries,
+            "pages": self.pages,
+            "bytes": self.bytes,
+            "wait_seconds": self.wait_seconds,
+            "statuses": {str(code): n for code, n in sorted(self.statuses.items())},
+            "latency": {name: dict(hist) for name, hist in self.latency.items()},
+            "response_bytes": dict(self.response_bytes),
+            "pages_per_query": dict(self.pages_per_query),
+            "cache": {layer: dict(counts) for layer, counts in self.cache.items()},
+            "quota": {
+                "remaining": self.quota_remaining,
+                "min_remaining": self.quota_min_remaining,
+                "reset_at": self.quota_reset_at,
+            },
+        }
+
+
+class FetchMetrics:
+    """Thread-safe recorder for the GitHub fetch layer.
+
+    The fetch helpers report every HTTP response (latency per endpoint,
+    status, size and the ``X-RateLimit-*`` quota headers), every throttled
+    retry, the time spent waiting on the rate limiter, the number of pages
+    each search query needed and the outcome of every cache lookup.
+    :meth:`snapshot` returns the totals as a :class:`FetchStats`.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero every counter, for example at the start of a run."""
+
+        with self._lock:
+            self._requests = 0
+            self._retries = 0
+            self._bytes = 0
+            self._wait = 0.0
+            self._statuses: Counter = Counter()
+            self._latency: dict[str, Histogram] = {}
+            self._sizes = Histogram(BYTES_BUCKETS)
+            self._pages = Histogram(PAGES_BUCKETS)
+            self._cache: dict[str, Counter] = {}
+            self._quota_remaining: int | None = None
+            self._quota_min: int | None = None
+            self._quota_reset: float | None = None
+
+    def record_response(self, url: str, resp, elapsed: float) -> None:
+        """Record one HTTP response that took ``elapsed`` seconds."""
+
+        size = response_size(resp)
+        headers = resp.headers
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        endpoint = _endpoint(url)
+        with self._lock:
+            self._requests += 1
+            self._bytes += size
+            self._statuses[resp.status_code] += 1
+            histogram = self._latency.get(endpoint)
+            if histogram is None:
+                histogram = self._latency[endpoint] = Histogram(LATENCY_BUCKETS)
+            histogram.observe(elapsed)
+            self._sizes.observe(size)
+            try:
+                if remaining is not None:
+                    self._quota_remaining = int(remaining)
+                    if (
+                        self._quota_min is None
+                        or self._quota_remaining < self._quota_min
+                    ):
+                        self._quota_min = self._quota_remaining
+                if reset is not None:
+                    self._quota_reset = float(reset)
+            except (TypeError, ValueError):
+                pass
+
+    def record_retry(self) -> None:
+        with self._lock:
+            self._retries += 1
+
+    def record_wait(self, seconds: float) -> None:
+        """Record time spent blocked on the rate limiter before a request."""
+
+        with self._lock:
+            self._wait += seconds
+
+    def record_query(self, pages: int) -> None:
+        """Record that one search query was paginated over ``pages`` pages."""
+
+        with self._lock:
+            self._pages.observe(pages)
+
+    def record_cache(self, layer: str, outcome: str) -> None:
+        """Record a ``hit``, ``miss`` or ``revalidated`` lookup on ``layer``."""
+
+        if outcome not in CACHE_OUTCOMES:
+            raise ValueError(f"unknown cache outcome {outcome!r}")
+        with self._lock:
+            self._cache.setdefault(layer, Counter())[outcome] += 1
+
+    def snapshot(self) -> FetchStats:
+        with self._lock:
+            return FetchStats(
+                requests=self._requests,
+                retries=self._retries,
+                queries=self._pages.count,
+                pages=int(self._pages.total),
+                bytes=self._bytes,
+                wait_seconds=self._wait,
+                statuses=dict(self._statuses),
+                latency={
+                    name: hist.to_json() for name, hist in sorted(self._latency.items())
+                },
+                response_bytes=self._sizes.to_json(),
+                pages_per_query=self._pages.to_json(),
+                cache={
+                    layer: {outcome: counts[outcome] for outcome in CACHE_OUTCOMES}
+                    for layer, counts in sorted(self._cache.items())
+                },
+                quota_remaining=self._quota_remaining,
+                quota_min_remaining=self._quota_min,
+                quota_reset_at=self._quota_reset,
+            )
@@ -0,0 +1,219 @@
+"""Byte-bounded in-process cache for fetched contribution data."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Iterator
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+__all__ = [
+    "DEFAULT_MAX_BYTES",
+    "CacheStats",
+    "ContributionCache",
+    "estimate_size",
+]
+
+
+def estimate_size(value: Any) -> int:
+    """Return the approximate number of bytes retained by ``value``.
+
+    Containers are walked recursively (dicts, lists, tuples and sets) and
+    buffers report their payload size. Objects shared between containers are
+    counted once.
+    """
+
+    seen: set[int] = set()
+    total = 0
+    stack = [value]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif isinstance(obj, memoryview):
+            # getsizeof() only covers the view; the exporter owns the payload.
+            if not isinstance(obj.obj, array):
+                total += obj.nbytes
+            else:
+                stack.append(obj.obj)
+    return total
+
+
+@dataclass(slots=True, frozen=True)
+class CacheStats:
+    """Point-in-time counters reported by :meth:`ContributionCache.stats`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    entries: int
+    bytes: int
+    max_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_json(self) -> dict[str, int | float]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "entries": self.entries,
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hit_rate": self.hit_rate,
+        }
+
+
+class ContributionCache:
+    """Thread-safe LRU cache bounded by an estimated byte budget.
+
+    Entries are charged their :func:`estimate_size` when stored, and the
+    least recently used entries are evicted until the total fits
+    ``max_bytes``. Values larger than the whole budget are returned to the
+    caller but never retained. ``ttl`` (seconds) expires entries on lookup.
+    :meth:`stats` reports hit, miss, eviction and expiration counters.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        *,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sizeof: Callable[[Any], int] = estimate_size,
+    ) -> None:
+        if max_bytes < 0:
+            raise ValueError("max_bytes cannot be negative")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._clock = clock
+        self._sizeof = sizeof
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, tuple[Any, int, float]] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.peek(key) is not None
+
+    def __repr__(self) -> str:
+        return (
+            f"ContributionCache(entries={len(self)}, bytes={self._bytes}, "
+            f"max_bytes={self.max_bytes})"
+        )
+
+    def _expired(self, stored_at: float, now: float) -> bool:
+        return self.ttl is not None and now - stored_at >= self.ttl
+
+    def _drop(self, key: Hashable) -> None:
+        _value, size, _stored_at = self._entries.pop(key)
+        self._bytes -= size
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for ``key`` and mark it recently used."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry[2], self._clock()):
+                self._drop(key)
+                self._expirations += 1
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value without touching counters or recency."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self._expired(entry[2], self._clock()):
+                return default
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, *, size: int | None = None) -> bool:
+        """Store ``value`` and return ``True`` when it fits the budget."""
+
+        size = self._sizeof(value) if size is None else size
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            if size > self.max_bytes:
+                return False
+            self._entries[key] = (value, size, self._clock())
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self._evictions += 1
+            return True
+
+    def invalidate(self, key: Hashable) -> bool:
+        """Remove ``key`` and return whether it was cached."""
+
+        with self._lock:
+            if key not in self._entries:
+                return False
+            self._drop(key)
+            return True
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Remove every entry whose key matches ``predicate``; return the count."""
+
+        with self._lock:
+            doomed = [key for key in self._entries if predicate(key)]
+            for key in doomed:
+                self._drop(key)
+            return len(doomed)
+
+    def clear(self) -> None:
+        """Drop every entry; counters are kept."""
+
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def keys(self) -> Iterator[Hashable]:
+        with self._lock:
+            return iter(list(self._entries))
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                entries=len(self._entries),
+                bytes=self._bytes,
+                max_bytes=self.max_bytes,
+            )
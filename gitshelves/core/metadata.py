@@ -7,12 +7,36 @@ import json
 import math
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Tuple
 
 from ..render import scad as _scad
+from ..render.levels import LOG_SCALE, LevelScale
+from .grid import DailyView, MonthlyView
+
+if TYPE_CHECKING:  # pragma: no cover - import only needed for annotations
+    from .contributions import ContributionRollup
 
 MonthlyCounts = Dict[Tuple[int, int], int]
 DailyCounts = Dict[Tuple[int, int, int], int]
+SourceCounts = Dict[Tuple[int, ...], Dict[str, int]]
+Breakdowns = Dict[str, SourceCounts]
+
+
+def _select(
+    counts: MonthlyCounts | DailyCounts, year: int | None, month: int | None
+) -> Iterable[Tuple[Tuple[int, ...], int]]:
+    """Yield ``counts`` items in key order, limited to ``year`` and ``month``.
+
+    Grid views are already ordered and slice straight to the requested span.
+    """
+
+    if isinstance(counts, (MonthlyView, DailyView)):
+        return counts.select(year, month)
+    return (
+        (key, count)
+        for key, count in sorted(counts.items())
+        if (year is None or key[0] == year) and (month is None or key[1] == month)
+    )
 
 
 def _filter_none(mapping: Dict[str, Any]) -> Dict[str, Any]:
@@ -21,28 +45,43 @@ def _filter_none(mapping: Dict[str, Any]) -> Dict[str, Any]:
     return {key: value for key, value in mapping.items() if value is not None}
 
 
+def _add_breakdowns(
+    item: Dict[str, Any], key: Tuple[int, ...], breakdowns: Breakdowns | None
+) -> None:
+    """Attach each non-empty breakdown (e.g. ``sources``) for ``key`` to ``item``."""
+
+    for name, counts in (breakdowns or {}).items():
+        if counts:
+            item[name] = dict(sorted(counts.get(key, {}).items()))
+
+
 def _monthly_payload(
     counts: MonthlyCounts,
     *,
     year: int | None = None,
     month: int | None = None,
+    breakdowns: Breakdowns | None = None,
+    scale: LevelScale | None = None,
 ) -> List[Dict[str, Any]]:
-    """Serialise monthly contribution counts for JSON metadata."""
+    """Serialise monthly contribution counts for JSON metadata.
+
+    ``breakdowns`` maps an entry field such as ``"sources"`` or ``"members"``
+    to per-month counts split by that dimension. ``"blocks"`` is computed on
+    ``scale`` for the whole selection at once.
+    """
 
+    selected = list(_select(counts, year, month))
+    levels = _scad.levels_for_contributions([count for _, count in selected], scale)
     items: List[Dict[str, Any]] = []
-    for (count_year, count_month), count in sorted(counts.items()):
-        if year is not None and count_year != year:
-            continue
-        if month is not None and count_month != month:
-            continue
-        items.append(
-            {
-                "year": count_year,
-                "month": count_month,
-                "count": count,
-                "blocks": _scad.blocks_for_contributions(count),
-            }
-        )
+    for ((count_year, count_month), count), blocks in zip(selected, levels):
+        item = {
+            "year": count_year,
+            "month": count_month,
+            "count": count,
+            "blocks": blocks,
+        }
+        _add_breakdowns(item, (count_year, count_month), breakdowns)
+        items.append(item)
     return items
 
 
@@ -51,24 +90,24 @@ def _daily_payload(
     *,
     year: int | None = None,
     month: int | None = None,
+    breakdowns: Breakdowns | None = None,
+    scale: LevelScale | None = None,
 ) -> List[Dict[str, Any]]:
     """Serialise daily contribution counts for JSON metadata."""
 
+    selected = list(_select(counts, year, month))
+    levels = _scad.levels_for_contributions([count for _, count in selected], scale)
     items: List[Dict[str, Any]] = []
-    for (count_year, count_month, day), count in sorted(counts.items()):
-        if year is not None and count_year != year:
-            continue
-        if month is not None and count_month != month:
-            continue
-        items.append(
-            {
-                "year": count_year,
-                "month": count_month,
-                "day": day,
-                "count": count,
-                "blocks": _scad.blocks_for_contributions(count),
-            }
-        )
+    for ((count_year, count_month, day), count), blocks in zip(selected, levels):
+        item = {
+            "year": count_year,
+            "month": count_month,
+            "day": day,
+            "count": count,
+            "blocks": blocks,
+        }
+        _add_breakdowns(item, (count_year, count_month, day), breakdowns)
+        items.append(item)
     return items
 
 
@@ -76,7 +115,7 @@ def _zero_months(counts: MonthlyCounts) -> List[Dict[str, int]]:
     """Return metadata entries for months without contributions."""
 
     zeroed: List[Dict[str, int]] = []
-    for (year, month), count in sorted(counts.items()):
+    for (year, month), count in _select(counts, None, None):
         if count > 0:
             continue
         zeroed.append({"year": year, "month": month})
@@ -99,6 +138,14 @@ class MetadataWriter:
     gridfinity_columns: int
     gridfinity_cubes: bool
     baseplate_template: str
+    monthly_sources: SourceCounts = field(default_factory=dict, repr=False)
+    daily_sources: SourceCounts = field(default_factory=dict, repr=False)
+    monthly_members: SourceCounts = field(default_factory=dict, repr=False)
+    daily_members: SourceCounts = field(default_factory=dict, repr=False)
+    fetch_stats: Dict[str, Any] | None = field(default=None, repr=False)
+    rollup: "ContributionRollup | None" = field(default=None, repr=False)
+    monthly_scale: LevelScale | None = field(default=None, repr=False)
+    daily_scale: LevelScale | None = field(default=None, repr=False)
     color_groups: int = field(init=False)
     gridfinity_rows: int | None = field(init=False, default=None)
     _records: list[tuple[Dict[str, Any], Path]] = field(
@@ -116,11 +163,13 @@ class MetadataWriter:
             self.color_groups = 0
             return
 
-        max_level = 0
-        for count in self.monthly_counts.values():
-            blocks = _scad.blocks_for_contributions(count)
-            if blocks > max_level:
-                max_level = blocks
+        if self.rollup is not None:
+            peaks = [self.rollup.stats.busiest_month_count]
+        else:
+            peaks = list(self.monthly_counts.values())
+        max_level = max(
+            _scad.levels_for_contributions(peaks, self.monthly_scale), default=0
+        )
 
         if max_level == 0:
             self.color_groups = 0
@@ -141,7 +190,7 @@ class MetadataWriter:
         if self.gridfinity_rows is not None:
             gridfinity_details["rows"] = self.gridfinity_rows
 
-        return {
+        payload = {
             "username": self.username,
             "year_range": {"start": self.start_year, "end": self.end_year},
             "months_per_row": self.months_per_row,
@@ -151,16 +200,54 @@ class MetadataWriter:
             "gridfinity": gridfinity_details,
             "baseplate_template": self.baseplate_template,
         }
+        if self.monthly_scale is not None:
+            payload["scale"] = {
+                "name": self.monthly_scale.name,
+                "monthly_thresholds": list(self.monthly_scale.thresholds),
+                "daily_thresholds": list((self.daily_scale or LOG_SCALE).thresholds),
+            }
+        for name, breakdown in self._breakdowns(monthly=True).items():
+            labels = {label for counts in breakdown.values() for label in counts}
+            if labels:
+                payload[name] = sorted(labels)
+        return payload
+
+    def _breakdowns(self, *, monthly: bool) -> Breakdowns:
+        if monthly:
+            return {"sources": self.monthly_sources, "members": self.monthly_members}
+        return {"sources": self.daily_sources, "members": self.daily_members}
 
     def monthly_contributions(
         self, *, year: int | None = None, month: int | None = None
     ) -> List[Dict[str, Any]]:
-        return _monthly_payload(self.monthly_counts, year=year, month=month)
+        return _monthly_payload(
+            self.monthly_counts,
+            year=year,
+            month=month,
+            breakdowns=self._breakdowns(monthly=True),
+            scale=self.monthly_scale,
+        )
 
     def daily_contributions(
         self, *, year: int | None = None, month: int | None = None
     ) -> List[Dict[str, Any]]:
-        return _daily_payload(self.daily_counts, year=year, month=month)
+        return _daily_payload(
+            self.daily_counts,
+            year=year,
+            month=month,
+            breakdowns=self._breakdowns(monthly=False),
+            scale=self.daily_scale,
+        )
+
+    def weekly_contributions(self) -> List[Dict[str, int]]:
+        """Return ISO-week totals from :attr:`rollup` (empty without one)."""
+
+        if self.rollup is None:
+            return []
+        return [
+            {"iso_year": iso_year, "week": week, "count": count}
+            for (iso_year, week), count in self.rollup.weekly.items()
+        ]
 
     def zero_months(self) -> List[Dict[str, int]]:
         return _zero_months(self.monthly_counts)
@@ -219,7 +306,12 @@ class MetadataWriter:
         self._records.append((copy.deepcopy(payload), metadata_path))
 
     def write_run_summary(self, json_path: Path | str) -> Path:
-        """Write a run-level metadata summary covering all SCAD artifacts."""
+        """Write a run-level metadata summary covering all SCAD artifacts.
+
+        ``fetch_stats``, when set, is included under ``"fetch"``. With a
+        :attr:`rollup` the summary also carries overall and per-year
+        ``"stats"`` and the ``"weekly_contributions"`` buckets.
+        """
 
         summary_path = Path(json_path)
         summary_path.parent.mkdir(parents=True, exist_ok=True)
@@ -227,6 +319,17 @@ class MetadataWriter:
             **self._common_payload(),
             "outputs": [],
         }
+        if self.fetch_stats is not None:
+            summary["fetch"] = self.fetch_stats
+        if self.rollup is not None:
+            summary["stats"] = {
+                **self.rollup.stats.to_json(),
+                "years": {
+                    str(year): stats.to_json()
+                    for year, stats in self.rollup.year_stats.items()
+                },
+            }
+            summary["weekly_contributions"] = self.weekly_contributions()
         for payload, metadata_path in self._records:
             entry = dict(payload)
             entry["metadata"] = str(metadata_path)
@@ -0,0 +1,209 @@
+"""Rate-limit-aware request pacing shared by concurrent GitHub fetchers."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from typing import Callable, Iterable, Mapping
+
+SEARCH_REQUESTS_PER_MINUTE = 30
+THROTTLE_STATUSES = frozenset({403, 429})
+DEFAULT_BACKOFF = 60.0
+
+__all__ = [
+    "SEARCH_REQUESTS_PER_MINUTE",
+    "RateLimiter",
+    "TokenPool",
+]
+
+
+def _header_number(headers: Mapping[str, str], name: str) -> float | None:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _mentions_rate_limit(resp) -> bool:
+    """Return ``True`` when ``resp`` is a secondary rate-limit error body."""
+
+    try:
+        text = resp.text
+    except (AttributeError, ValueError):
+        return False
+    return isinstance(text, str) and "rate limit" in text.lower()
+
+
+class RateLimiter:
+    """Token bucket that paces requests and honours GitHub rate-limit headers.
+
+    Every request first :meth:`acquire`\\ s a token; the bucket refills at
+    ``rate`` tokens per second up to ``burst``. Pass ``rate=None`` to disable
+    pacing and rely on response headers alone. :meth:`observe` reads
+    ``X-RateLimit-Remaining``, ``X-RateLimit-Reset`` and ``Retry-After`` so an
+    exhausted quota blocks every thread until the reset instead of failing.
+    ``clock`` must return epoch seconds because ``X-RateLimit-Reset`` does.
+    """
+
+    def __init__(
+        self,
+        rate: float | None = SEARCH_REQUESTS_PER_MINUTE / 60,
+        burst: int = SEARCH_REQUESTS_PER_MINUTE,
+        *,
+        max_retries: int = 5,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.rate = rate
+        self.burst = burst
+        self.max_retries = max_retries
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self.remaining: int | None = None
+        self.reset_at: float | None = None
+
+    def _refill(self, now: float) -> None:
+        if self.rate is None:
+            self._tokens = float(self.burst)
+        else:
+            elapsed = max(now - self._updated, 0.0)
+            self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def try_acquire(self) -> float:
+        """Take a token if possible; otherwise return the seconds to wait."""
+
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            wait = self._blocked_until - now
+            if wait > 0:
+                return wait
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+
+        while True:
+            wait = self.try_acquire()
+            if wait <= 0:
+                return
+            self._sleep(wait)
+
+    def observe(self, resp) -> bool:
+        """Record ``resp`` rate-limit headers; return ``True`` when throttled.
+
+        A throttled response (``403``/``429`` carrying ``Retry-After``, an
+        exhausted quota or a secondary rate-limit message in its body) blocks
+        further :meth:`acquire` calls until GitHub allows requests again, and
+        the caller should retry. Secondary limits without headers back off for
+        :data:`DEFAULT_BACKOFF` seconds.
+        """
+
+        headers = resp.headers
+        remaining = _header_number(headers, "X-RateLimit-Remaining")
+        reset = _header_number(headers, "X-RateLimit-Reset")
+        retry_after = _header_number(headers, "Retry-After")
+        with self._lock:
+            now = self._clock()
+            if remaining is not None:
+                self.remaining = int(remaining)
+            if reset is not None:
+                self.reset_at = reset
+            if remaining == 0 and reset is not None:
+                self._blocked_until = max(self._blocked_until, reset)
+            throttled = resp.status_code in THROTTLE_STATUSES and (
+                retry_after is not None or remaining == 0 or _mentions_rate_limit(resp)
+            )
+            if not throttled:
+                return False
+            if retry_after is not None:
+                until = now + retry_after
+            elif reset is not None:
+                until = reset
+            else:
+                until = now + DEFAULT_BACKOFF
+            self._blocked_until = max(self._blocked_until, until)
+            return True
+
+
+class TokenPool:
+    """Rotate requests across several API tokens by remaining quota.
+
+    Each token gets its own :class:`RateLimiter` (GitHub tracks quota per
+    token). :meth:`acquire` hands out the usable token with the most remaining
+    quota, so aggregate throughput scales with the number of tokens, and only
+    sleeps when every token is paced or exhausted.
+    """
+
+    def __init__(
+        self,
+        tokens: Iterable[str],
+        *,
+        limiter_factory: Callable[[], RateLimiter] = RateLimiter,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        unique = tuple(dict.fromkeys(token for token in tokens if token))
+        if not unique:
+            raise ValueError("TokenPool requires at least one token")
+        self.tokens = unique
+        self._limiters = {token: limiter_factory() for token in unique}
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        first = self._limiters[unique[0]]
+        self.max_retries = first.max_retries + len(unique) - 1
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def __repr__(self) -> str:
+        return f"TokenPool(<{len(self.tokens)} tokens>)"
+
+    @property
+    def identity(self) -> str:
+        """Stable, non-reversible label for the pool's set of tokens."""
+
+        digest = hashlib.sha256("\n".join(sorted(self.tokens)).encode("utf-8"))
+        return f"pool:{digest.hexdigest()[:16]}"
+
+    def limiter_for(self, token: str) -> RateLimiter:
+        return self._limiters[token]
+
+    def remaining(self) -> list[int | None]:
+        """Return the last observed remaining quota, in ``tokens`` order."""
+
+        return [self._limiters[token].remaining for token in self.tokens]
+
+    def acquire(self) -> tuple[str, RateLimiter]:
+        """Block until a token may be used and return it with its limiter."""
+
+        def priority(token: str) -> float:
+            remaining = self._limiters[token].remaining
+            # Unknown quota sorts first so every token is probed once.
+            return float("inf") if remaining is None else remaining
+
+        while True:
+            with self._lock:
+                wait = float("inf")
+                for token in sorted(self.tokens, key=priority, reverse=True):
+                    limiter = self._limiters[token]
+                    delay = limiter.try_acquire()
+                    if delay <= 0:
+                        return token, limiter
+                    wait = min(wait, delay)
+            self._sleep(wait)
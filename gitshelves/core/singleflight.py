@@ -0,0 +1,86 @@
+"""Coalesce concurrent identical calls into a single in-flight execution."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Executor, Future
+from functools import partial
+from typing import Any, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+__all__ = ["SingleFlight"]
+
+
+class SingleFlight:
+    """Share one execution of ``func`` between concurrent callers of a key.
+
+    The first caller for ``key`` (the leader) runs the function; callers
+    arriving while it is in flight wait for the same result, or the same
+    exception, instead of repeating the work. Once the call finishes the key
+    is released, so later callers start a fresh execution and caching stays
+    the job of the wrapped function. Threads block in :meth:`do`; coroutines
+    ``await`` :meth:`do_async` without occupying a worker thread while they
+    wait.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+
+    def __len__(self) -> int:
+        """Return the number of keys currently in flight."""
+
+        with self._lock:
+            return len(self._calls)
+
+    def _claim(self, key: Hashable) -> tuple[Future, bool]:
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                return future, False
+            future = Future()
+            future.set_running_or_notify_cancel()
+            self._calls[key] = future
+            return future, True
+
+    def _run(self, key: Hashable, future: Future, func: Callable[[], Any]) -> None:
+        try:
+            result = func()
+        except BaseException as exc:
+            outcome = partial(future.set_exception, exc)
+        else:
+            outcome = partial(future.set_result, result)
+        with self._lock:
+            del self._calls[key]
+        outcome()
+
+    def do(self, key: Hashable, func: Callable[..., T], *args, **kwargs) -> T:
+        """Return ``func(*args, **kwargs)``, joining an in-flight call for ``key``."""
+
+        future, leader = self._claim(key)
+        if leader:
+            self._run(key, future, partial(func, *args, **kwargs))
+        return future.result()
+
+    async def do_async(
+        self,
+        key: Hashable,
+        func: Callable[..., T],
+        *args,
+        executor: Executor | None = None,
+        **kwargs,
+    ) -> T:
+        """Await ``func(*args, **kwargs)`` run on ``executor``, coalesced by ``key``.
+
+        Async callers share in-flight calls with threads using :meth:`do`.
+        """
+
+        future, leader = self._claim(key)
+        if leader:
+            loop = asyncio.get_running_loop()
+            loop.run_in_executor(
+                executor, self._run, key, future, partial(func, *args, **kwargs)
+            )
+        return await asyncio.wrap_future(future)
@@ -0,0 +1,251 @@
+"""SQLite contribution store holding daily counts for fleets of users.
+
+Counts live in one ``daily(day, user_id, count)`` table of integers clustered
+by day, so a query such as "every user in 2025" is a single contiguous range
+scan. A covering ``(user_id, day)`` index serves per-user reads. The store
+mirrors :class:`~gitshelves.core.archive.ContributionStore`, so
+:func:`~gitshelves.core.archive.ingest_archives` and the CLI's
+``--contribution-store`` accept either.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Mapping
+
+from .events import EPOCH_ORDINAL
+from .grid import ContributionGrid, DailyKey
+
+SCHEMA_VERSION = 1
+SQLITE_SUFFIXES = frozenset({".db", ".sqlite", ".sqlite3"})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY,
+    login TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS daily (
+    day INTEGER NOT NULL,
+    user_id INTEGER NOT NULL REFERENCES users (id),
+    count INTEGER NOT NULL,
+    PRIMARY KEY (day, user_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS daily_by_user ON daily (user_id, day, count);
+CREATE TABLE IF NOT EXISTS ingested (
+    name TEXT PRIMARY KEY
+) WITHOUT ROWID;
+"""
+
+__all__ = [
+    "SCHEMA_VERSION",
+    "SQLITE_SUFFIXES",
+    "SQLiteContributionStore",
+]
+
+
+def _epoch_day(year: int, month: int, day: int) -> int:
+    return date(year, month, day).toordinal() - EPOCH_ORDINAL
+
+
+def _day_key(day: int) -> DailyKey:
+    current = date.fromordinal(EPOCH_ORDINAL + day)
+    return current.year, current.month, current.day
+
+
+def _year_bounds(start_year: int | None, end_year: int | None) -> tuple[int, int]:
+    low = _epoch_day(start_year, 1, 1) if start_year is not None else -(2**62)
+    high = _epoch_day(end_year, 12, 31) if end_year is not None else 2**62
+    return low, high
+
+
+@dataclass(slots=True)
+class SQLiteContributionStore:
+    """Persist per-user daily counts as integer rows in one SQLite file.
+
+    Usernames are stored lower-cased. Each call opens a short-lived
+    connection, so a store can be shared between processes and threads.
+    """
+
+    path: Path
+
+    def __post_init__(self) -> None:
+        self.path = Path(self.path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with self._connect() as conn:
+                version = conn.execute("PRAGMA user_version").fetchone()[0]
+                if version not in (0, SCHEMA_VERSION):
+                    raise ValueError(
+                        f"{self.path} uses store schema {version}; "
+                        f"expected {SCHEMA_VERSION}"
+                    )
+                conn.executescript(_SCHEMA)
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        except sqlite3.DatabaseError as exc:
+            raise ValueError(f"{self.path} is not a SQLite store: {exc}") from None
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Yield a connection whose work is committed as one transaction."""
+
+        with closing(sqlite3.connect(self.path)) as conn:
+            with conn:
+                yield conn
+
+    @staticmethod
+    def _user_id(conn: sqlite3.Connection, username: str) -> int:
+        login = username.lower()
+        conn.execute("INSERT OR IGNORE INTO users (login) VALUES (?)", (login,))
+        return conn.execute(
+            "SELECT id FROM users WHERE login = ?", (login,)
+        ).fetchone()[0]
+
+    def _rows(self, user_id: int, daily: Mapping[DailyKey, int]) -> List[tuple]:
+        return [
+            (_epoch_day(*key), user_id, count) for key, count in daily.items() if count
+        ]
+
+    def load(self, username: str) -> Dict[DailyKey, int] | None:
+        """Return stored daily counts for ``username`` or ``None`` when absent."""
+
+        return self.load_range(username)
+
+    def load_range(
+        self,
+        username: str,
+        start_year: int | None = None,
+        end_year: int | None = None,
+    ) -> Dict[DailyKey, int] | None:
+        """Return ``username``'s daily counts between the years (inclusive)."""
+
+        low, high = _year_bounds(start_year, end_year)
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT id FROM users WHERE login = ?", (username.lower(),)
+            ).fetchone()
+            if row is None:
+                return None
+            rows = conn.execute(
+                "SELECT day, count FROM daily "
+                "WHERE user_id = ? AND day BETWEEN ? AND ? ORDER BY day",
+                (row[0], low, high),
+            ).fetchall()
+        return {_day_key(day): count for day, count in rows}
+
+    def save(self, username: str, daily: Mapping[DailyKey, int]) -> Path:
+        """Replace every stored count for ``username`` with ``daily``."""
+
+        with self._connect() as conn:
+            user_id = self._user_id(conn, username)
+            conn.execute("DELETE FROM daily WHERE user_id = ?", (user_id,))
+            conn.executemany(
+                "INSERT INTO daily (day, user_id, count) VALUES (?, ?, ?)",
+                self._rows(user_id, daily),
+            )
+        return self.path
+
+    def merge(
+        self, username: str, daily: Mapping[DailyKey, int]
+    ) -> Dict[DailyKey, int]:
+        """Add ``daily`` to the stored counts and return the merged result."""
+
+        self.merge_many({username: daily})
+        return self.load(username) or {}
+
+    def merge_many(self, totals: Mapping[str, Mapping[DailyKey, int]]) -> None:
+        """Add daily counts for many users in a single transaction."""
+
+        with self._connect() as conn:
+            self._merge_rows(conn, totals)
+
+    def _merge_rows(
+        self, conn: sqlite3.Connection, totals: Mapping[str, Mapping[DailyKey, int]]
+    ) -> None:
+        for username, daily in totals.items():
+            conn.executemany(
+                "INSERT INTO daily (day, user_id, count) VALUES (?, ?, ?) "
+                "ON CONFLICT (day, user_id) "
+                "DO UPDATE SET count = count + excluded.count",
+                self._rows(self._user_id(conn, username), daily),
+            )
+
+    @staticmethod
+    def _mark_rows(conn: sqlite3.Connection, names: Iterable[str]) -> None:
+        conn.executemany(
+            "INSERT OR IGNORE INTO ingested (name) VALUES (?)",
+            [(name,) for name in names],
+        )
+
+    def usernames(self) -> List[str]:
+        with self._connect() as conn:
+            rows = conn.execute("SELECT login FROM users ORDER BY login").fetchall()
+        return [login for (login,) in rows]
+
+    def ingested(self) -> set[str]:
+        """Return the names of archive files already merged into the store."""
+
+        with self._connect() as conn:
+            return {name for (name,) in conn.execute("SELECT name FROM ingested")}
+
+    def mark_ingested(self, names: Iterable[str]) -> None:
+        with self._connect() as conn:
+            self._mark_rows(conn, names)
+
+    def merge_ingested(
+        self,
+        totals: Mapping[str, Mapping[DailyKey, int]],
+        names: Iterable[str],
+        *,
+        reset: Iterable[str] = (),
+    ) -> None:
+        """Merge ``totals`` and record archive ``names`` in one transaction.
+
+        Either both land or neither does, so an interrupted ingest never counts
+        an archive twice when it is run again. The stored counts of the users
+        in ``reset`` are dropped first, so ``totals`` replaces them.
+        """
+
+        with self._connect() as conn:
+            conn.executemany(
+                "DELETE FROM daily WHERE user_id = "
+                "(SELECT id FROM users WHERE login = ?)",
+                [(username.lower(),) for username in reset],
+            )
+            self._merge_rows(conn, totals)
+            self._mark_rows(conn, names)
+
+    def grids(
+        self,
+        start_year: int,
+        end_year: int,
+        usernames: Iterable[str] | None = None,
+    ) -> Dict[str, ContributionGrid]:
+        """Return a :class:`ContributionGrid` per user with counts in the range.
+
+        The rows are read with one scan of the day-clustered table, e.g. every
+        user's 2025 activity with ``grids(2025, 2025)``. ``usernames`` limits
+        the result; users without counts in the range are omitted.
+        """
+
+        wanted = {name.lower() for name in usernames} if usernames is not None else None
+        low, high = _year_bounds(start_year, end_year)
+        grids: Dict[str, ContributionGrid] = {}
+        with self._connect() as conn:
+            logins = dict(conn.execute("SELECT id, login FROM users"))
+            rows = conn.execute(
+                "SELECT day, user_id, count FROM daily WHERE day BETWEEN ? AND ?",
+                (low, high),
+            )
+            for day, user_id, count in rows:
+                login = logins[user_id]
+                if wanted is not None and login not in wanted:
+                    continue
+                grid = grids.get(login)
+                if grid is None:
+                    grid = grids[login] = ContributionGrid(start_year, end_year)
+                grid.add(*_day_key(day), count)
+        return grids
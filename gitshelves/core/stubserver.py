@@ -0,0 +1,327 @@
+"""Local stand-in for the GitHub search API used by offline benchmarks.
+
+:class:`StubServer` answers ``/search/issues`` queries of the form
+``author:<user> created:<start>..<end>`` with deterministic synthetic
+results. It paginates like GitHub (``total_count``, ``Link`` headers and the
+1,000 result cap), answers ``If-None-Match`` with ``304``, can add latency
+to every response and enforces an optional rate limit through the usual
+``X-RateLimit-*`` headers. Given a recorded
+:class:`~gitshelves.core.transport.Cassette` it replays that session instead.
+
+Point the fetchers at a running stub with::
+
+    with StubServer(latency=0.05) as stub:
+        github.GITHUB_API = stub.search_url
+        github.rate_limiter = RateLimiter(rate=None)
+        github.fetch_user_contributions("octocat", start_year=2015)
+
+or run ``python -m gitshelves.core.stubserver`` to serve it standalone.
+
+The default :data:`~gitshelves.core.github.rate_limiter` paces requests to
+GitHub's 30 per minute, so benchmarks replace it with an unpaced limiter
+that still honours the stub's ``X-RateLimit-*`` headers.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+from datetime import date, timedelta
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Sequence
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from .transport import Cassette
+
+SEARCH_PATH = "/search/issues"
+SEARCH_RESULT_CAP = 1000
+MAX_PER_PAGE = 100
+DEFAULT_PER_PAGE = 30
+
+_AUTHOR_RE = re.compile(r"author:(\S+)")
+_CREATED_RE = re.compile(r"created:(\d{4}-\d{2}-\d{2})\.\.(\d{4}-\d{2}-\d{2})")
+
+__all__ = [
+    "SEARCH_PATH",
+    "StubServer",
+    "synthetic_day_count",
+    "main",
+]
+
+
+@lru_cache(maxsize=65536)
+def synthetic_day_count(username: str, day: date, events_per_day: int) -> int:
+    """Return the deterministic number of events ``username`` made on ``day``.
+
+    Counts average ``events_per_day`` and are stable across runs and
+    processes, so benchmarks and tests can compute expected totals.
+    """
+
+    seed = f"{username.lower()}:{day.isoformat()}"
+    return random.Random(seed).randint(0, 2 * events_per_day)
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, handler, stub: "StubServer") -> None:
+        super().__init__(address, handler)
+        self.stub = stub
+
+
+class _SearchHandler(BaseHTTPRequestHandler):
+    server: _StubHTTPServer
+
+    def do_GET(self):  # noqa: N802 - http.server naming
+        stub = self.server.stub
+        status, headers, body = stub.respond(self.path, dict(self.headers))
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+class StubServer:
+    """Threaded HTTP server imitating GitHub's issue search endpoint.
+
+    ``events_per_day`` sets the average synthetic activity, ``latency`` adds
+    a fixed delay (seconds) before each response, and ``rate_limit`` allows
+    that many requests per ``reset_interval`` seconds before answering
+    ``403`` with an exhausted quota. ``cassette`` switches to replay mode.
+    """
+
+    def __init__(
+        self,
+        *,
+        events_per_day: int = 2,
+        latency: float = 0.0,
+        rate_limit: int | None = None,
+        reset_interval: float = 60.0,
+        cassette: Cassette | Path | str | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        if events_per_day < 0:
+            raise ValueError("events_per_day cannot be negative")
+        if latency < 0:
+            raise ValueError("latency cannot be negative")
+        if rate_limit is not None and rate_limit < 1:
+            raise ValueError("rate_limit must be positive")
+        if cassette is not None and not isinstance(cassette, Cassette):
+            cassette = Cassette.load(cassette)
+        self.events_per_day = events_per_day
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.reset_interval = reset_interval
+        self.cassette = cassette
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._window_start = time.time()
+        self._used = 0
+        self._server = _StubHTTPServer((host, port), _SearchHandler, self)
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def search_url(self) -> str:
+        return self.url + SEARCH_PATH
+
+    def start(self) -> "StubServer":
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._server.serve_forever,
+                name="gitshelves-stub",
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def respond(
+        self, target: str, headers: Dict[str, str]
+    ) -> tuple[int, Dict[str, str], str]:
+        """Return ``(status, headers, body)`` for a request to ``target``."""
+
+        with self._lock:
+            self.requests += 1
+        if self.latency:
+            time.sleep(self.latency)
+        parts = urlsplit(target)
+        params = dict(parse_qsl(parts.query))
+        if self.cassette is not None:
+            return self._replay(parts.path, params)
+        rate_headers, exhausted = self._consume_quota()
+        if exhausted:
+            body = json.dumps({"message": "API rate limit exceeded"})
+            return 403, {**rate_headers, "Content-Type": "application/json"}, body
+        status, response_headers, body = self._search(parts.path, params, headers)
+        return status, {**rate_headers, **response_headers}, body
+
+    def _replay(self, path: str, params: Dict[str, str]):
+        try:
+            interaction = self.cassette.lookup(path, params)
+        except KeyError as exc:
+            return (
+                404,
+                {"Content-Type": "application/json"},
+                json.dumps({"message": str(exc)}),
+            )
+        return interaction["status"], dict(interaction["headers"]), interaction["body"]
+
+    def _consume_quota(self) -> tuple[Dict[str, str], bool]:
+        if self.rate_limit is None:
+            return {}, False
+        with self._lock:
+            now = time.time()
+            if now - self._window_start >= self.reset_interval:
+                self._window_start = now
+                self._used = 0
+            exhausted = self._used >= self.rate_limit
+            if not exhausted:
+                self._used += 1
+            reset = math.ceil(self._window_start + self.reset_interval)
+            return {
+                "X-RateLimit-Limit": str(self.rate_limit),
+                "X-RateLimit-Remaining": str(self.rate_limit - self._used),
+                "X-RateLimit-Reset": str(reset),
+            }, exhausted
+
+    def _events(self, username: str, start: date, end: date) -> List[Dict]:
+        events: List[Dict] = []
+        day = start
+        while day <= end:
+            for index in range(synthetic_day_count(username, day, self.events_per_day)):
+                events.append(
+                    {
+                        "id": day.toordinal() * 100 + index,
+                        "title": f"Synthetic event {index + 1}",
+                        "created_at": f"{day.isoformat()}T12:{index % 60:02d}:00Z",
+                        "user": {"login": username},
+                    }
+                )
+            day += timedelta(days=1)
+        return events
+
+    def _search(self, path: str, params: Dict[str, str], headers: Dict[str, str]):
+        json_headers = {"Content-Type": "application/json"}
+        query = params.get("q", "")
+        author = _AUTHOR_RE.search(query)
+        created = _CREATED_RE.search(query)
+        if path != SEARCH_PATH or author is None or created is None:
+            body = json.dumps({"message": "Validation Failed"})
+            return 422, json_headers, body
+
+        per_page = min(int(params.get("per_page", DEFAULT_PER_PAGE)), MAX_PER_PAGE)
+        page = max(int(params.get("page", 1)), 1)
+        if (page - 1) * per_page >= SEARCH_RESULT_CAP:
+            body = json.dumps(
+                {"message": "Only the first 1000 search results are available"}
+            )
+            return 422, json_headers, body
+
+        events = self._events(
+            author.group(1),
+            date.fromisoformat(created.group(1)),
+            date.fromisoformat(created.group(2)),
+        )
+        reachable = min(len(events), SEARCH_RESULT_CAP)
+        items = events[(page - 1) * per_page : min(page * per_page, reachable)]
+        body = json.dumps(
+            {
+                "total_count": len(events),
+                "incomplete_results": False,
+                "items": items,
+            }
+        )
+        etag = '"' + hashlib.sha256(body.encode("utf-8")).hexdigest()[:32] + '"'
+        response_headers = {**json_headers, "ETag": etag}
+        last_page = max(1, -(-reachable // per_page))
+        links = []
+        if page < last_page:
+            links.append(("next", page + 1))
+            links.append(("last", last_page))
+        if links:
+            response_headers["Link"] = ", ".join(
+                f'<{self.search_url}?{urlencode({**params, "page": number})}>; '
+                f'rel="{rel}"'
+                for rel, number in links
+            )
+        if headers.get("If-None-Match") == etag:
+            return 304, response_headers, ""
+        return 200, response_headers, body
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Serve the stub until interrupted."""
+
+    parser = argparse.ArgumentParser(
+        prog="python -m gitshelves.core.stubserver",
+        description="Serve a local stand-in for the GitHub search API.",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--events-per-day", type=int, default=2)
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Seconds to delay each response"
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=int,
+        help="Requests allowed per reset interval before answering 403",
+    )
+    parser.add_argument("--reset-interval", type=float, default=60.0)
+    parser.add_argument("--replay", type=Path, help="Cassette to replay")
+    args = parser.parse_args(argv)
+
+    stub = StubServer(
+        events_per_day=args.events_per_day,
+        latency=args.latency,
+        rate_limit=args.rate_limit,
+        reset_interval=args.reset_interval,
+        cassette=args.replay,
+        host=args.host,
+        port=args.port,
+    )
+    print(f"Serving GitHub search stub at {stub.search_url}")
+    stub.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stub.stop()
+
+
+if __name__ == "__main__":  # pragma: no cover - module entry point
+    main()
@@ -0,0 +1,95 @@
+"""Combine the contribution grids of several users into one team chart."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Mapping, Tuple
+
+from .grid import ContributionGrid
+from .metadata import SourceCounts
+from .workers import WorkerBudget
+
+TEAM_WORKERS = 4
+"""Threads shared by all member fetches by default; see :func:`load_member_grids`."""
+
+__all__ = [
+    "TEAM_WORKERS",
+    "load_member_grids",
+    "member_breakdowns",
+    "read_logins",
+    "sum_breakdowns",
+]
+
+
+def read_logins(path: Path | str) -> List[str]:
+    """Return the logins listed one per line in the UTF-8 file at ``path``.
+
+    Blank lines and ``#`` comments are skipped. ``OSError`` and
+    ``UnicodeDecodeError`` propagate for unreadable files.
+    """
+
+    logins = []
+    for line in Path(path).expanduser().read_text(encoding="utf-8").splitlines():
+        line = line.split("#", 1)[0].strip()
+        if line:
+            logins.append(line)
+    return logins
+
+
+def load_member_grids(
+    members: Iterable[str],
+    load: Callable[[str], ContributionGrid],
+    *,
+    max_workers: int = TEAM_WORKERS,
+) -> Dict[str, ContributionGrid]:
+    """Call ``load(member)`` for every member concurrently.
+
+    Members are de-duplicated case-insensitively and the result keeps their
+    first-seen order. Loads run on a :class:`~gitshelves.core.workers.WorkerBudget`
+    of ``max_workers`` threads, so fetches fanned out inside ``load`` share
+    those threads rather than multiplying them. The first exception raised by
+    ``load`` propagates.
+    """
+
+    if max_workers < 1:
+        raise ValueError("max_workers must be positive")
+    unique: Dict[str, str] = {}
+    for member in members:
+        unique.setdefault(member.lower(), member)
+    logins = list(unique.values())
+    if not logins:
+        raise ValueError("a team needs at least one member")
+    with WorkerBudget(max_workers) as budget:
+        return dict(zip(logins, budget.map(load, logins)))
+
+
+def member_breakdowns(
+    grids: Mapping[str, ContributionGrid],
+) -> Tuple[SourceCounts, SourceCounts]:
+    """Return ``{(year, month): {member: count}}`` and the per-day equivalent.
+
+    Only non-zero counts are listed, matching the per-source breakdowns that
+    :class:`~gitshelves.core.metadata.MetadataWriter` already serialises.
+    """
+
+    monthly: SourceCounts = {}
+    daily: SourceCounts = {}
+    for member, grid in grids.items():
+        for key, count in grid.iter_months():
+            if count:
+                monthly.setdefault(key, {})[member] = count
+        for key, count in grid.iter_days():
+            daily.setdefault(key, {})[member] = count
+    return dict(sorted(monthly.items())), dict(sorted(daily.items()))
+
+
+def sum_breakdowns(breakdowns: Iterable[SourceCounts]) -> SourceCounts:
+    """Add several ``{key: {label: count}}`` breakdowns together."""
+
+    total: SourceCounts = {}
+    for breakdown in breakdowns:
+        for key, counts in breakdown.items():
+            bucket = total.setdefault(key, {})
+            for label, count in counts.items():
+                bucket[label] = bucket.get(label, 0) + count
+    return dict(sorted(total.items()))
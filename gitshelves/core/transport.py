@@ -0,0 +1,179 @@
+"""Pluggable HTTP transports for the GitHub fetchers.
+
+Every request issued by :mod:`gitshelves.core.github` goes through a
+*transport*: any object with a ``requests``-compatible ``get(url, headers=...,
+params=..., timeout=...)`` method. The default is the shared keep-alive
+``requests.Session``; :class:`RecordingTransport` and
+:class:`ReplayTransport` capture and replay sessions so fetches can be
+exercised offline and repeatably.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Protocol
+from urllib.parse import urlencode, urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+CASSETTE_VERSION = 1
+# Describe the raw wire encoding; recorded bodies are already decoded.
+_WIRE_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+__all__ = [
+    "CASSETTE_VERSION",
+    "Cassette",
+    "RecordingTransport",
+    "ReplayTransport",
+    "Transport",
+    "build_response",
+]
+
+
+class Transport(Protocol):
+    """Minimal interface the fetchers need from an HTTP client."""
+
+    def get(
+        self,
+        url: str,
+        headers: Dict[str, str] | None = None,
+        params: Dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> requests.Response: ...
+
+
+def _request_key(url: str, params: Dict[str, Any] | None) -> str:
+    """Return the lookup key for ``url`` and ``params``.
+
+    Only the path and sorted query are used so cassettes recorded against
+    api.github.com replay against a local stub and vice versa.
+    """
+
+    parts = urlsplit(url)
+    query = sorted((key, str(value)) for key, value in (params or {}).items())
+    return f"{parts.path}?{urlencode(query)}"
+
+
+def build_response(
+    url: str, status: int, headers: Dict[str, str], body: bytes
+) -> requests.Response:
+    """Return a :class:`requests.Response` populated from raw parts."""
+
+    resp = requests.Response()
+    resp.url = url
+    resp.status_code = status
+    resp.headers = CaseInsensitiveDict(headers)
+    resp._content = body
+    resp.encoding = "utf-8"
+    return resp
+
+
+class Cassette:
+    """Ordered request/response pairs keyed by path and query.
+
+    Identical requests replay their recorded responses in order, so a
+    throttled answer followed by a successful retry replays faithfully; the
+    last response for a key is reused once the queue is exhausted.
+    """
+
+    def __init__(self, interactions: List[Dict[str, Any]] | None = None) -> None:
+        self.interactions: List[Dict[str, Any]] = list(interactions or [])
+        self._lock = threading.Lock()
+        self._queues: Dict[str, Deque[Dict[str, Any]]] = defaultdict(deque)
+        self._last: Dict[str, Dict[str, Any]] = {}
+        for interaction in self.interactions:
+            self._queues[interaction["key"]].append(interaction)
+
+    def __len__(self) -> int:
+        return len(self.interactions)
+
+    @classmethod
+    def load(cls, path: Path | str) -> "Cassette":
+        data = json.loads(Path(path).expanduser().read_text())
+        if data.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"unsupported cassette version in {path}")
+        return cls(data.get("interactions", []))
+
+    def save(self, path: Path | str) -> Path:
+        path = Path(path).expanduser()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with self._lock:
+            payload = {"version": CASSETTE_VERSION, "interactions": self.interactions}
+            tmp_path.write_text(json.dumps(payload, indent=1))
+        os.replace(tmp_path, path)
+        return path
+
+    def record(self, url: str, params: Dict[str, Any] | None, resp) -> None:
+        """Append ``resp`` as the answer to ``url`` with ``params``."""
+
+        interaction = {
+            "key": _request_key(url, params),
+            "status": resp.status_code,
+            "headers": {
+                name: value
+                for name, value in resp.headers.items()
+                if name.lower() not in _WIRE_HEADERS
+            },
+            "body": resp.content.decode("utf-8"),
+        }
+        with self._lock:
+            self.interactions.append(interaction)
+            self._queues[interaction["key"]].append(interaction)
+
+    def lookup(self, url: str, params: Dict[str, Any] | None = None) -> Dict[str, Any]:
+        """Return the next recorded interaction; ``KeyError`` when unknown."""
+
+        key = _request_key(url, params)
+        with self._lock:
+            queue = self._queues.get(key)
+            if queue:
+                self._last[key] = queue.popleft()
+            if key not in self._last:
+                raise KeyError(f"no recorded response for {key}")
+            return self._last[key]
+
+
+class RecordingTransport:
+    """Forward requests to ``inner`` and record every response in a cassette."""
+
+    def __init__(self, inner: Transport, cassette: Cassette | None = None) -> None:
+        self.inner = inner
+        self.cassette = cassette if cassette is not None else Cassette()
+
+    def get(self, url, headers=None, params=None, timeout=None):
+        resp = self.inner.get(url, headers=headers, params=params, timeout=timeout)
+        self.cassette.record(url, params, resp)
+        return resp
+
+
+class ReplayTransport:
+    """Serve responses from a recorded :class:`Cassette` without the network.
+
+    Request headers are ignored, so replays work regardless of the token or
+    cache validators in use. Unknown requests raise
+    :class:`requests.ConnectionError` like an unreachable host would.
+    """
+
+    def __init__(self, cassette: Cassette | Path | str) -> None:
+        if not isinstance(cassette, Cassette):
+            cassette = Cassette.load(cassette)
+        self.cassette = cassette
+
+    def get(self, url, headers=None, params=None, timeout=None):
+        try:
+            interaction = self.cassette.lookup(url, params)
+        except KeyError as exc:
+            raise requests.ConnectionError(str(exc)) from exc
+        query = urlencode(sorted((params or {}).items()))
+        return build_response(
+            f"{url}?{query}" if query else url,
+            interaction["status"],
+            interaction["headers"],
+            interaction["body"].encode("utf-8"),
+        )
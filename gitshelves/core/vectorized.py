@@ -0,0 +1,166 @@
+"""Optional NumPy kernels for aggregating large batches of contribution events.
+
+NumPy is an optional dependency (``pip install gitshelves[fast]``). Callers
+check :data:`HAVE_NUMPY` and fall back to the pure-Python aggregation in
+:mod:`gitshelves.core.contributions` when it is missing.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Sequence, Tuple
+
+from .events import EPOCH_ORDINAL
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+HAVE_NUMPY = np is not None
+VECTORIZE_THRESHOLD = 4096
+"""Batches smaller than this are aggregated in pure Python by default."""
+
+_DATE_WIDTH = len("YYYY-MM-DD")
+_DIGIT_COLUMNS = [0, 1, 2, 3, 5, 6, 8, 9]
+_SEPARATOR_COLUMNS = [4, 7]
+_DAYS_IN_MONTH = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+
+__all__ = [
+    "HAVE_NUMPY",
+    "VECTORIZE_THRESHOLD",
+    "bin_epoch_days",
+    "parse_epoch_days",
+    "require_numpy",
+]
+
+
+def require_numpy() -> None:
+    """Raise ``RuntimeError`` when NumPy is not installed."""
+
+    if np is None:
+        raise RuntimeError(
+            "vectorized aggregation requires NumPy; install gitshelves[fast]"
+        )
+
+
+def _canonical_epoch_days(timestamps: Sequence[str]):
+    """Return epoch days for ``YYYY-MM-DD`` prefixes and a mask of parsed rows.
+
+    The prefixes are sliced as fixed-width UTF-32 strings and validated
+    column-wise, so no per-item Python call is made.
+    """
+
+    codes = (
+        np.array(timestamps, dtype=f"U{_DATE_WIDTH}")
+        .view(np.uint32)
+        .reshape(-1, _DATE_WIDTH)
+    )
+    digits = codes[:, _DIGIT_COLUMNS].astype(np.int32) - ord("0")
+    valid = ((digits >= 0) & (digits <= 9)).all(axis=1)
+    valid &= (codes[:, _SEPARATOR_COLUMNS] == ord("-")).all(axis=1)
+
+    year = digits[:, :4] @ np.array([1000, 100, 10, 1], dtype=np.int32)
+    month = digits[:, 4] * 10 + digits[:, 5]
+    day = digits[:, 6] * 10 + digits[:, 7]
+    valid &= (year >= 1) & (month >= 1) & (month <= 12) & (day >= 1)
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    month_index = np.clip(month - 1, 0, 11)
+    month_length = np.asarray(_DAYS_IN_MONTH)[month_index] + (leap & (month == 2))
+    valid &= day <= month_length
+
+    months = ((year[valid] - 1970) * 12 + month_index[valid]).astype(np.int64)
+    first_days = months.astype("datetime64[M]").astype("datetime64[D]")
+    days = first_days.astype(np.int64) + (day[valid] - 1)
+    return days, valid
+
+
+def parse_epoch_days(timestamps: Sequence[Any], parse: Callable[[Any], Any]):
+    """Return an ``int64`` array with the epoch day of every usable timestamp.
+
+    Falsy values are skipped. Canonical ``YYYY-MM-DD`` prefixes are parsed in
+    bulk; anything else is handed to ``parse`` (which returns a date or raises
+    ``ValueError`` to drop the value), so the result matches calling
+    ``parse`` on every timestamp. Also returns the index of each kept
+    timestamp within ``timestamps``.
+    """
+
+    require_numpy()
+    strings = []
+    positions = []
+    others = []
+    for position, value in enumerate(timestamps):
+        if not value:
+            continue
+        if isinstance(value, str):
+            strings.append(value)
+            positions.append(position)
+        else:
+            others.append((position, value))
+    positions = np.asarray(positions, dtype=np.int64)
+    if strings:
+        days, valid = _canonical_epoch_days(strings)
+        kept = positions[valid]
+        rejected = positions[~valid]
+    else:
+        days = kept = rejected = np.empty(0, dtype=np.int64)
+
+    extra_days = []
+    extra_positions = []
+    for position in sorted([*rejected.tolist(), *(p for p, _v in others)]):
+        try:
+            parsed = parse(timestamps[position])
+        except ValueError:
+            continue
+        extra_days.append(parsed.toordinal() - EPOCH_ORDINAL)
+        extra_positions.append(position)
+    if extra_days:
+        days = np.concatenate([days, np.asarray(extra_days, dtype=np.int64)])
+        kept = np.concatenate([kept, np.asarray(extra_positions, dtype=np.int64)])
+    return days, kept
+
+
+def bin_epoch_days(
+    days,
+) -> Tuple[Dict[Tuple[int, int], int], Dict[Tuple[int, int, int], int]]:
+    """Count epoch ``days`` per month and per day with ``np.bincount``.
+
+    Days are binned into a dense array spanning the observed range, then the
+    non-empty bins are split into ``(year, month, day)`` keys and re-binned
+    by month. Keys are returned in chronological order.
+    """
+
+    require_numpy()
+    days = np.asarray(days, dtype=np.int64)
+    if days.size == 0:
+        return {}, {}
+    first = int(days.min())
+    per_day = np.bincount(days - first)
+    occupied = np.flatnonzero(per_day)
+    counts = per_day[occupied]
+    dates = (occupied + first).astype("datetime64[D]")
+    months = dates.astype("datetime64[M]")
+    month_numbers = months.astype(np.int64)
+    years = month_numbers // 12 + 1970
+    month_of_year = month_numbers % 12 + 1
+    day_of_month = (dates - months.astype("datetime64[D]")).astype(np.int64) + 1
+
+    first_month = int(month_numbers[0])
+    per_month = np.bincount(month_numbers - first_month, weights=counts)
+    occupied_months = np.flatnonzero(per_month)
+    monthly_numbers = occupied_months + first_month
+    monthly = dict(
+        zip(
+            zip(
+                (monthly_numbers // 12 + 1970).tolist(),
+                (monthly_numbers % 12 + 1).tolist(),
+            ),
+            per_month[occupied_months].astype(np.int64).tolist(),
+        )
+    )
+    daily = dict(
+        zip(
+            zip(years.tolist(), month_of_year.tolist(), day_of_month.tolist()),
+            counts.tolist(),
+        )
+    )
+    return monthly, daily
@@ -0,0 +1,159 @@
+"""Incremental contribution refreshes backed by per-user watermarks."""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from .contributions import ContributionAggregator, DailyKey, MonthlyKey
+from .github import determine_year_range, fetch_contributions_since
+
+WATERMARK_VERSION = 1
+
+__all__ = [
+    "WATERMARK_VERSION",
+    "Watermark",
+    "WatermarkStore",
+    "refresh_contribution_maps",
+]
+
+
+@dataclass(slots=True)
+class Watermark:
+    """Aggregated daily counts for ``username`` from ``start`` onwards.
+
+    ``watermark`` is the newest ``created_at`` day seen; everything before it
+    is considered settled, so the next refresh only queries
+    ``created:>=watermark``.
+    """
+
+    username: str
+    start: date
+    watermark: date
+    daily: Dict[DailyKey, int] = field(default_factory=dict)
+
+    def monthly(self) -> Dict[MonthlyKey, int]:
+        totals: Dict[MonthlyKey, int] = {}
+        for (year, month, _day), count in self.daily.items():
+            totals[(year, month)] = totals.get((year, month), 0) + count
+        return totals
+
+    def to_json(self) -> Dict[str, object]:
+        return {
+            "version": WATERMARK_VERSION,
+            "username": self.username,
+            "start": self.start.isoformat(),
+            "watermark": self.watermark.isoformat(),
+            "daily": [[*key, count] for key, count in sorted(self.daily.items())],
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, object]) -> "Watermark":
+        return cls(
+            username=str(data["username"]),
+            start=date.fromisoformat(str(data["start"])),
+            watermark=date.fromisoformat(str(data["watermark"])),
+            daily={
+                (int(year), int(month), int(day)): int(count)
+                for year, month, day, count in data.get("daily", [])
+            },
+        )
+
+
+@dataclass(slots=True)
+class WatermarkStore:
+    """Persist one :class:`Watermark` per username as JSON under ``directory``."""
+
+    directory: Path
+
+    def __post_init__(self) -> None:
+        self.directory = Path(self.directory).expanduser()
+
+    def path_for(self, username: str) -> Path:
+        return self.directory / f"{username.replace(os.sep, '_').lower()}.json"
+
+    def load(self, username: str) -> Watermark | None:
+        try:
+            data = json.loads(self.path_for(username).read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if data.get("version") != WATERMARK_VERSION:
+            return None
+        try:
+            return Watermark.from_json(data)
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def save(self, state: Watermark) -> Path:
+        path = self.path_for(state.username)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(state.to_json()))
+        os.replace(tmp_path, path)
+        return path
+
+
+def refresh_contribution_maps(
+    username: str,
+    store: WatermarkStore,
+    token: str | None = None,
+    start_year: int | None = None,
+    end_year: int | None = None,
+    *,
+    determine_range: Callable[
+        [int | None, int | None], tuple[int, int]
+    ] = determine_year_range,
+    fetch_since: Callable[..., List[Dict]] = fetch_contributions_since,
+    max_workers: int | None = None,
+) -> tuple[int, int, Dict[MonthlyKey, int], Dict[DailyKey, int]]:
+    """Refresh ``username``'s stored counts and return contribution maps.
+
+    The first run (or a run reaching further back than the stored history)
+    fetches everything from ``start_year`` onwards. Later runs only query
+    events created on or after the stored watermark, replace the counts for
+    those days and merge the delta. ``max_workers`` is passed on to
+    ``fetch_since`` when given. The return value matches
+    :func:`~gitshelves.core.contributions.build_contribution_maps`.
+    """
+
+    start_year, end_year = determine_range(start_year, end_year)
+    range_start = date(start_year, 1, 1)
+    state = store.load(username)
+    if state is None or state.start > range_start:
+        state = Watermark(username=username, start=range_start, watermark=range_start)
+    else:
+        state.daily = {
+            key: count
+            for key, count in state.daily.items()
+            if date(*key) < state.watermark
+        }
+
+    since = state.watermark
+    aggregator = ContributionAggregator()
+    newest = since
+    options = {} if max_workers is None else {"max_workers": max_workers}
+    for item in fetch_since(username, since, token, **options):
+        if aggregator.add(item):
+            newest = max(newest, date.fromisoformat(item["created_at"][:10]))
+
+    for key, count in aggregator.daily.items():
+        state.daily[key] = state.daily.get(key, 0) + count
+    state.watermark = newest
+    store.save(state)
+
+    monthly_totals = state.monthly()
+    monthly = {
+        (year, month): monthly_totals.get((year, month), 0)
+        for year in range(start_year, end_year + 1)
+        for month in range(1, 13)
+    }
+    daily = {
+        key: count
+        for key, count in sorted(state.daily.items())
+        if start_year <= key[0] <= end_year
+    }
+    return start_year, end_year, monthly, daily
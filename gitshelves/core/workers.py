@@ -0,0 +1,108 @@
+"""Share one bounded set of worker threads between nested fan-outs."""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator, List, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_local = threading.local()
+
+__all__ = ["WorkerBudget", "current_budget"]
+
+
+def current_budget() -> "WorkerBudget | None":
+    """Return the budget the calling thread is working for, if any."""
+
+    return getattr(_local, "budget", None)
+
+
+class WorkerBudget:
+    """Run nested fan-outs on at most ``max_workers`` threads in total.
+
+    :meth:`map` hands an item to a helper thread only while one of the
+    ``max_workers - 1`` helpers is idle and runs every other item in the
+    calling thread, so sources, years, leaf windows and pages fanned out
+    inside each other never occupy more than ``max_workers`` threads (the
+    caller included). Nobody waits for a free thread, which keeps nested maps
+    from deadlocking on a saturated pool. Threads working for a budget see it
+    through :func:`current_budget`, so nested maps join it instead of
+    starting their own pool.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be positive")
+        self.max_workers = max_workers
+        self._helpers = threading.Semaphore(max_workers - 1)
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+    def __enter__(self) -> "WorkerBudget":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the helper threads once their current items finish."""
+
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    @contextmanager
+    def bound(self) -> Iterator["WorkerBudget"]:
+        """Make this the calling thread's :func:`current_budget`."""
+
+        previous = current_budget()
+        _local.budget = self
+        try:
+            yield self
+        finally:
+            _local.budget = previous
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers - 1,
+                    thread_name_prefix="gitshelves-fetch",
+                )
+            return self._executor
+
+    def _help(self, func: Callable[[T], R], item: T) -> R:
+        try:
+            with self.bound():
+                return func(item)
+        finally:
+            self._helpers.release()
+
+    def map(self, func: Callable[[T], R], items: Iterable[T]) -> List[R]:
+        """Return ``[func(item) for item in items]``, sharing the budget's threads.
+
+        The first exception raised by ``func`` propagates once every item
+        already handed to a helper has finished.
+        """
+
+        items = list(items)
+        results: List[R] = [None] * len(items)  # type: ignore[list-item]
+        futures = {}
+        with self.bound():
+            try:
+                for index, item in enumerate(items):
+                    last = index == len(items) - 1
+                    if not last and self._helpers.acquire(blocking=False):
+                        futures[index] = self._pool().submit(self._help, func, item)
+                    else:
+                        results[index] = func(item)
+            finally:
+                wait(futures.values())
+        for index, future in futures.items():
+            results[index] = future.result()
+        return results
@@ -1,9 +1,47 @@
 from __future__ import annotations
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Sequence, Tuple
+from typing import TYPE_CHECKING, Dict, Sequence, Tuple
 
-from .scad import blocks_for_contributions
+from .scad import levels_for_contributions
+
+if TYPE_CHECKING:  # pragma: no cover - import only needed for annotations
+    from .core.contributions import ContributionStats
+    from .render.levels import LevelScale
+
+
+def _plural(count: int, noun: str) -> str:
+    return f"{count} {noun}{'s' if count != 1 else ''}"
+
+
+def _highlights(stats: ContributionStats) -> list[str]:
+    """Return README bullet points summarising ``stats``."""
+
+    if not stats.active_days:
+        return ["- No contributions recorded"]
+    lines = [
+        f"- Total: {_plural(stats.total, 'contribution')} over "
+        f"{_plural(stats.active_days, 'active day')}",
+        f"- Longest streak: {_plural(stats.longest_streak, 'day')} "
+        f"({stats.longest_streak_start} \u2192 {stats.longest_streak_end})",
+        f"- Busiest day: {stats.busiest_day} with "
+        f"{_plural(stats.busiest_day_count, 'contribution')}",
+    ]
+    if stats.busiest_month is not None:
+        year, month = stats.busiest_month
+        name = datetime(year, month, 1).strftime("%B")
+        lines.append(
+            f"- Busiest month: {name} with "
+            f"{_plural(stats.busiest_month_count, 'contribution')}"
+        )
+    median = stats.percentiles.get(50)
+    high = stats.percentiles.get(90)
+    if median is not None and high is not None:
+        lines.append(
+            f"- Active days: median {_plural(median, 'contribution')}, "
+            f"90th percentile {high}"
+        )
+    return lines
 
 
 def write_year_readme(
@@ -14,6 +52,8 @@ def write_year_readme(
     *,
     include_baseplate_stl: bool = False,
     calendar_slug: str = "monthly-12x6",
+    stats: ContributionStats | None = None,
+    scale: LevelScale | None = None,
 ) -> Path:
     """Write a README detailing materials for ``year``.
 
@@ -25,6 +65,11 @@ def write_year_readme(
     the directory that stores the per-day calendar exports (for example
     ``monthly-12x6`` when the default monthly layout is used). The function
     returns the path to the created file.
+
+    Pass the year's :class:`~gitshelves.core.contributions.ContributionStats`
+    (from :func:`~gitshelves.core.contributions.rollup_contributions`) as
+    ``stats`` to add a highlights section without rescanning the counts.
+    Cube counts use ``scale`` (logarithmic by default).
     """
     path = Path(outdir) / str(year)
     path.mkdir(parents=True, exist_ok=True)
@@ -42,14 +87,18 @@ def write_year_readme(
         "",
         "## Monthly Cubes",
     ]
-    for month in range(1, 13):
-        count = counts.get((year, month), 0)
-        cubes = blocks_for_contributions(count)
+    month_counts = [counts.get((year, month), 0) for month in range(1, 13)]
+    month_cubes = levels_for_contributions(month_counts, scale)
+    for month, count, cubes in zip(range(1, 13), month_counts, month_cubes):
         name = datetime(year, month, 1).strftime("%B")
         lines.append(
             f"- {name}: {count} contribution{'s' if count != 1 else ''} \u2192 {cubes} cube{'s' if cubes != 1 else ''}"
         )
 
+    if stats is not None:
+        lines += ["", "## Highlights"]
+        lines.extend(_highlights(stats))
+
     lines += [
         "",
         "## Versions",
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from .baseplate import load_baseplate_scad
+from .levels import LOG_SCALE, SCALE_NAMES, LevelScale, fit_scale
 from .scad import (
     BLOCK_SIZE,
     GRIDFINITY_BASEPLATE_HEIGHT,
@@ -21,6 +22,7 @@ from .scad import (
     generate_zero_month_annotations,
     group_scad_levels,
     group_scad_levels_with_mapping,
+    levels_for_contributions,
     scad_to_stl,
 )
 from .static import discover_static_scad_files, render_static_stls
@@ -32,7 +34,11 @@ __all__ = [
     "GRIDFINITY_LIBRARY_ROOT",
     "GRIDFINITY_PITCH",
     "GRIDFINITY_UNIT_HEIGHT",
+    "LOG_SCALE",
+    "SCALE_NAMES",
+    "LevelScale",
     "blocks_for_contributions",
+    "fit_scale",
     "generate_contrib_cube_stack_scad",
     "generate_gridfinity_plate_scad",
     "generate_month_calendar_scad",
@@ -43,6 +49,7 @@ __all__ = [
     "generate_zero_month_annotations",
     "group_scad_levels",
     "group_scad_levels_with_mapping",
+    "levels_for_contributions",
     "load_baseplate_scad",
     "discover_static_scad_files",
     "render_static_stls",
@@ -0,0 +1,164 @@
+"""Map contribution counts to block levels with precomputed thresholds.
+
+A :class:`LevelScale` is a strictly increasing tuple of thresholds and a
+count's level is the number of thresholds it reaches, found by binary search
+(or ``numpy.searchsorted`` for large batches when NumPy is installed). The
+default logarithmic scale uses decade thresholds, so levels are exact integer
+comparisons rather than floating-point ``log10`` calls.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+SCALE_NAMES = ("log", "capped-log", "linear", "quantile")
+DEFAULT_SCALE_LEVELS = 5
+"""Levels used by the capped-log, linear and quantile scales by default."""
+
+BATCH_THRESHOLD = 4096
+"""Batches at least this long are mapped with NumPy when it is installed."""
+
+DECADE_THRESHOLDS = tuple(10**power for power in range(19))
+"""``1, 10, ..., 10**18``: reaching the ``n``-th threshold means ``n`` blocks.
+
+The last threshold is the largest power of ten that fits a signed 64-bit
+integer, so larger counts stay at 19 levels on every path.
+"""
+
+__all__ = [
+    "BATCH_THRESHOLD",
+    "DECADE_THRESHOLDS",
+    "DEFAULT_SCALE_LEVELS",
+    "LOG_SCALE",
+    "SCALE_NAMES",
+    "LevelScale",
+    "capped_log_scale",
+    "fit_scale",
+    "linear_scale",
+    "quantile_scale",
+]
+
+
+@dataclass(frozen=True, slots=True)
+class LevelScale:
+    """Thresholds mapping counts to levels; see :func:`fit_scale`.
+
+    ``thresholds[n - 1]`` is the smallest count drawn with ``n`` levels, so
+    the first threshold is normally ``1`` and zero or negative counts map to
+    level ``0``.
+    """
+
+    name: str
+    thresholds: tuple[int, ...]
+
+    def __post_init__(self) -> None:
+        if not self.thresholds or self.thresholds[0] < 1:
+            raise ValueError("thresholds must start at a positive count")
+        if any(a >= b for a, b in zip(self.thresholds, self.thresholds[1:])):
+            raise ValueError("thresholds must be strictly increasing")
+
+    @property
+    def max_level(self) -> int:
+        return len(self.thresholds)
+
+    def level(self, count: int) -> int:
+        """Return the level of a single ``count``."""
+
+        return bisect_right(self.thresholds, count)
+
+    def levels(self, counts: Iterable[int]) -> list[int]:
+        """Return the level of every count in ``counts``, in order."""
+
+        if (
+            np is not None
+            and isinstance(counts, (list, tuple, array))
+            and len(counts) >= BATCH_THRESHOLD
+        ):
+            return np.searchsorted(
+                np.asarray(self.thresholds, dtype=np.int64),
+                np.asarray(counts, dtype=np.int64),
+                side="right",
+            ).tolist()
+        thresholds = self.thresholds
+        return [bisect_right(thresholds, count) for count in counts]
+
+    def to_json(self) -> dict[str, Any]:
+        return {"name": self.name, "thresholds": list(self.thresholds)}
+
+
+LOG_SCALE = LevelScale("log", DECADE_THRESHOLDS)
+"""One block for 1-9 contributions, two for 10-99 and so on."""
+
+
+def _check_levels(max_level: int) -> None:
+    if max_level < 1:
+        raise ValueError("max_level must be positive")
+
+
+def capped_log_scale(max_level: int = DEFAULT_SCALE_LEVELS) -> LevelScale:
+    """Return the logarithmic scale limited to ``max_level`` levels."""
+
+    _check_levels(max_level)
+    return LevelScale("capped-log", DECADE_THRESHOLDS[:max_level])
+
+
+def linear_scale(peak: int, max_level: int = DEFAULT_SCALE_LEVELS) -> LevelScale:
+    """Return equal-width bands so that ``peak`` reaches ``max_level`` levels."""
+
+    _check_levels(max_level)
+    step = max(1, math.ceil(peak / max_level))
+    return LevelScale("linear", tuple(band * step + 1 for band in range(max_level)))
+
+
+def quantile_scale(
+    counts: Iterable[int], max_level: int = DEFAULT_SCALE_LEVELS
+) -> LevelScale:
+    """Return bands holding roughly equal shares of the non-zero ``counts``.
+
+    Band boundaries are nearest-rank quantiles; repeated values collapse
+    bands, so heavily tied data can yield fewer than ``max_level`` levels.
+    """
+
+    _check_levels(max_level)
+    active = sorted(count for count in counts if count > 0)
+    thresholds = {1}
+    for band in range(1, max_level):
+        rank = math.ceil(band * len(active) / max_level)
+        if rank:
+            thresholds.add(active[rank - 1] + 1)
+    if active:
+        thresholds = {value for value in thresholds if value <= active[-1]}
+    return LevelScale("quantile", tuple(sorted(thresholds)))
+
+
+def fit_scale(
+    name: str, counts: Iterable[int] = (), max_level: int | None = None
+) -> LevelScale:
+    """Return the scale called ``name`` (one of :data:`SCALE_NAMES`) for ``counts``.
+
+    ``counts`` is only read by the data-dependent ``linear`` and ``quantile``
+    scales. ``max_level`` defaults to :data:`DEFAULT_SCALE_LEVELS` and cannot
+    be combined with the uncapped ``log`` scale.
+    """
+
+    if name == "log":
+        if max_level is not None:
+            raise ValueError("the log scale is uncapped; use capped-log")
+        return LOG_SCALE
+    levels = DEFAULT_SCALE_LEVELS if max_level is None else max_level
+    if name == "capped-log":
+        return capped_log_scale(levels)
+    if name == "linear":
+        return linear_scale(max(counts, default=0), levels)
+    if name == "quantile":
+        return quantile_scale(counts, levels)
+    raise ValueError(f"unknown scale {name!r}; expected one of {SCALE_NAMES}")
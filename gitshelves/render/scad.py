@@ -5,6 +5,8 @@ from pathlib import Path
 from typing import Dict, Iterable, Iterator, Tuple
 import calendar
 
+from .levels import LOG_SCALE, LevelScale
+
 HEADER = "// Generated by gitshelves"
 BLOCK_SIZE = 10  # mm per block cube
 SPACING = 12
@@ -26,12 +28,18 @@ def blocks_for_contributions(count: int) -> int:
 
     Uses a logarithmic scale where 1 block represents 1-9 contributions,
     2 blocks represent 10-99 contributions, and so on. Zero or negative
-    counts yield zero blocks.
+    counts yield zero blocks. Use :func:`levels_for_contributions` to convert
+    many counts, or to use another scale.
     """
-    if count <= 0:
-        return 0
+    return LOG_SCALE.level(count)
+
+
+def levels_for_contributions(
+    counts: Iterable[int], scale: LevelScale | None = None
+) -> list[int]:
+    """Return the block level of every count on ``scale`` (logarithmic by default)."""
 
-    return int(math.log10(count)) + 1
+    return (scale or LOG_SCALE).levels(counts)
 
 
 @dataclass(frozen=True)
@@ -72,13 +80,30 @@ def _iter_month_slots(
         yield year, month, count, x, y
 
 
+def _iter_month_levels(
+    contributions: Dict[Tuple[int, int], int],
+    months_per_row: int,
+    scale: LevelScale | None = None,
+) -> Iterator[tuple[int, int, int, int, int, int]]:
+    """Yield ``(year, month, count, levels, x, y)``, converting counts in one batch."""
+
+    slots = list(_iter_month_slots(contributions, months_per_row))
+    levels = levels_for_contributions([slot[2] for slot in slots], scale)
+    for (year, month, count, x, y), level in zip(slots, levels):
+        yield year, month, count, level, x, y
+
+
 def _iter_monthly_block_positions(
-    contributions: Dict[Tuple[int, int], int], months_per_row: int
+    contributions: Dict[Tuple[int, int], int],
+    months_per_row: int,
+    scale: LevelScale | None = None,
 ) -> Iterator[_BlockPosition]:
     """Yield ``_BlockPosition`` objects for monthly contributions."""
 
-    for year, month, count, x, y in _iter_month_slots(contributions, months_per_row):
-        for level in range(blocks_for_contributions(count)):
+    for year, month, _count, levels, x, y in _iter_month_levels(
+        contributions, months_per_row, scale
+    ):
+        for level in range(levels):
             z = level * BLOCK_SIZE
             yield _BlockPosition(x, y, z, year, month, level)
 
@@ -91,10 +116,12 @@ def _format_block(pos: _BlockPosition) -> str:
 
 
 def _iter_monthly_block_lines(
-    contributions: Dict[Tuple[int, int], int], months_per_row: int
+    contributions: Dict[Tuple[int, int], int],
+    months_per_row: int,
+    scale: LevelScale | None = None,
 ) -> Iterator[tuple[int, str]]:
     """Yield block level and formatted line for monthly contributions."""
-    for pos in _iter_monthly_block_positions(contributions, months_per_row):
+    for pos in _iter_monthly_block_positions(contributions, months_per_row, scale):
         yield pos.level, _format_block(pos)
 
 
@@ -103,6 +130,8 @@ def generate_month_calendar_scad(
     year: int,
     month: int,
     days_per_row: int = 5,
+    *,
+    scale: LevelScale | None = None,
 ) -> str:
     """Return a SCAD script visualising a single month's daily contributions."""
 
@@ -110,10 +139,15 @@ def generate_month_calendar_scad(
         raise ValueError("days_per_row must be positive")
 
     days_in_month = calendar.monthrange(year, month)[1]
+    counts = [
+        daily_contributions.get((year, month, day), 0)
+        for day in range(1, days_in_month + 1)
+    ]
     lines = [HEADER]
-    for day in range(1, days_in_month + 1):
-        count = daily_contributions.get((year, month, day), 0)
-        idx = day - 1
+    for idx, (count, levels) in enumerate(
+        zip(counts, levels_for_contributions(counts, scale))
+    ):
+        day = idx + 1
         col = idx % days_per_row
         row = idx // days_per_row
         x = col * SPACING
@@ -126,7 +160,7 @@ def generate_month_calendar_scad(
                 )
             )
             continue
-        for level in range(blocks_for_contributions(count)):
+        for level in range(levels):
             z = level * BLOCK_SIZE
             lines.append(
                 (
@@ -142,30 +176,37 @@ def generate_monthly_calendar_scads(
     daily_contributions: Dict[Tuple[int, int, int], int],
     year: int,
     days_per_row: int = 5,
+    *,
+    scale: LevelScale | None = None,
 ) -> Dict[int, str]:
     """Return SCAD scripts for each month of ``year`` using daily data."""
 
     calendars: Dict[int, str] = {}
     for month in range(1, 13):
         calendars[month] = generate_month_calendar_scad(
-            daily_contributions, year, month, days_per_row=days_per_row
+            daily_contributions, year, month, days_per_row=days_per_row, scale=scale
         )
     return calendars
 
 
-def generate_scad(contributions: Iterable[int]) -> str:
+def generate_scad(
+    contributions: Iterable[int], *, scale: LevelScale | None = None
+) -> str:
     """Generate an OpenSCAD script for a sequence of daily contributions."""
     scad_lines = [HEADER]
-    for idx, count in enumerate(contributions):
+    for idx, levels in enumerate(levels_for_contributions(contributions, scale)):
         x = idx * SPACING
-        for level in range(blocks_for_contributions(count)):
+        for level in range(levels):
             z = level * BLOCK_SIZE
             scad_lines.append(f"translate([{x}, 0, {z}]) cube({BLOCK_SIZE});")
     return "\n".join(scad_lines)
 
 
 def generate_scad_monthly(
-    contributions: Dict[Tuple[int, int], int], months_per_row: int = 12
+    contributions: Dict[Tuple[int, int], int],
+    months_per_row: int = 12,
+    *,
+    scale: LevelScale | None = None,
 ) -> str:
     """Generate an OpenSCAD script from monthly contribution counts.
 
@@ -173,11 +214,13 @@ def generate_scad_monthly(
     months are arranged left-to-right in rows of ``months_per_row`` slots. Each
     slot contains a stack of blocks on a logarithmic scale, so a month with
     1‑9 contributions shows one block, 10‑99 contributions shows two blocks, and
-    so on.
+    so on. Pass a :class:`~gitshelves.render.levels.LevelScale` as ``scale`` to
+    stack blocks on another scale.
     """
     scad_lines = [HEADER]
-    for year, month, count, x, y in _iter_month_slots(contributions, months_per_row):
-        levels = blocks_for_contributions(count)
+    for year, month, _count, levels, x, y in _iter_month_levels(
+        contributions, months_per_row, scale
+    ):
         if levels == 0:
             scad_lines.append(
                 f"// {year}-{month:02} (0 contributions) reserved at [{x}, {y}]"
@@ -205,7 +248,10 @@ def generate_zero_month_annotations(
 
 
 def generate_scad_monthly_levels(
-    contributions: Dict[Tuple[int, int], int], months_per_row: int = 12
+    contributions: Dict[Tuple[int, int], int],
+    months_per_row: int = 12,
+    *,
+    scale: LevelScale | None = None,
 ) -> Dict[int, str]:
     """Return OpenSCAD scripts grouped by block level.
 
@@ -213,7 +259,7 @@ def generate_scad_monthly_levels(
     This allows printing different contribution magnitudes in separate colors.
     """
     levels: Dict[int, list[str]] = defaultdict(list)
-    for level, line in _iter_monthly_block_lines(contributions, months_per_row):
+    for level, line in _iter_monthly_block_lines(contributions, months_per_row, scale):
         levels[level + 1].append(line)
 
     return {lvl: HEADER + "\n" + "\n".join(lines) for lvl, lines in levels.items()}
@@ -312,6 +358,8 @@ def generate_gridfinity_plate_scad(
     contributions: Dict[Tuple[int, int], int],
     year: int,
     columns: int = 6,
+    *,
+    scale: LevelScale | None = None,
 ) -> str:
     """Return a Gridfinity-compatible SCAD for ``year`` contributions.
 
@@ -396,12 +444,12 @@ def generate_gridfinity_plate_scad(
         "                         screw_holes = false);",
     ]
 
-    for idx, (month, count) in enumerate(months):
+    month_levels = levels_for_contributions([count for _, count in months], scale)
+    for idx, ((month, count), levels) in enumerate(zip(months, month_levels)):
         col = idx % columns
         row = idx // columns
         x = col * GRIDFINITY_PITCH
         y = row * GRIDFINITY_PITCH
-        levels = blocks_for_contributions(count)
         if levels == 0:
             lines.append(
                 f"    // {year}-{month:02} (0 contributions) reserved at [{x}, {y}]"
@@ -1,6 +1,48 @@
 import pytest
 
 from gitshelves import scad as scad_module
+from gitshelves.core import github
+
+
+@pytest.fixture(autouse=True)
+def unpaced_rate_limiter(monkeypatch):
+    """Disable request pacing so fetch tests do not sleep."""
+
+    monkeypatch.setattr(github, "rate_limiter", github.RateLimiter(rate=None))
+    yield
+
+
+@pytest.fixture(autouse=True)
+def clear_fetch_cache():
+    """Start and end every test with an empty in-memory contribution cache."""
+
+    github.contribution_cache.clear()
+    yield
+    github.contribution_cache.clear()
+
+
+class FakeSession:
+    """Stand-in for ``requests.Session`` that routes ``get`` to a callable."""
+
+    def __init__(self, get):
+        self.get = get
+
+
+class FakeResponse:
+    """Search API response carrying ``items`` with optional headers and links."""
+
+    def __init__(self, items, *, status_code=200, headers=None, links=None):
+        self._items = items
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.links = links or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise AssertionError(f"unexpected status {self.status_code}")
+
+    def json(self):
+        return {"items": self._items}
 
 
 @pytest.fixture
@@ -1,6 +1,7 @@
 import argparse
 import json
 import runpy
+import subprocess
 import sys
 import types
 from pathlib import Path
@@ -29,6 +30,17 @@ def test_cli_generate_contrib_cube_stack_scad_delegates(monkeypatch):
     assert cli.generate_contrib_cube_stack_scad(2) == "stub-2"
 
 
+def test_cli_iter_user_contributions_delegates(monkeypatch):
+    stub = types.SimpleNamespace(
+        iter_user_contributions=lambda *args, **kwargs: iter([(args, kwargs)])
+    )
+    monkeypatch.setitem(sys.modules, "gitshelves.fetch", stub)
+
+    assert list(cli.iter_user_contributions("me", start_year=2024)) == [
+        (("me",), {"start_year": 2024})
+    ]
+
+
 def test_cli_scad_to_stl_delegates(monkeypatch):
     calls: list[tuple[tuple, dict]] = []
 
@@ -278,6 +290,7 @@ def test_cli_defaults_calendar_days_per_row_matches_months_per_row(
         *,
         include_baseplate_stl=False,
         calendar_slug=calendar_slug(),
+        stats=None,
     ):
         path = tmp_path / "stl" / str(year) / "README.md"
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -340,6 +353,7 @@ def test_cli_defaults_calendar_days_per_row_respects_narrow_months(
         *,
         include_baseplate_stl=False,
         calendar_slug=calendar_slug(args.months_per_row),
+        stats=None,
     ):
         path = tmp_path / "stl" / str(year) / "README.md"
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -453,6 +467,7 @@ def test_cli_writes_run_summary(tmp_path, monkeypatch, capsys):
         *,
         include_baseplate_stl=False,
         calendar_slug=calendar_slug(),
+        stats=None,
     ):
         path = tmp_path / "stl" / str(year) / "README.md"
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -620,6 +635,7 @@ def test_cli_defaults_calendar_width_to_months_per_row(tmp_path, monkeypatch):
         *,
         include_baseplate_stl=False,
         calendar_slug=calendar_slug(),
+        stats=None,
     ):
         captured_slug["year"] = year
         captured_slug["slug"] = calendar_slug
@@ -1257,6 +1273,7 @@ def test_cli_single_color_removes_multicolor_baseplate(tmp_path, monkeypatch):
         *,
         include_baseplate_stl=False,
         calendar_slug=calendar_slug(),
+        stats=None,
     ):
         path = tmp_path / "stl" / str(year) / "README.md"
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -1622,6 +1639,7 @@ def test_cli_metadata_records_color_groups(tmp_path, monkeypatch):
         *,
         include_baseplate_stl=False,
         calendar_slug=calendar_slug(),
+        stats=None,
     ):
         path = tmp_path / "stl" / str(year) / "README.md"
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -1710,6 +1728,7 @@ def test_cli_rolls_high_levels_into_accent_group(tmp_path, monkeypatch):
         *,
         include_baseplate_stl=False,
         calendar_slug=calendar_slug(),
+        stats=None,
     ):
         path = tmp_path / "stl" / str(year) / "README.md"
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -1786,6 +1805,7 @@ def test_cli_supports_four_block_colors(tmp_path, monkeypatch, capsys):
         *,
         include_baseplate_stl=False,
         calendar_slug=calendar_slug(),
+        stats=None,
     ):
         path = tmp_path / "stl" / str(year) / "README.md"
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -1947,6 +1967,7 @@ def test_cli_multiple_colors_baseplate_typeerror_falls_back(tmp_path, monkeypatc
         *,
         include_baseplate_stl=False,
         calendar_slug=calendar_slug(),
+        stats=None,
     ):
         path = tmp_path / "stl" / str(year) / "README.md"
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -2029,7 +2050,7 @@ def test_cli_multiple_colors_without_stl(tmp_path, monkeypatch, capsys):
     monkeypatch.setattr(
         cli,
         "write_year_readme",
-        lambda y, c, extras=None, include_baseplate_stl=False, calendar_slug=calendar_slug(): tmp_path
+        lambda y, c, extras=None, include_baseplate_stl=False, calendar_slug=calendar_slug(), stats=None: tmp_path
         / "dummy",
     )
 
@@ -2118,6 +2139,7 @@ def test_cli_multicolor_removes_single_color_export(tmp_path, monkeypatch):
         *,
         include_baseplate_stl=False,
         calendar_slug=calendar_slug(),
+        stats=None,
     ):
         year_dir = tmp_path / "stl" / str(year)
         year_dir.mkdir(parents=True, exist_ok=True)
@@ -2207,6 +2229,7 @@ def test_cli_multi_color_removes_stale_color_files(tmp_path, monkeypatch):
         *,
         include_baseplate_stl=False,
         calendar_slug=calendar_slug(),
+        stats=None,
     ):
         path = tmp_path / "stl" / str(year) / "README.md"
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -2296,7 +2319,7 @@ def test_cli_multi_color_without_stl_removes_lingering_color_meshes(
     monkeypatch.setattr(
         cli,
         "write_year_readme",
-        lambda year, counts, extras=None, include_baseplate_stl=False, calendar_slug=calendar_slug(): tmp_path
+        lambda year, counts, extras=None, include_baseplate_stl=False, calendar_slug=calendar_slug(), stats=None: tmp_path
         / "stl"
         / str(year)
         / "README.md",
@@ -2491,6 +2514,7 @@ def test_cli_colors_with_more_levels_than_groups(tmp_path, monkeypatch, capsys):
         *,
         include_baseplate_stl=False,
         calendar_slug=calendar_slug(),
+        stats=None,
     ):
         path = tmp_path / "stl" / str(year) / "README.md"
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -2570,6 +2594,7 @@ def test_cli_writes_readmes_for_full_range(tmp_path, monkeypatch):
         *,
         include_baseplate_stl=False,
         calendar_slug=calendar_slug(),
+        stats=None,
     ):
         called_years.append(year)
         return tmp_path / str(year) / "README.md"
@@ -2808,6 +2833,7 @@ def test_cli_writes_readme_when_no_contributions(tmp_path, monkeypatch):
         *,
         include_baseplate_stl=False,
         calendar_slug=calendar_slug(),
+        stats=None,
     ):
         captured.append((year, dict(counts)))
         return tmp_path / str(year) / "README.md"
@@ -4055,3 +4081,718 @@ def test_cli_help_mentions_env_vars():
     )
     assert "GH_TOKEN" in result.stdout
     assert "GITHUB_TOKEN" in result.stdout
+
+
+def test_cli_passes_cache_options(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    calls = []
+
+    def fake_fetch(username, **kwargs):
+        calls.append(kwargs)
+        return []
+
+    monkeypatch.setattr(cli, "fetch_user_contributions", fake_fetch)
+    monkeypatch.setattr(cli, "scad_to_stl", lambda *a, **k: None)
+
+    cli.main(
+        [
+            "me",
+            "--start-year",
+            "2021",
+            "--end-year",
+            "2021",
+            "--cache-dir",
+            str(tmp_path / "cache"),
+            "--cache-ttl",
+            "60",
+        ]
+    )
+
+    assert calls[0]["cache_dir"] == str(tmp_path / "cache")
+    assert calls[0]["cache_ttl"] == 60.0
+
+
+def test_cli_rejects_negative_cache_ttl(monkeypatch):
+    monkeypatch.setattr(cli, "fetch_user_contributions", lambda *a, **k: [])
+
+    with pytest.raises(SystemExit):
+        cli.main(["me", "--cache-dir", "cache", "--cache-ttl", "-1"])
+
+
+def test_cli_passes_worker_count(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    calls = []
+
+    def fake_fetch(username, **kwargs):
+        calls.append(kwargs)
+        return []
+
+    monkeypatch.setattr(cli, "fetch_user_contributions", fake_fetch)
+    monkeypatch.setattr(cli, "scad_to_stl", lambda *a, **k: None)
+
+    cli.main(["me", "--start-year", "2021", "--end-year", "2021", "--workers", "8"])
+
+    assert calls[0]["max_workers"] == 8
+    assert "cache_dir" not in calls[0]
+
+
+def test_cli_rejects_non_positive_workers(monkeypatch):
+    monkeypatch.setattr(cli, "fetch_user_contributions", lambda *a, **k: [])
+
+    with pytest.raises(SystemExit):
+        cli.main(["me", "--workers", "0"])
+
+
+def test_cli_stream_feeds_generator_to_aggregation(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    consumed = []
+
+    def fake_iter(username, **kwargs):
+        for day in ("2021-01-01", "2021-01-02"):
+            consumed.append(day)
+            yield {"created_at": f"{day}T00:00:00Z"}
+
+    def fail_fetch(*_args, **_kwargs):  # pragma: no cover - should not be called
+        raise AssertionError("buffered fetch not expected")
+
+    monkeypatch.setattr(cli, "iter_user_contributions", fake_iter)
+    monkeypatch.setattr(cli, "fetch_user_contributions", fail_fetch)
+    monkeypatch.setattr(cli, "scad_to_stl", lambda *a, **k: None)
+
+    cli.main(
+        [
+            "me",
+            "--start-year",
+            "2021",
+            "--end-year",
+            "2021",
+            "--stream",
+            "--json",
+            "s.json",
+        ]
+    )
+
+    summary = json.loads((tmp_path / "s.json").read_text())
+    monthly = summary["outputs"][-1]["monthly_contributions"]
+    assert consumed == ["2021-01-01", "2021-01-02"]
+    assert monthly[0]["count"] == 2
+
+
+@pytest.mark.parametrize(
+    "extra, message",
+    [
+        (["--cache-dir", "cache"], "--stream bypasses the search cache"),
+        (["--refresh-cache"], "--stream bypasses the search cache"),
+        (["--workers", "2"], "--stream fetches one page at a time"),
+    ],
+)
+def test_cli_stream_rejects_cache_and_worker_options(
+    monkeypatch, capsys, extra, message
+):
+    monkeypatch.setattr(cli, "iter_user_contributions", lambda *a, **k: iter(()))
+
+    with pytest.raises(SystemExit):
+        cli.main(["me", "--stream", *extra])
+
+    assert message in capsys.readouterr().err
+
+
+def test_cli_state_dir_uses_incremental_refresh(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    calls = []
+
+    def fake_refresh(username, store, token, start, end, determine_range):
+        calls.append((username, store.directory, start, end))
+        monthly = {(2021, month): 0 for month in range(1, 13)}
+        monthly[(2021, 4)] = 3
+        return 2021, 2021, monthly, {(2021, 4, 1): 3}
+
+    def fail_fetch(*_args, **_kwargs):  # pragma: no cover - should not be called
+        raise AssertionError("full fetch not expected")
+
+    monkeypatch.setattr(cli, "refresh_contribution_maps", fake_refresh)
+    monkeypatch.setattr(cli, "fetch_user_contributions", fail_fetch)
+    monkeypatch.setattr(cli, "scad_to_stl", lambda *a, **k: None)
+
+    cli.main(
+        [
+            "me",
+            "--start-year",
+            "2021",
+            "--end-year",
+            "2021",
+            "--state-dir",
+            str(tmp_path / "state"),
+        ]
+    )
+
+    assert calls == [("me", tmp_path / "state", 2021, 2021)]
+    assert "April: 3 contributions" in (tmp_path / "stl/2021/README.md").read_text()
+
+
+def test_cli_state_dir_rejects_stream(monkeypatch):
+    with pytest.raises(SystemExit):
+        cli.main(["me", "--stream", "--state-dir", "state"])
+
+
+@pytest.mark.parametrize("flags", [["--cache-dir", "cache"], ["--refresh-cache"]])
+def test_cli_state_dir_rejects_search_cache_flags(flags):
+    with pytest.raises(SystemExit):
+        cli.main(["me", "--state-dir", "state", *flags])
+
+
+def test_cli_state_dir_passes_workers(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    calls = []
+
+    def fake_refresh(username, store, token, start, end, determine_range, **kw):
+        calls.append(kw)
+        return 2021, 2021, {(2021, month): 0 for month in range(1, 13)}, {}
+
+    monkeypatch.setattr(cli, "refresh_contribution_maps", fake_refresh)
+    monkeypatch.setattr(cli, "scad_to_stl", lambda *a, **k: None)
+
+    cli.main(["me", "--state-dir", "state", "--workers", "2", "--end-year", "2021"])
+
+    assert calls == [{"max_workers": 2}]
+
+
+def test_cli_passes_refresh_cache(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    calls = []
+
+    def fake_fetch(username, **kwargs):
+        calls.append(kwargs)
+        return []
+
+    monkeypatch.setattr(cli, "fetch_user_contributions", fake_fetch)
+    monkeypatch.setattr(cli, "scad_to_stl", lambda *a, **k: None)
+
+    cli.main(["me", "--start-year", "2021", "--end-year", "2021", "--refresh-cache"])
+
+    assert calls[0]["refresh"] is True
+
+
+def test_cli_token_file_builds_token_pool(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("GH_TOKENS", raising=False)
+    monkeypatch.delenv("GH_TOKEN", raising=False)
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    token_file = tmp_path / "tokens.txt"
+    token_file.write_text("one\ntwo\n")
+    calls = []
+
+    def fake_fetch(username, token=None, **kwargs):
+        calls.append(token)
+        return []
+
+    monkeypatch.setattr(cli, "fetch_user_contributions", fake_fetch)
+    monkeypatch.setattr(cli, "scad_to_stl", lambda *a, **k: None)
+
+    cli.main(
+        [
+            "me",
+            "--start-year",
+            "2021",
+            "--end-year",
+            "2021",
+            "--token-file",
+            str(token_file),
+        ]
+    )
+
+    assert isinstance(calls[0], cli.TokenPool)
+    assert calls[0].tokens == ("one", "two")
+
+
+@pytest.mark.parametrize(
+    "contents, expected", [("solo\n", "solo"), ("# no tokens yet\n", None)]
+)
+def test_cli_token_file_without_pool(tmp_path, monkeypatch, contents, expected):
+    monkeypatch.chdir(tmp_path)
+    for name in ("GH_TOKENS", "GH_TOKEN", "GITHUB_TOKEN"):
+        monkeypatch.delenv(name, raising=False)
+    token_file = tmp_path / "tokens.txt"
+    token_file.write_text(contents)
+    calls = []
+
+    def fake_fetch(username, token=None, **kwargs):
+        calls.append(token)
+        return []
+
+    monkeypatch.setattr(cli, "fetch_user_contributions", fake_fetch)
+    monkeypatch.setattr(cli, "scad_to_stl", lambda *a, **k: None)
+
+    cli.main(["me", "--end-year", "2021", "--token-file", str(token_file)])
+
+    assert calls == [expected]
+
+
+def test_cli_rejects_missing_token_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(cli, "fetch_user_contributions", lambda *a, **k: [])
+
+    with pytest.raises(SystemExit):
+        cli.main(["me", "--token-file", str(tmp_path / "missing.txt")])
+
+
+def test_cli_passes_local_repositories(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    clone = tmp_path / "mirrors" / "alpha"
+    (clone / ".git").mkdir(parents=True)
+    calls = []
+
+    def fake_fetch(username, **kwargs):
+        calls.append(kwargs)
+        return [{"created_at": "2021-02-03T00:00:00Z"}]
+
+    monkeypatch.setattr(cli, "fetch_user_contributions", fake_fetch)
+    monkeypatch.setattr(cli, "scad_to_stl", lambda *a, **k: None)
+
+    cli.main(
+        [
+            "me",
+            "--start-year",
+            "2021",
+            "--end-year",
+            "2021",
+            "--local-repos",
+            str(tmp_path / "mirrors"),
+            "--git-author",
+            "me@example.com",
+        ]
+    )
+
+    assert calls[0]["repositories"] == [clone.resolve()]
+    assert calls[0]["author"] == "me@example.com"
+
+
+@pytest.mark.parametrize("make_dir", [False, True])
+def test_cli_rejects_local_repos_without_repositories(
+    tmp_path, monkeypatch, capsys, make_dir
+):
+    target = tmp_path / "mirrors"
+    if make_dir:
+        target.mkdir()
+    monkeypatch.setattr(cli, "fetch_user_contributions", lambda *a, **k: [])
+
+    with pytest.raises(SystemExit):
+        cli.main(["me", "--local-repos", str(target)])
+
+    message = "found no git repositories" if make_dir else "is not a directory"
+    assert message in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("flag", [["--stream"], ["--state-dir", "state"]])
+def test_cli_rejects_local_repos_with_remote_modes(flag):
+    with pytest.raises(SystemExit):
+        cli.main(["me", "--local-repos", "mirrors", *flag])
+
+
+def test_cli_reports_git_failures(tmp_path, monkeypatch, capsys):
+    (tmp_path / "broken" / ".git").mkdir(parents=True)
+
+    def failing_fetch(*_args, **_kwargs):
+        raise subprocess.CalledProcessError(
+            128, ["git", "log"], stderr="fatal: not a git repository\n"
+        )
+
+    monkeypatch.setattr(cli, "fetch_user_contributions", failing_fetch)
+
+    with pytest.raises(SystemExit):
+        cli.main(["me", "--local-repos", str(tmp_path / "broken")])
+
+    assert "fatal: not a git repository" in capsys.readouterr().err
+
+
+def test_cli_rejects_git_author_without_local_repos(monkeypatch):
+    monkeypatch.setattr(cli, "fetch_user_contributions", lambda *a, **k: [])
+
+    with pytest.raises(SystemExit):
+        cli.main(["me", "--git-author", "me"])
+
+
+def test_cli_ingest_then_render_from_store(tmp_path, monkeypatch, capsys):
+    import gzip
+
+    monkeypatch.chdir(tmp_path)
+    archive = tmp_path / "2021-05-01-12.json.gz"
+    with gzip.open(archive, "wt", encoding="utf-8") as handle:
+        event = {
+            "type": "IssuesEvent",
+            "actor": {"login": "me"},
+            "payload": {"action": "opened"},
+            "created_at": "2021-05-01T12:00:00Z",
+        }
+        handle.write(json.dumps(event) + "\n")
+
+    def fail_fetch(*_args, **_kwargs):  # pragma: no cover - should not be called
+        raise AssertionError("API fetch not expected")
+
+    monkeypatch.setattr(cli, "fetch_user_contributions", fail_fetch)
+    monkeypatch.setattr(cli, "scad_to_stl", lambda *a, **k: None)
+
+    cli.main(["ingest", str(archive), "--store", "store", "--actor", "me"])
+    assert "Ingested 1 events for 1 users" in capsys.readouterr().out
+
+    cli.main(
+        [
+            "me",
+            "--start-year",
+            "2021",
+            "--end-year",
+            "2021",
+            "--contribution-store",
+            "store",
+            "--json",
+            "summary.json",
+        ]
+    )
+
+    summary = json.loads((tmp_path / "summary.json").read_text())
+    daily = summary["outputs"][0]["daily_contributions"]
+    assert daily == [{"blocks": 1, "count": 1, "day": 1, "month": 5, "year": 2021}]
+
+
+def test_cli_ingest_requires_actors(tmp_path):
+    with pytest.raises(SystemExit):
+        cli.main(["ingest", str(tmp_path), "--store", "store"])
+
+
+@pytest.mark.parametrize(
+    "extra", [["--stream"], ["--state-dir", "state"], ["--local-repos", "."]]
+)
+def test_cli_contribution_store_rejects_other_modes(capsys, extra):
+    with pytest.raises(SystemExit):
+        cli.main(["me", "--contribution-store", "store", *extra])
+
+    assert "--contribution-store cannot be combined" in capsys.readouterr().err
+
+
+def test_cli_contribution_store_must_be_a_database(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "notes.db").write_text("not a database\n" * 100)
+
+    with pytest.raises(SystemExit):
+        cli.main(["me", "--contribution-store", "notes.db"])
+
+    assert "notes.db is not a SQLite store" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("store", ["typo.db", "typo-dir"])
+def test_cli_contribution_store_must_exist(tmp_path, monkeypatch, capsys, store):
+    monkeypatch.chdir(tmp_path)
+
+    with pytest.raises(SystemExit):
+        cli.main(["me", "--contribution-store", store])
+
+    assert "--contribution-store could not be opened" in capsys.readouterr().err
+    assert not (tmp_path / store).exists()
+
+
+def _write_ingest_archive(path, login="me"):
+    import gzip
+
+    with gzip.open(path, "wt", encoding="utf-8") as handle:
+        event = {
+            "type": "IssuesEvent",
+            "actor": {"login": login},
+            "payload": {"action": "opened"},
+            "created_at": "2021-05-01T12:00:00Z",
+        }
+        handle.write(json.dumps(event) + "\n")
+    return path
+
+
+def test_cli_ingest_reads_actors_file_and_skips_ingested(tmp_path, capsys):
+    archive = _write_ingest_archive(tmp_path / "2021-05-01-12.json.gz", "hubot")
+    actors = tmp_path / "actors.txt"
+    actors.write_text("# team\nhubot\n\n")
+    store = tmp_path / "store"
+    argv = ["ingest", str(archive), "--store", str(store), "--actors-file", str(actors)]
+
+    assert cli.main(argv) == 0
+    assert "Ingested 1 events for 1 users from 1 archives" in capsys.readouterr().out
+    assert cli.main(argv) == 0
+    assert "from 0 archives (1 already ingested)" in capsys.readouterr().out
+    assert cli.main([*argv, "--force", "--workers", "1"]) == 0
+    assert "Ingested 1 events" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize(
+    "extra, message",
+    [
+        (["--actors-file", "missing.txt"], "--actors-file could not be read"),
+        (["--actors-file", "binary.txt"], "--actors-file could not be read"),
+        (["--actor", "me", "--workers", "0"], "--workers must be positive"),
+        (["--actor", "me", "missing.json.gz"], "missing.json.gz does not exist"),
+    ],
+)
+def test_cli_ingest_reports_usage_errors(tmp_path, monkeypatch, capsys, extra, message):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "binary.txt").write_bytes(b"\xff\xfe\x00")
+    archive = _write_ingest_archive(tmp_path / "2021-05-01-12.json.gz")
+
+    with pytest.raises(SystemExit):
+        cli.main(["ingest", *extra, str(archive), "--store", "store"])
+
+    assert message in capsys.readouterr().err
+
+
+def test_cli_passes_sources_and_reports_breakdown(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    calls = []
+
+    def fake_fetch(username, **kwargs):
+        calls.append(kwargs)
+        return [
+            {"created_at": "2021-02-03T00:00:00Z", "source": "prs"},
+            {"created_at": "2021-02-03T01:00:00Z", "source": "commits"},
+        ]
+
+    monkeypatch.setattr(cli, "fetch_user_contributions", fake_fetch)
+    monkeypatch.setattr(cli, "scad_to_stl", lambda *a, **k: None)
+
+    cli.main(
+        [
+            "me",
+            "--start-year",
+            "2021",
+            "--end-year",
+            "2021",
+            "--sources",
+            "prs",
+            "commits",
+            "--json",
+            "summary.json",
+        ]
+    )
+
+    assert calls[0]["sources"] == ["prs", "commits"]
+    summary = json.loads((tmp_path / "summary.json").read_text())
+    assert summary["fetch"]["requests"] == 0
+    assert summary["sources"] == ["commits", "prs"]
+    daily = summary["outputs"][0]["daily_contributions"]
+    assert daily[0]["sources"] == {"commits": 1, "prs": 1}
+
+
+def test_cli_rejects_sources_with_stream(monkeypatch):
+    monkeypatch.setattr(cli, "fetch_user_contributions", lambda *a, **k: [])
+
+    with pytest.raises(SystemExit):
+        cli.main(["me", "--sources", "prs", "--stream"])
+
+
+def test_cli_merges_team_members(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "team.txt").write_text("carol  # on leave\n")
+    fetched = {
+        "alice": ["2021-02-03T00:00:00Z"],
+        "bob": ["2021-02-03T05:00:00Z", "2021-03-01T00:00:00Z"],
+        "carol": [],
+    }
+    calls = []
+
+    def fake_fetch(username, **kwargs):
+        calls.append((username, kwargs["start_year"], kwargs["end_year"]))
+        return [{"created_at": stamp} for stamp in fetched[username]]
+
+    monkeypatch.setattr(cli, "fetch_user_contributions", fake_fetch)
+    monkeypatch.setattr(cli, "scad_to_stl", lambda *a, **k: None)
+
+    cli.main(
+        [
+            "core-team",
+            "--start-year",
+            "2021",
+            "--end-year",
+            "2021",
+            "--members",
+            "alice",
+            "bob",
+            "--members-file",
+            "team.txt",
+            "--json",
+            "summary.json",
+        ]
+    )
+
+    assert sorted(calls) == [
+        ("alice", 2021, 2021),
+        ("bob", 2021, 2021),
+        ("carol", 2021, 2021),
+    ]
+    summary = json.loads((tmp_path / "summary.json").read_text())
+    assert summary["username"] == "core-team"
+    assert summary["members"] == ["alice", "bob"]
+    monthly = {
+        (entry["year"], entry["month"]): entry
+        for entry in summary["outputs"][0]["monthly_contributions"]
+    }
+    assert monthly[(2021, 2)]["count"] == 2
+    assert monthly[(2021, 2)]["members"] == {"alice": 1, "bob": 1}
+    assert monthly[(2021, 4)]["members"] == {}
+    assert "sources" not in monthly[(2021, 2)]
+
+
+def test_cli_rejects_members_with_stream(monkeypatch):
+    monkeypatch.setattr(cli, "fetch_user_contributions", lambda *a, **k: [])
+
+    with pytest.raises(SystemExit):
+        cli.main(["team", "--members", "alice", "--stream"])
+
+
+@pytest.mark.parametrize(
+    "content, message",
+    [
+        (None, "--members-file could not be read"),
+        (b"\xff\xfe\x00", "--members-file could not be read"),
+        (b"# nobody yet\n", "--members-file does not list any members"),
+    ],
+)
+def test_cli_reports_unusable_members_files(
+    tmp_path, monkeypatch, capsys, content, message
+):
+    monkeypatch.chdir(tmp_path)
+    if content is not None:
+        (tmp_path / "team.txt").write_bytes(content)
+
+    with pytest.raises(SystemExit):
+        cli.main(["team", "--members-file", "team.txt"])
+
+    assert message in capsys.readouterr().err
+
+
+def test_cli_reads_team_members_from_store(tmp_path, monkeypatch):
+    from gitshelves.core.sqlstore import SQLiteContributionStore
+
+    monkeypatch.chdir(tmp_path)
+    SQLiteContributionStore(tmp_path / "fleet.db").merge_many(
+        {"alice": {(2021, 5, 1): 2}, "bob": {(2021, 5, 1): 1, (2021, 6, 2): 3}}
+    )
+    budgets = []
+    real_load = cli.load_member_grids
+
+    def spy_load(members, load, *, max_workers):
+        budgets.append(max_workers)
+        return real_load(members, load, max_workers=max_workers)
+
+    def fail_fetch(*_args, **_kwargs):  # pragma: no cover - should not be called
+        raise AssertionError("API fetch not expected")
+
+    monkeypatch.setattr(cli, "load_member_grids", spy_load)
+    monkeypatch.setattr(cli, "fetch_user_contributions", fail_fetch)
+    monkeypatch.setattr(cli, "scad_to_stl", lambda *a, **k: None)
+
+    for extra in ([], ["--workers", "2"]):
+        cli.main(
+            [
+                "team",
+                "--start-year",
+                "2021",
+                "--end-year",
+                "2021",
+                "--members",
+                "alice",
+                "bob",
+                "--contribution-store",
+                "fleet.db",
+                "--json",
+                "summary.json",
+                *extra,
+            ]
+        )
+
+    assert budgets == [cli.TEAM_WORKERS, 2]
+    summary = json.loads((tmp_path / "summary.json").read_text())
+    daily = summary["outputs"][0]["daily_contributions"]
+    assert [(entry["month"], entry["count"]) for entry in daily] == [(5, 3), (6, 3)]
+    assert daily[0]["members"] == {"alice": 2, "bob": 1}
+
+
+def test_cli_scale_flag_changes_levels(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    stamps = ["2021-01-01T00:00:00Z"] * 40 + ["2021-02-01T00:00:00Z"] * 5
+    monkeypatch.setattr(
+        cli,
+        "fetch_user_contributions",
+        lambda *a, **k: [{"created_at": stamp} for stamp in stamps],
+    )
+    monkeypatch.setattr(cli, "scad_to_stl", lambda *a, **k: None)
+    monkeypatch.setattr(
+        cli, "generate_contrib_cube_stack_scad", lambda levels: f"// {levels}"
+    )
+
+    cli.main(
+        [
+            "me",
+            "--start-year",
+            "2021",
+            "--end-year",
+            "2021",
+            "--scale",
+            "linear",
+            "--scale-levels",
+            "4",
+            "--gridfinity-cubes",
+            "--json",
+            "summary.json",
+        ]
+    )
+
+    summary = json.loads((tmp_path / "summary.json").read_text())
+    assert summary["scale"]["name"] == "linear"
+    assert summary["scale"]["monthly_thresholds"] == [1, 11, 21, 31]
+    monthly = summary["outputs"][0]["monthly_contributions"]
+    assert [entry["blocks"] for entry in monthly[:3]] == [4, 1, 0]
+    assert (tmp_path / "contributions.scad").read_text().count("// 2021-01") == 4
+    cube = json.loads((tmp_path / "stl" / "2021" / "contrib_cube_01.json").read_text())
+    assert cube["details"] == {"levels": 4}
+    readme = (tmp_path / "stl" / "2021" / "README.md").read_text()
+    assert "January: 40 contributions \u2192 4 cubes" in readme
+
+
+@pytest.mark.parametrize(
+    "extra, message",
+    [
+        (["--scale-levels", "3"], "--scale-levels needs --scale"),
+        (["--scale", "linear", "--scale-levels", "0"], "must be positive"),
+    ],
+)
+def test_cli_rejects_unusable_scale_levels(monkeypatch, capsys, extra, message):
+    monkeypatch.setattr(cli, "fetch_user_contributions", lambda *a, **k: [])
+
+    with pytest.raises(SystemExit):
+        cli.main(["me", *extra])
+
+    assert message in capsys.readouterr().err
+
+
+def test_cli_renders_from_sqlite_store(tmp_path, monkeypatch):
+    from gitshelves.core.sqlstore import SQLiteContributionStore
+
+    monkeypatch.chdir(tmp_path)
+    SQLiteContributionStore(tmp_path / "fleet.sqlite").save("me", {(2021, 5, 1): 2})
+
+    def fail_fetch(*_args, **_kwargs):  # pragma: no cover - should not be called
+        raise AssertionError("API fetch not expected")
+
+    monkeypatch.setattr(cli, "fetch_user_contributions", fail_fetch)
+    monkeypatch.setattr(cli, "scad_to_stl", lambda *a, **k: None)
+
+    cli.main(
+        [
+            "me",
+            "--start-year",
+            "2021",
+            "--end-year",
+            "2021",
+            "--contribution-store",
+            "fleet.sqlite",
+            "--json",
+            "summary.json",
+        ]
+    )
+
+    summary = json.loads((tmp_path / "summary.json").read_text())
+    daily = summary["outputs"][0]["daily_contributions"]
+    assert daily == [{"blocks": 1, "count": 2, "day": 1, "month": 5, "year": 2021}]
@@ -0,0 +1,299 @@
+"""Tests for GH Archive ingestion into the contribution store."""
+
+import gzip
+import json
+
+import pytest
+
+from gitshelves.core.archive import (
+    ContributionStore,
+    contribution_maps_from_store,
+    ingest_archives,
+    open_contribution_store,
+    scan_archive,
+)
+from gitshelves.core.sqlstore import SQLiteContributionStore
+
+
+def _event(login, created_at, kind="IssuesEvent", action="opened"):
+    return {
+        "id": "1",
+        "type": kind,
+        "actor": {"id": 1, "login": login, "display_login": login},
+        "repo": {"id": 2, "name": "octo/repo"},
+        "payload": {"action": action, "issue": {"user": {"login": "someone-else"}}},
+        "public": True,
+        "created_at": created_at,
+    }
+
+
+def _write_archive(path, events, extra_lines=()):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with gzip.open(path, "wt", encoding="utf-8") as handle:
+        for event in events:
+            handle.write(json.dumps(event, separators=(",", ":")) + "\n")
+        for line in extra_lines:
+            handle.write(line + "\n")
+    return path
+
+
+@pytest.fixture
+def archives(tmp_path):
+    root = tmp_path / "gharchive"
+    _write_archive(
+        root / "2021-03-01-10.json.gz",
+        [
+            _event("Octocat", "2021-03-01T10:00:00Z"),
+            _event("octocat", "2021-03-01T10:05:00Z", "PullRequestEvent"),
+            _event("octocat", "2021-03-01T10:06:00Z", action="closed"),
+            _event("octocat", "2021-03-01T10:07:00Z", "PushEvent"),
+            _event("hubot", "2021-03-01T10:08:00Z"),
+        ],
+        extra_lines=["not json", ""],
+    )
+    _write_archive(
+        root / "nested" / "2021-03-02-00.json.gz",
+        [
+            _event("octocat", "2021-03-02T00:00:00Z"),
+            _event("monalisa", "2021-03-02T00:01:00Z"),
+        ],
+    )
+    return root
+
+
+def test_scan_archive_keeps_opened_issues_and_prs_of_requested_actors(archives):
+    counts = scan_archive(archives / "2021-03-01-10.json.gz", ["OCTOCAT"])
+
+    assert counts == {"octocat": {(2021, 3, 1): 2}}
+
+
+def test_scan_archive_counts_selected_event_types(archives):
+    counts = scan_archive(
+        archives / "2021-03-01-10.json.gz", None, event_types={"PushEvent"}
+    )
+
+    assert counts == {"octocat": {(2021, 3, 1): 1}}
+
+
+@pytest.fixture(params=["store", "store.sqlite"])
+def store(request, tmp_path):
+    return open_contribution_store(tmp_path / request.param)
+
+
+def test_ingest_merges_counts_and_skips_ingested_archives(archives, store):
+
+    report = ingest_archives([archives], store, ["octocat", "monalisa"], max_workers=2)
+    again = ingest_archives([archives], store, ["octocat", "monalisa"])
+
+    assert (report.files, report.users, report.events) == (2, 2, 4)
+    assert (again.files, again.skipped, again.events) == (0, 2, 0)
+    assert store.load("octocat") == {(2021, 3, 1): 2, (2021, 3, 2): 1}
+    assert store.usernames() == ["monalisa", "octocat"]
+
+    forced = ingest_archives([archives], store, ["octocat"], force=True)
+    assert forced.events == 3
+    assert store.load("OctoCat") == {(2021, 3, 1): 2, (2021, 3, 2): 1}
+    assert store.load("monalisa") == {(2021, 3, 2): 1}
+
+    ingest_archives([archives], store, force=True)
+    assert store.load("octocat") == {(2021, 3, 1): 2, (2021, 3, 2): 1}
+    assert store.load("monalisa") == {(2021, 3, 2): 1}
+
+
+def test_contribution_maps_from_store(archives, store):
+    ingest_archives([archives], store, ["octocat"], max_workers=1)
+
+    start, end, monthly, daily = contribution_maps_from_store(
+        store, "octocat", 2021, 2021
+    )
+
+    assert (start, end) == (2021, 2021)
+    assert monthly[(2021, 3)] == 3
+    assert monthly[(2021, 4)] == 0
+    assert daily == {(2021, 3, 1): 2, (2021, 3, 2): 1}
+    assert contribution_maps_from_store(store, "nobody", 2021, 2021)[3] == {}
+    assert contribution_maps_from_store(store, "octocat", 2022, 2022)[3] == {}
+
+
+def test_ingest_rejects_missing_paths(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        ingest_archives([tmp_path / "missing"], ContributionStore(tmp_path))
+
+
+def test_open_contribution_store_picks_backend_by_suffix(tmp_path):
+    assert isinstance(open_contribution_store(tmp_path / "dir"), ContributionStore)
+    assert isinstance(
+        open_contribution_store(tmp_path / "fleet.db"), SQLiteContributionStore
+    )
+
+
+def test_open_contribution_store_can_require_an_existing_store(tmp_path):
+    for name in ("missing", "missing.db"):
+        with pytest.raises(FileNotFoundError):
+            open_contribution_store(tmp_path / name, create=False)
+    assert not (tmp_path / "missing.db").exists()
+
+    SQLiteContributionStore(tmp_path / "fleet.db")
+    store = open_contribution_store(tmp_path / "fleet.db", create=False)
+    assert isinstance(store, SQLiteContributionStore)
+
+
+def test_sqlite_store_merges_and_marks_in_one_transaction(tmp_path):
+    import sqlite3
+
+    store = SQLiteContributionStore(tmp_path / "fleet.db")
+    with pytest.raises(sqlite3.Error):
+        store.merge_ingested({"octocat": {(2021, 3, 1): 1}}, ["a.json.gz", object()])
+
+    assert store.load("octocat") is None
+    assert store.ingested() == set()
+
+    store.merge_ingested({"octocat": {(2021, 3, 1): 1}}, ["a.json.gz"])
+    store.mark_ingested(["a.json.gz", "b.json.gz"])
+    assert store.load("octocat") == {(2021, 3, 1): 1}
+    assert store.ingested() == {"a.json.gz", "b.json.gz"}
+
+
+def test_sqlite_store_resets_users_before_merging(tmp_path):
+    store = SQLiteContributionStore(tmp_path / "fleet.db")
+    store.merge_many({"octocat": {(2021, 3, 1): 2}, "hubot": {(2021, 3, 1): 1}})
+
+    store.merge_ingested(
+        {"octocat": {(2021, 3, 2): 1}}, ["a.json.gz"], reset=["OctoCat", "nobody"]
+    )
+
+    assert store.load("octocat") == {(2021, 3, 2): 1}
+    assert store.load("hubot") == {(2021, 3, 1): 1}
+    assert store.usernames() == ["hubot", "octocat"]
+
+
+def test_sqlite_store_rejects_files_that_are_not_databases(tmp_path):
+    path = tmp_path / "notes.db"
+    path.write_text("not a database\n" * 100)
+
+    with pytest.raises(ValueError, match="is not a SQLite store"):
+        SQLiteContributionStore(path)
+
+
+def test_sqlite_store_reads_every_user_for_a_year(tmp_path):
+    store = SQLiteContributionStore(tmp_path / "fleet.sqlite")
+    store.merge_many(
+        {
+            "Octocat": {(2024, 12, 31): 1, (2025, 1, 1): 2, (2025, 6, 3): 1},
+            "monalisa": {(2025, 2, 28): 4},
+            "hubot": {(2023, 5, 5): 9},
+        }
+    )
+    store.merge("octocat", {(2025, 1, 1): 1})
+
+    grids = store.grids(2025, 2025)
+
+    assert sorted(grids) == ["monalisa", "octocat"]
+    assert grids["octocat"].daily == {(2025, 1, 1): 3, (2025, 6, 3): 1}
+    assert grids["octocat"].count(2025, 1) == 3
+    assert grids["monalisa"].monthly[(2025, 2)] == 4
+    assert list(store.grids(2025, 2025, ["MONALISA"])) == ["monalisa"]
+    assert store.load_range("octocat", 2024, 2024) == {(2024, 12, 31): 1}
+
+    store.save("octocat", {(2020, 1, 1): 5})
+    assert store.load("octocat") == {(2020, 1, 1): 5}
+    assert store.load("nobody") is None
+
+
+def test_sqlite_store_rejects_newer_schema(tmp_path):
+    import sqlite3
+
+    path = tmp_path / "fleet.db"
+    with sqlite3.connect(path) as conn:
+        conn.execute("PRAGMA user_version = 99")
+
+    with pytest.raises(ValueError):
+        SQLiteContributionStore(path)
+
+
+def test_scan_archive_parses_unusual_layouts_in_full(tmp_path):
+    path = _write_archive(
+        tmp_path / "2021-03-03-00.json.gz",
+        [],
+        extra_lines=[
+            # Not compact, so the fast login probe cannot find the actor.
+            json.dumps(_event("hubot", "2021-03-03T00:00:00Z")),
+            json.dumps(_event("octocat", "2021-03-03T00:01:00Z")),
+            '{"actor":{"id":1},"created_at":"2021-03-03T00:02:00Z"}',
+        ],
+    )
+
+    assert scan_archive(path, ["octocat"]) == {"octocat": {(2021, 3, 3): 1}}
+
+
+def test_ingest_rejects_non_positive_workers(archives, tmp_path):
+    with pytest.raises(ValueError):
+        ingest_archives([archives], ContributionStore(tmp_path), max_workers=0)
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"version": 99, "daily": [[2021, 3, 1, 1]]},
+        {"version": 1, "daily": [[2021, 3, "first", 1]]},
+        {"version": 1, "daily": [None]},
+    ],
+)
+def test_json_store_ignores_incompatible_documents(tmp_path, payload):
+    store = ContributionStore(tmp_path)
+    store.path_for("octocat").write_text(json.dumps(payload))
+
+    assert store.load("octocat") is None
+
+
+def test_json_store_finishes_interrupted_ingest(archives, tmp_path, monkeypatch):
+    store = ContributionStore(tmp_path / "store")
+    ingest_archives([archives], store, ["octocat"], max_workers=1)
+    monkeypatch.setattr(ContributionStore, "recover", lambda self: False)
+    store.merge_ingested({"octocat": {(2021, 3, 1): 5}}, ["2021-03-04-00.json.gz"])
+
+    # The journal was written but never applied, as after a crash.
+    assert store.load("octocat") == {(2021, 3, 1): 2, (2021, 3, 2): 1}
+    assert "2021-03-04-00.json.gz" not in store.ingested()
+    assert store.usernames() == ["octocat"]
+
+    monkeypatch.undo()
+    reopened = ContributionStore(tmp_path / "store")
+
+    assert reopened.load("octocat") == {(2021, 3, 1): 7, (2021, 3, 2): 1}
+    assert "2021-03-04-00.json.gz" in reopened.ingested()
+    assert reopened.recover() is False
+
+
+@pytest.mark.parametrize(
+    "journal",
+    ['{"version": 1, "users": {"octo', '{"version": 1}', '{"users": {"a": [[1]]}}'],
+)
+def test_json_store_discards_unreadable_journals(archives, tmp_path, journal):
+    store = ContributionStore(tmp_path / "store")
+    ingest_archives([archives], store, ["octocat"], max_workers=1)
+    (tmp_path / "store" / "_pending.json").write_text(journal)
+
+    reopened = ContributionStore(tmp_path / "store")
+
+    assert reopened.load("octocat") == {(2021, 3, 1): 2, (2021, 3, 2): 1}
+    assert len(reopened.ingested()) == 2
+    assert not (tmp_path / "store" / "_pending.json").exists()
+
+
+def test_json_store_merges_counts_and_marks_files(archives, tmp_path):
+    store = ContributionStore(tmp_path / "store")
+    store.merge_many({"Octocat": {(2021, 3, 1): 1}, "hubot": {(2021, 3, 2): 2}})
+    merged = store.merge("octocat", {(2021, 3, 1): 2})
+    store.mark_ingested(["a.json.gz"])
+    store.mark_ingested(["b.json.gz"])
+
+    assert merged == {(2021, 3, 1): 3}
+    assert store.usernames() == ["hubot", "octocat"]
+    assert store.ingested() == {"a.json.gz", "b.json.gz"}
+
+    report = ingest_archives(
+        [archives / "2021-03-01-10.json.gz"], store, ["octocat"], max_workers=1
+    )
+    assert (report.files, report.events) == (1, 2)
+    assert store.load("octocat") == {(2021, 3, 1): 5}
@@ -0,0 +1,231 @@
+"""Tests for the persistent search cache."""
+
+import json
+from datetime import UTC, datetime
+
+import pytest
+
+from gitshelves.core import github
+from gitshelves.core.cache import (
+    CACHE_VERSION,
+    CacheEntry,
+    CachedPage,
+    SearchCache,
+)
+
+from conftest import FakeResponse, FakeSession
+
+
+def test_search_cache_round_trip(tmp_path):
+    cache = SearchCache(tmp_path)
+    pages = [CachedPage(items=[{"id": 1}], etag='"abc"', last_modified="Mon")]
+
+    cache.store("Octo", "2023-01-01", "2023-12-31", pages, token="T")
+    entry = cache.load("Octo", "2023-01-01", "2023-12-31", token="T")
+
+    assert entry is not None
+    assert entry.items == [{"id": 1}]
+    assert entry.conditional_headers() == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Mon",
+    }
+    path = cache.path_for("Octo", "2023-01-01", "2023-12-31")
+    assert path == tmp_path / "octo" / "2023-01-01_2023-12-31.json"
+    assert "T" not in json.loads(path.read_text()).values()
+
+
+def test_search_cache_ignores_entries_for_other_tokens(tmp_path):
+    cache = SearchCache(tmp_path)
+    cache.store("me", "2023-01-01", "2023-12-31", [], token="A")
+
+    assert cache.load("me", "2023-01-01", "2023-12-31", token="B") is None
+    assert cache.load("me", "2023-01-01", "2023-12-31", token="A") is not None
+
+
+def test_search_cache_keeps_namespaces_apart(tmp_path):
+    cache = SearchCache(tmp_path)
+    pages = [CachedPage(items=[{"sha": "abc"}])]
+    cache.store("me", "2023-01-01", "2023-12-31", pages, namespace="commits")
+
+    assert cache.load("me", "2023-01-01", "2023-12-31") is None
+    entry = cache.load("me", "2023-01-01", "2023-12-31", namespace="commits")
+    assert entry is not None and entry.items == [{"sha": "abc"}]
+    path = cache.path_for("me", "2023-01-01", "2023-12-31", "commits")
+    assert path == tmp_path / "me" / "commits" / "2023-01-01_2023-12-31.json"
+
+
+def test_search_cache_ignores_corrupt_entries(tmp_path):
+    cache = SearchCache(tmp_path)
+    path = cache.path_for("me", "2023-01-01", "2023-12-31")
+    path.parent.mkdir(parents=True)
+    path.write_text("{not json")
+
+    assert cache.load("me", "2023-01-01", "2023-12-31") is None
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"version": -1, "username": "me", "window": ["2023-01-01", "2023-12-31"]},
+        {"version": CACHE_VERSION, "username": "me"},
+        {"version": CACHE_VERSION, "username": "me", "window": ["2023-01-01"]},
+    ],
+)
+def test_search_cache_ignores_incompatible_entries(tmp_path, payload):
+    cache = SearchCache(tmp_path)
+    path = cache.path_for("me", "2023-01-01", "2023-12-31")
+    path.parent.mkdir(parents=True)
+    path.write_text(json.dumps(payload))
+
+    assert cache.load("me", "2023-01-01", "2023-12-31") is None
+
+
+def test_cache_entry_freshness_defaults_to_fetch_time():
+    entry = CacheEntry.from_json(
+        {"username": "me", "window": ["2023-01-01", "2023-12-31"], "fetched_at": 100}
+    )
+
+    assert entry.validated_at == 100.0
+    assert entry.conditional_headers() == {}
+    assert entry.is_fresh(60, now=159.0)
+    assert not entry.is_fresh(60, now=160.0)
+    assert not entry.is_fresh(0, now=100.0)
+
+
+CURRENT_YEAR = datetime.now(UTC).year
+
+
+def test_fetch_revalidates_with_etag(monkeypatch, tmp_path):
+    calls = []
+
+    def fake_get(url, headers=None, params=None, timeout=10):
+        calls.append(dict(headers))
+        if headers.get("If-None-Match") == '"v1"':
+            return FakeResponse([], status_code=304)
+        return FakeResponse([{"id": 1}], headers={"ETag": '"v1"'})
+
+    monkeypatch.setattr(github, "http_session", lambda: FakeSession(fake_get))
+
+    first = github.fetch_user_contributions(
+        "me", start_year=CURRENT_YEAR, end_year=CURRENT_YEAR, cache_dir=tmp_path
+    )
+    github.contribution_cache.clear()
+    second = github.fetch_user_contributions(
+        "me", start_year=CURRENT_YEAR, end_year=CURRENT_YEAR, cache_dir=tmp_path
+    )
+
+    assert first == second == [{"id": 1}]
+    assert len(calls) == 2
+    assert "If-None-Match" not in calls[0]
+    assert calls[1]["If-None-Match"] == '"v1"'
+
+
+def test_fetch_refetches_all_pages_when_changed(monkeypatch, tmp_path):
+    version = {"value": "v1"}
+    pages = []
+
+    def fake_get(url, headers=None, params=None, timeout=10):
+        pages.append(params["page"])
+        etag = f'"{version["value"]}"'
+        if headers.get("If-None-Match") == etag:
+            return FakeResponse([], status_code=304)
+        links = {"next": {"url": "x"}} if params["page"] == 1 else {}
+        return FakeResponse(
+            [{"page": params["page"], "v": version["value"]}],
+            headers={"ETag": etag},
+            links=links,
+        )
+
+    monkeypatch.setattr(github, "http_session", lambda: FakeSession(fake_get))
+
+    github.fetch_user_contributions(
+        "me", start_year=CURRENT_YEAR, end_year=CURRENT_YEAR, cache_dir=tmp_path
+    )
+    github.contribution_cache.clear()
+    version["value"] = "v2"
+    items = github.fetch_user_contributions(
+        "me", start_year=CURRENT_YEAR, end_year=CURRENT_YEAR, cache_dir=tmp_path
+    )
+
+    assert pages == [1, 2, 1, 2]
+    assert items == [{"page": 1, "v": "v2"}, {"page": 2, "v": "v2"}]
+
+
+def test_fetch_skips_network_within_ttl(monkeypatch, tmp_path):
+    calls = 0
+
+    def fake_get(url, headers=None, params=None, timeout=10):
+        nonlocal calls
+        calls += 1
+        return FakeResponse([{"id": 1}], headers={"ETag": '"v1"'})
+
+    monkeypatch.setattr(github, "http_session", lambda: FakeSession(fake_get))
+
+    for _ in range(2):
+        github.contribution_cache.clear()
+        items = github.fetch_user_contributions(
+            "me", start_year=2022, end_year=2022, cache_dir=tmp_path, cache_ttl=3600
+        )
+
+    assert items == [{"id": 1}]
+    assert calls == 1
+
+
+def test_search_cache_entry_settles_after_window_closes(tmp_path):
+    cache = SearchCache(tmp_path)
+    entry = cache.store("me", "2022-01-01", "2022-12-31", [])
+    assert entry.is_settled()
+
+    entry.validated_at = datetime(2022, 12, 31, 23, tzinfo=UTC).timestamp()
+    assert not entry.is_settled()
+
+
+def test_fetch_reuses_closed_years_without_revalidation(monkeypatch, tmp_path):
+    calls = []
+
+    def fake_get(url, headers=None, params=None, timeout=10):
+        calls.append(params["q"])
+        year = params["q"].split("created:")[1][:4]
+        return FakeResponse([{"year": year}], headers={"ETag": f'"{year}"'})
+
+    monkeypatch.setattr(github, "http_session", lambda: FakeSession(fake_get))
+
+    github.fetch_user_contributions(
+        "me", start_year=2020, end_year=CURRENT_YEAR, cache_dir=tmp_path
+    )
+    github.contribution_cache.clear()
+    calls.clear()
+    items = github.fetch_user_contributions(
+        "me", start_year=2021, end_year=CURRENT_YEAR, cache_dir=tmp_path
+    )
+
+    assert [item["year"] for item in items] == [
+        str(year) for year in range(2021, CURRENT_YEAR + 1)
+    ]
+    assert calls == [f"author:me created:{CURRENT_YEAR}-01-01..{CURRENT_YEAR}-12-31"]
+
+
+def test_fetch_refresh_bypasses_closed_year_cache(monkeypatch, tmp_path):
+    version = {"value": "v1"}
+    calls = []
+
+    def fake_get(url, headers=None, params=None, timeout=10):
+        calls.append(dict(headers))
+        return FakeResponse([{"v": version["value"]}])
+
+    monkeypatch.setattr(github, "http_session", lambda: FakeSession(fake_get))
+
+    github.fetch_user_contributions(
+        "me", start_year=2022, end_year=2022, cache_dir=tmp_path
+    )
+    version["value"] = "v2"
+    refreshed = github.fetch_user_contributions(
+        "me", start_year=2022, end_year=2022, cache_dir=tmp_path, refresh=True
+    )
+    cached = github.fetch_user_contributions(
+        "me", start_year=2022, end_year=2022, cache_dir=tmp_path
+    )
+
+    assert refreshed == cached == [{"v": "v2"}]
+    assert len(calls) == 2
+    assert "If-None-Match" not in calls[1]
@@ -1,6 +1,14 @@
-from datetime import datetime
+from datetime import date, datetime
 
-from gitshelves.core.contributions import build_contribution_maps
+import pytest
+
+from gitshelves.core.contributions import (
+    ContributionAggregator,
+    ContributionStats,
+    build_contribution_maps,
+    rollup_contributions,
+)
+from gitshelves.core.events import pack_event_days
 
 
 def test_build_contribution_maps_expands_months():
@@ -42,3 +50,195 @@ def test_build_contribution_maps_skips_invalid_dates():
     assert daily == {(2023, 3, 15): 1}
     assert monthly[(2023, 3)] == 1
     assert monthly[(2023, 1)] == 0
+
+
+def test_build_contribution_maps_accepts_packed_days():
+    items = [
+        {"created_at": "2023-01-15T00:00:00Z"},
+        {"created_at": "2023-01-15T08:00:00Z"},
+        {"created_at": "not-a-date"},
+        {"created_at": None},
+        {"created_at": "2023-03-01T12:34:56Z"},
+    ]
+
+    packed = pack_event_days(items)
+
+    assert len(packed) == 3
+    assert build_contribution_maps(
+        memoryview(packed), 2023, 2023
+    ) == build_contribution_maps(items, 2023, 2023)
+
+
+def test_contribution_aggregator_counts_incrementally():
+    from gitshelves.core.contributions import ContributionAggregator
+
+    aggregator = ContributionAggregator()
+
+    assert aggregator.add({"created_at": "2023-02-01T00:00:00Z"}) is True
+    assert aggregator.add({"created_at": "bogus"}) is False
+    assert (
+        aggregator.update(
+            iter([{"created_at": "2023-02-03T00:00:00Z"}, {"created_at": None}])
+        )
+        == 1
+    )
+
+    monthly, daily = aggregator.maps(2023, 2023)
+
+    assert monthly[(2023, 2)] == 2
+    assert len(monthly) == 12
+    assert daily == {(2023, 2, 1): 1, (2023, 2, 3): 1}
+
+
+def test_contribution_aggregator_tracks_sources():
+    from gitshelves.core.contributions import ContributionAggregator
+
+    aggregator = ContributionAggregator()
+    items = [
+        {"created_at": "2023-02-01T00:00:00Z", "source": "prs"},
+        {"created_at": "2023-02-01T05:00:00Z", "source": "commits"},
+        {"created_at": "2023-02-09T00:00:00Z", "source": "commits"},
+        {"created_at": "2024-01-01T00:00:00Z", "source": "commits"},
+    ]
+
+    build_contribution_maps(items, 2023, 2023, aggregator=aggregator)
+    monthly, daily = aggregator.source_maps(2023, 2023)
+
+    assert monthly == {(2023, 2): {"prs": 1, "commits": 2}}
+    assert daily[(2023, 2, 1)] == {"prs": 1, "commits": 1}
+    assert (2024, 1, 1) not in daily
+
+
+def test_contribution_aggregator_applies_deltas_and_reports_changes():
+    from gitshelves.core.contributions import (
+        ContributionAggregator,
+        ContributionDelta,
+    )
+
+    aggregator = ContributionAggregator()
+    first = {"created_at": "2023-02-01T00:00:00Z", "source": "prs"}
+    second = {"created_at": "2023-02-01T08:00:00Z"}
+    aggregator.update([first, second])
+    assert aggregator.pop_changes() == ContributionDelta(
+        frozenset({(2023, 2)}), frozenset({(2023, 2, 1)})
+    )
+    assert not aggregator.pop_changes()
+
+    delta = aggregator.apply(
+        added=[{"created_at": "2024-03-05T00:00:00Z"}], removed=[first]
+    )
+
+    assert delta.months == {(2023, 2), (2024, 3)}
+    assert delta.days == {(2023, 2, 1), (2024, 3, 5)}
+    assert delta.years == {2023, 2024}
+    assert aggregator.daily == {(2023, 2, 1): 1, (2024, 3, 5): 1}
+    assert aggregator.source_maps(2023, 2024) == ({}, {})
+
+    aggregator.retract([second])
+    monthly, daily = aggregator.maps(2023, 2023)
+    assert (2023, 2, 1) not in daily
+    assert monthly[(2023, 2)] == 0
+
+
+def test_contribution_aggregator_rejects_unknown_retractions():
+    from gitshelves.core.contributions import ContributionAggregator
+
+    aggregator = ContributionAggregator()
+    aggregator.add({"created_at": "2023-02-01T00:00:00Z"})
+
+    with pytest.raises(ValueError):
+        aggregator.remove({"created_at": "2023-02-02T00:00:00Z"})
+    with pytest.raises(ValueError):
+        aggregator.remove({"created_at": "2023-02-01T00:00:00Z", "source": "prs"})
+    assert aggregator.remove({"created_at": None}) is False
+    assert aggregator.daily == {(2023, 2, 1): 1}
+
+
+def test_contribution_aggregator_keeps_sourced_counts_for_their_sources():
+    from gitshelves.core.contributions import ContributionAggregator
+
+    aggregator = ContributionAggregator()
+    aggregator.add({"created_at": "2023-02-01T00:00:00Z", "source": "prs"})
+
+    with pytest.raises(ValueError):
+        aggregator.remove({"created_at": "2023-02-01T00:00:00Z"})
+    assert aggregator.daily_sources == {(2023, 2, 1): {"prs": 1}}
+
+    aggregator.add({"created_at": "2023-02-01T09:00:00Z"})
+    assert aggregator.remove({"created_at": "2023-02-01T09:00:00Z"}) is True
+    assert aggregator.daily == {(2023, 2, 1): 1}
+    assert aggregator.daily_sources == {(2023, 2, 1): {"prs": 1}}
+
+
+def test_contribution_aggregator_checks_whole_retraction_batch():
+    from gitshelves.core.contributions import ContributionAggregator
+
+    aggregator = ContributionAggregator()
+    day = {"created_at": "2023-02-01T00:00:00Z"}
+    aggregator.update([day, {**day, "source": "prs"}, {"created_at": "2023-03-01"}])
+
+    with pytest.raises(ValueError):
+        aggregator.retract([{"created_at": "2023-03-01"}, day, day])
+    assert aggregator.daily == {(2023, 2, 1): 2, (2023, 3, 1): 1}
+    assert aggregator.monthly == {(2023, 2): 2, (2023, 3): 1}
+
+    removed = aggregator.retract([{**day, "source": "prs"}, day, {"created_at": None}])
+    assert removed == 2
+    assert aggregator.daily == {(2023, 3, 1): 1}
+    assert aggregator.daily_sources == {}
+
+
+def test_rollup_buckets_every_resolution_in_one_pass():
+    aggregator = ContributionAggregator()
+    aggregator.update(
+        {"created_at": f"{day}T00:00:00Z"}
+        for day in [
+            "2023-12-30",
+            "2023-12-31",
+            "2023-12-31",
+            "2024-01-01",
+            "2024-05-02",
+            "2024-05-02",
+            "2024-05-02",
+            "2024-05-02",
+        ]
+    )
+
+    rollup = aggregator.rollup(2023, 2024)
+
+    assert rollup.yearly == {2023: 3, 2024: 5}
+    assert rollup.monthly[(2024, 5)] == 4
+    assert rollup.daily[(2023, 12, 31)] == 2
+    assert sum(rollup.weekly.values()) == 8
+    assert rollup.weekly[(2023, 52)] == 3
+    assert rollup.weekly[(2024, 1)] == 1
+    assert rollup.weekly[(2024, 18)] == 4
+    assert list(rollup.weekly)[0] == (2022, 52)
+    assert list(rollup.weekly)[-1] == (2025, 1)
+
+    stats = rollup.stats
+    assert (stats.total, stats.active_days) == (8, 4)
+    assert stats.longest_streak == 3
+    assert stats.longest_streak_start == date(2023, 12, 30)
+    assert stats.longest_streak_end == date(2024, 1, 1)
+    assert (stats.busiest_day, stats.busiest_day_count) == (date(2024, 5, 2), 4)
+    assert (stats.busiest_month, stats.busiest_month_count) == ((2024, 5), 4)
+    assert stats.percentiles == {50: 1, 75: 2, 90: 4, 99: 4}
+
+    year = rollup.year_stats[2024]
+    assert year.longest_streak == 1
+    assert year.longest_streak_start == date(2024, 1, 1)
+    assert year.total == 5
+
+
+def test_rollup_of_empty_grid_has_empty_stats():
+    rollup = ContributionAggregator().rollup(2024, 2024)
+
+    assert rollup.stats == ContributionStats()
+    assert rollup.yearly == {2024: 0}
+    assert rollup.stats.to_json()["longest_streak"] == {
+        "days": 0,
+        "start": None,
+        "end": None,
+    }
+    assert rollup_contributions(rollup.grid).weekly == rollup.weekly
@@ -28,3 +28,33 @@ def test_resolve_token_falls_back_to_github_token(monkeypatch):
     monkeypatch.setenv("GITHUB_TOKEN", "github-token")
 
     assert github.resolve_token(None) == "github-token"
+
+
+def test_resolve_tokens_collects_pool_sources(monkeypatch, tmp_path):
+    """Bulk fetches gather tokens from every configured source in order."""
+
+    token_file = tmp_path / "tokens.txt"
+    token_file.write_text("file-a\n\n# comment\nfile-b  # trailing note\nshared\n")
+    monkeypatch.setenv("GH_TOKENS", "env-a, env-b shared")
+    monkeypatch.setenv("GH_TOKEN", "gh-token")
+    monkeypatch.setenv("GITHUB_TOKEN", "gh-token")
+
+    assert github.resolve_tokens("explicit", token_file) == [
+        "explicit",
+        "env-a",
+        "env-b",
+        "shared",
+        "file-a",
+        "file-b",
+        "gh-token",
+    ]
+
+
+def test_resolve_tokens_falls_back_to_single_token(monkeypatch):
+    """Without pool sources the single-token fallback order still applies."""
+
+    monkeypatch.delenv("GH_TOKENS", raising=False)
+    monkeypatch.delenv("GH_TOKEN", raising=False)
+    monkeypatch.setenv("GITHUB_TOKEN", "github-token")
+
+    assert github.resolve_tokens(None) == ["github-token"]
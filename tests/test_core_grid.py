@@ -0,0 +1,182 @@
+"""Tests for the dense contribution grid."""
+
+import pytest
+
+from gitshelves.core.contributions import (
+    ContributionAggregator,
+    build_contribution_maps,
+)
+from gitshelves.core.grid import ContributionGrid
+from gitshelves.core.metadata import MetadataWriter
+from gitshelves.render.scad import generate_month_calendar_scad, generate_scad_monthly
+
+ITEMS = [
+    {"created_at": "2023-02-01T00:00:00Z"},
+    {"created_at": "2023-02-01T05:00:00Z"},
+    {"created_at": "2024-02-29T00:00:00Z"},
+    {"created_at": "2024-12-31T00:00:00Z"},
+]
+
+
+@pytest.fixture
+def maps():
+    _start, _end, monthly, daily = build_contribution_maps(ITEMS, 2023, 2024)
+    return monthly, daily
+
+
+def test_grid_views_match_plain_maps(maps):
+    monthly, daily = maps
+    grid = ContributionGrid.from_maps(2023, 2024, monthly, daily)
+
+    assert grid.monthly == monthly
+    assert grid.daily == daily
+    assert grid.to_maps() == (monthly, daily)
+    assert list(grid.daily) == sorted(daily)
+    assert len(grid.monthly) == 24
+    assert grid.total == 4
+
+
+def test_grid_views_mirror_dict_lookups(maps):
+    grid = ContributionGrid.from_maps(2023, 2024, *maps)
+
+    assert grid.daily.get((2023, 2, 1), 0) == 2
+    assert grid.daily.get((2023, 2, 2), 0) == 0
+    assert grid.daily.get((2023, 2, 30), 0) == 0
+    assert grid.daily.get((1999, 1, 1)) is None
+    assert (2023, 2, 2) not in grid.daily
+    with pytest.raises(KeyError):
+        grid.daily[(2023, 2, 2)]
+    assert grid.monthly[(2023, 3)] == 0
+    assert grid.monthly.get((2025, 1), 0) == 0
+
+
+def test_grid_selections_skip_years_outside_the_grid(maps):
+    grid = ContributionGrid.from_maps(2023, 2024, *maps)
+
+    assert list(grid.iter_months(2022)) == []
+    assert list(grid.iter_days(2025)) == []
+    assert list(grid.iter_days(month=2)) == [((2023, 2, 1), 2), ((2024, 2, 29), 1)]
+    with pytest.raises(KeyError):
+        grid.count(2023, 13)
+    for month in (0, 13):
+        for select in (grid.iter_months, grid.iter_days, grid.daily.select):
+            with pytest.raises(ValueError):
+                list(select(2023, month))
+        with pytest.raises(ValueError):
+            list(grid.iter_days(month=month))
+
+
+def test_grid_views_reject_malformed_keys(maps):
+    grid = ContributionGrid.from_maps(2023, 2023, {(2023, 2): 2}, {(2023, 2, 1): 2})
+
+    assert grid.monthly.get("2023-02") is None
+    assert grid.daily.get((2023, 2)) is None
+    assert grid != maps
+    assert repr(grid) == "ContributionGrid(start_year=2023, end_year=2023, total=2)"
+    assert repr(grid.daily) == "DailyView({(2023, 2, 1): 2})"
+    assert repr(grid.monthly).startswith("MonthlyView({(2023, 1): 0, (2023, 2): 2")
+
+
+def test_grid_slices_are_zero_copy_views(maps):
+    grid = ContributionGrid.from_maps(2023, 2024, *maps)
+
+    year = grid.year_days(2024)
+    february = grid.month_days(2024, 2)
+    assert (len(year), len(february)) == (366, 29)
+    assert february[28] == 1 and year[-1] == 1
+    assert list(grid.year_months(2023))[:3] == [0, 2, 0]
+
+    grid.add(2024, 2, 29, 2)
+    assert february[28] == 3
+    assert grid.count(2024, 2) == 3
+    assert list(grid.daily.select(2024, 2)) == [((2024, 2, 29), 3)]
+
+
+def test_grid_rejects_negative_counts():
+    grid = ContributionGrid(2023, 2023)
+
+    with pytest.raises(ValueError):
+        grid.add(2023, 1, 1, -1)
+    with pytest.raises(ValueError):
+        ContributionGrid(2024, 2023)
+
+
+def test_grid_feeds_existing_consumers(maps):
+    monthly, daily = maps
+    aggregator = ContributionAggregator()
+    aggregator.update(ITEMS)
+    grid = aggregator.grid(2023, 2024)
+
+    assert generate_scad_monthly(grid.monthly) == generate_scad_monthly(monthly)
+    assert generate_month_calendar_scad(grid.daily, 2023, 2) == (
+        generate_month_calendar_scad(daily, 2023, 2)
+    )
+
+    def writer(monthly_counts, daily_counts):
+        return MetadataWriter(
+            username="user",
+            start_year=2023,
+            end_year=2024,
+            monthly_counts=monthly_counts,
+            daily_counts=daily_counts,
+            months_per_row=12,
+            calendar_days_per_row=5,
+            colors=1,
+            gridfinity_layouts=False,
+            gridfinity_columns=6,
+            gridfinity_cubes=False,
+            baseplate_template="baseplate_2x6.scad",
+        )
+
+    plain, dense = writer(monthly, daily), writer(grid.monthly, grid.daily)
+    assert dense.monthly_contributions() == plain.monthly_contributions()
+    assert dense.daily_contributions(year=2024, month=2) == (
+        plain.daily_contributions(year=2024, month=2)
+    )
+    assert dense.zero_months() == plain.zero_months()
+
+
+@pytest.mark.parametrize("numpy_available", [True, False])
+def test_grid_merge_adds_arrays(maps, monkeypatch, numpy_available):
+    from gitshelves.core import vectorized
+
+    if numpy_available:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(vectorized, "np", None)
+    first = ContributionGrid.from_maps(2023, 2024, *maps)
+    second = ContributionGrid(2023, 2024)
+    second.add(2023, 2, 1, 3)
+    second.add(2024, 7, 4)
+
+    merged = ContributionGrid.merge([first, second])
+
+    assert merged == first + second
+    assert merged.count(2023, 2, 1) == 5
+    assert merged.count(2023, 2) == 5
+    assert merged.count(2024, 7, 4) == 1
+    assert merged.total == first.total + second.total
+    assert first.count(2023, 2, 1) == 2
+
+
+def test_grid_merge_copies_single_grids_and_rejects_overflow():
+    pytest.importorskip("numpy")
+    grid = ContributionGrid(2023, 2023)
+    grid.add(2023, 1, 1, 2**31)
+
+    copy = ContributionGrid.merge([grid])
+    copy.add(2023, 2, 1)
+    assert (grid.total, copy.total) == (2**31, 2**31 + 1)
+    with pytest.raises(OverflowError):
+        grid + grid
+    with pytest.raises(TypeError):
+        grid + {}
+
+
+def test_grid_merge_requires_matching_ranges():
+    with pytest.raises(ValueError):
+        ContributionGrid.merge(
+            [ContributionGrid(2023, 2023), ContributionGrid(2024, 2024)]
+        )
+    with pytest.raises(ValueError):
+        ContributionGrid.merge([])
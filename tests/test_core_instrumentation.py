@@ -0,0 +1,124 @@
+"""Tests for fetch-layer metrics."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from gitshelves.core import github
+from gitshelves.core.instrumentation import FetchMetrics, Histogram, response_size
+from gitshelves.core.ratelimit import RateLimiter
+
+from conftest import FakeResponse, FakeSession
+
+CURRENT_YEAR = datetime.now(UTC).year
+
+
+@pytest.fixture(autouse=True)
+def metrics(monkeypatch):
+    recorder = FetchMetrics()
+    monkeypatch.setattr(github, "fetch_metrics", recorder)
+    return recorder
+
+
+def test_histogram_buckets_values_by_upper_bound():
+    histogram = Histogram((1, 10))
+    for value in (0.5, 1, 5, 50):
+        histogram.observe(value)
+
+    payload = histogram.to_json()
+
+    assert payload["buckets"] == {"1": 2, "10": 1, "+Inf": 1}
+    assert (payload["count"], payload["min"], payload["max"]) == (4, 0.5, 50)
+    assert payload["mean"] == pytest.approx(56.5 / 4)
+
+
+def test_response_size_prefers_content_length():
+    assert response_size(FakeResponse([], headers={"Content-Length": "12"})) == 12
+    resp = FakeResponse([])
+    resp.content = b"abc"
+    assert response_size(resp) == 3
+    assert response_size(FakeResponse([])) == 0
+    resp = FakeResponse([], headers={"Content-Length": "n/a"})
+    resp.content = b"abcd"
+    assert response_size(resp) == 4
+
+
+def test_metrics_ignore_malformed_quota_headers(metrics):
+    headers = {"X-RateLimit-Remaining": "lots", "X-RateLimit-Reset": "soon"}
+    metrics.record_response(
+        "https://api.github.com/search/issues", FakeResponse([], headers=headers), 0.1
+    )
+    stats = metrics.snapshot()
+
+    assert stats.requests == 1
+    assert (stats.quota_remaining, stats.quota_reset_at) == (None, None)
+
+
+def test_metrics_reject_unknown_cache_outcome(metrics):
+    with pytest.raises(ValueError):
+        metrics.record_cache("disk", "stale")
+
+
+def test_fetch_records_requests_retries_pages_and_quota(monkeypatch, metrics):
+    responses = [
+        FakeResponse([], status_code=429, headers={"Retry-After": "0"}),
+        FakeResponse(
+            [{"id": 1}],
+            headers={
+                "Content-Length": "100",
+                "X-RateLimit-Remaining": "29",
+                "X-RateLimit-Reset": "1060",
+            },
+            links={"next": {}},
+        ),
+        FakeResponse(
+            [{"id": 2}],
+            headers={"Content-Length": "50", "X-RateLimit-Remaining": "28"},
+        ),
+    ]
+    monkeypatch.setattr(
+        github, "http_session", lambda: FakeSession(lambda *a, **k: responses.pop(0))
+    )
+    monkeypatch.setattr(
+        github, "rate_limiter", RateLimiter(rate=None, sleep=lambda _s: None)
+    )
+
+    items = github.fetch_user_contributions("me", start_year=2021, end_year=2021)
+    github.fetch_user_contributions("me", start_year=2021, end_year=2021)
+    stats = metrics.snapshot()
+
+    assert items == [{"id": 1}, {"id": 2}]
+    assert (stats.requests, stats.retries, stats.bytes) == (3, 1, 150)
+    assert (stats.queries, stats.pages) == (1, 2)
+    assert stats.statuses == {429: 1, 200: 2}
+    assert stats.latency["/search/issues"]["count"] == 3
+    assert (stats.quota_remaining, stats.quota_min_remaining) == (28, 28)
+    assert stats.quota_reset_at == 1060.0
+    assert stats.cache["memory"] == {"hit": 1, "miss": 1, "revalidated": 0}
+
+    payload = stats.to_json()
+    assert payload["statuses"] == {"200": 2, "429": 1}
+    assert payload["quota"]["remaining"] == 28
+    metrics.reset()
+    assert metrics.snapshot().requests == 0
+
+
+def test_fetch_records_disk_cache_outcomes(monkeypatch, metrics, tmp_path):
+    def fake_get(url, headers=None, params=None, timeout=10):
+        if headers.get("If-None-Match") == '"v1"':
+            return FakeResponse([], status_code=304)
+        return FakeResponse([{"id": 1}], headers={"ETag": '"v1"'})
+
+    monkeypatch.setattr(github, "http_session", lambda: FakeSession(fake_get))
+
+    for year in (CURRENT_YEAR, CURRENT_YEAR, CURRENT_YEAR - 1, CURRENT_YEAR - 1):
+        github.contribution_cache.clear()
+        github.fetch_user_contributions(
+            "me", start_year=year, end_year=year, cache_dir=tmp_path
+        )
+
+    assert metrics.snapshot().cache["disk"] == {
+        "hit": 1,
+        "miss": 2,
+        "revalidated": 1,
+    }
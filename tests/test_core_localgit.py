@@ -0,0 +1,164 @@
+"""Tests for reading contributions from local git clones."""
+
+import os
+import subprocess
+
+import pytest
+
+from gitshelves.core import github
+from gitshelves.core.contributions import build_contribution_maps
+from gitshelves.core.localgit import (
+    discover_repositories,
+    fetch_local_contributions,
+    scan_repository,
+)
+
+
+def _git(repo, *args, env=None):
+    subprocess.run(
+        ["git", "-C", str(repo), *args],
+        check=True,
+        capture_output=True,
+        env={**os.environ, **(env or {})},
+    )
+
+
+def _make_repo(path, commits):
+    """Create a repository with ``(author, iso_date)`` commits."""
+
+    path.mkdir(parents=True)
+    _git(path, "init", "-q")
+    for index, (author, when) in enumerate(commits):
+        (path / "file.txt").write_text(str(index))
+        _git(path, "add", "file.txt")
+        _git(
+            path,
+            "-c",
+            "commit.gpgsign=false",
+            "commit",
+            "-q",
+            "-m",
+            f"change {index}",
+            env={
+                "GIT_AUTHOR_NAME": author,
+                "GIT_AUTHOR_EMAIL": f"{author}@example.com",
+                "GIT_AUTHOR_DATE": when,
+                "GIT_COMMITTER_NAME": author,
+                "GIT_COMMITTER_EMAIL": f"{author}@example.com",
+                "GIT_COMMITTER_DATE": when,
+            },
+        )
+    return path
+
+
+@pytest.fixture
+def clones(tmp_path):
+    root = tmp_path / "mirrors"
+    _make_repo(
+        root / "alpha",
+        [
+            ("octocat", "2020-12-31T23:30:00-02:00"),
+            ("octocat", "2021-03-01T12:00:00Z"),
+            ("hubot", "2021-03-02T12:00:00Z"),
+        ],
+    )
+    _make_repo(root / "team" / "beta", [("octocat", "2021-07-04T09:00:00Z")])
+    (root / "notes").mkdir()
+    return root
+
+
+def test_discover_repositories_walks_directories_of_clones(clones):
+    repos = discover_repositories([clones])
+
+    assert [repo.name for repo in repos] == ["alpha", "beta"]
+    assert discover_repositories([clones / "alpha"]) == [repos[0]]
+
+
+def test_scan_repository_filters_author_and_uses_utc_author_dates(clones):
+    items = scan_repository(clones / "alpha", "octocat", 2021, 2021)
+
+    # 2020-12-31T23:30-02:00 is already 2021 in UTC.
+    assert [item["created_at"] for item in items] == [
+        "2021-03-01T12:00:00Z",
+        "2021-01-01T01:30:00Z",
+    ]
+    assert {item["source"] for item in items} == {"git"}
+    assert all(len(item["sha"]) == 40 for item in items)
+
+
+def test_fetch_local_contributions_scans_repositories_in_parallel(clones):
+    items = fetch_local_contributions("octocat", [clones], 2021, 2021, max_workers=2)
+
+    assert [item["created_at"][:10] for item in items] == [
+        "2021-01-01",
+        "2021-03-01",
+        "2021-07-04",
+    ]
+    _, _, monthly, _ = build_contribution_maps(items, 2021, 2021)
+    assert monthly[(2021, 1)] == 1
+    assert monthly[(2021, 7)] == 1
+
+
+def test_fetch_local_contributions_counts_shared_commits_once(clones):
+    subprocess.run(
+        ["git", "clone", "-q", str(clones / "alpha"), str(clones / "fork")],
+        check=True,
+        capture_output=True,
+    )
+
+    items = fetch_local_contributions("octocat", [clones], 2021, 2021, max_workers=1)
+
+    assert [item["created_at"][:10] for item in items] == [
+        "2021-01-01",
+        "2021-03-01",
+        "2021-07-04",
+    ]
+    assert {item["repository"] for item in items} == {
+        str(clones.resolve() / "alpha"),
+        str(clones.resolve() / "team" / "beta"),
+    }
+
+
+def test_fetch_user_contributions_reads_local_repositories(clones, monkeypatch):
+    def no_network():  # pragma: no cover - should not be called
+        raise AssertionError("local scans must not touch the API")
+
+    monkeypatch.setattr(github, "http_session", no_network)
+
+    items = github.fetch_user_contributions(
+        "octocat",
+        start_year=2021,
+        end_year=2021,
+        repositories=[clones],
+        author="hubot",
+        max_workers=1,
+    )
+
+    assert [item["created_at"] for item in items] == ["2021-03-02T12:00:00Z"]
+
+
+def test_discover_repositories_rejects_missing_roots(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        discover_repositories([tmp_path / "missing"])
+
+
+def test_scan_repository_skips_later_years_and_unparsable_lines(clones, monkeypatch):
+    items = scan_repository(clones / "alpha", "octocat", 2020, 2020)
+
+    assert items == []
+
+    output = subprocess.CompletedProcess([], 0, stdout="warning: odd ref\n")
+    monkeypatch.setattr(subprocess, "run", lambda *a, **k: output)
+    assert scan_repository(clones / "alpha", "octocat", 2021, 2021) == []
+
+
+def test_scan_repository_raises_for_broken_repositories(tmp_path):
+    (tmp_path / "broken" / ".git").mkdir(parents=True)
+
+    with pytest.raises(subprocess.CalledProcessError):
+        scan_repository(tmp_path / "broken", "octocat", 2021, 2021)
+
+
+def test_fetch_local_contributions_rejects_non_positive_workers(clones):
+    with pytest.raises(ValueError):
+        fetch_local_contributions("octocat", [clones], 2021, 2021, max_workers=0)
@@ -0,0 +1,115 @@
+"""Tests for the byte-bounded in-memory contribution cache."""
+
+from array import array
+
+import pytest
+
+from gitshelves.core.memory import ContributionCache, estimate_size
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_evicts_least_recently_used_entries_past_byte_budget():
+    cache = ContributionCache(max_bytes=100, sizeof=lambda value: value["size"])
+    cache.put("a", {"size": 40})
+    cache.put("b", {"size": 40})
+    assert cache.get("a") == {"size": 40}
+
+    cache.put("c", {"size": 40})
+
+    assert cache.peek("b") is None
+    assert cache.peek("a") is not None
+    assert cache.peek("c") is not None
+    stats = cache.stats()
+    assert stats.evictions == 1
+    assert stats.bytes == 80
+    assert stats.entries == 2
+
+
+def test_oversized_values_are_not_retained():
+    cache = ContributionCache(max_bytes=10, sizeof=len)
+
+    assert cache.put("big", "x" * 11) is False
+    assert cache.put("small", "x" * 10) is True
+    assert len(cache) == 1
+
+
+def test_ttl_expires_entries_on_lookup():
+    clock = FakeClock()
+    cache = ContributionCache(ttl=60, clock=clock)
+    cache.put("k", (1, 2, 3))
+
+    clock.now = 59
+    assert cache.get("k") == (1, 2, 3)
+    clock.now = 60
+    assert cache.get("k") is None
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.expirations) == (1, 1, 1)
+    assert stats.hit_rate == 0.5
+    assert stats.bytes == 0
+
+
+def test_invalidate_removes_selected_entries():
+    cache = ContributionCache()
+    cache.put(("year", "me", 2021), ())
+    cache.put(("year", "me", 2022), ())
+    cache.put(("year", "you", 2022), ())
+
+    assert cache.invalidate(("year", "me", 2021)) is True
+    assert cache.invalidate(("year", "me", 2021)) is False
+    assert cache.invalidate_where(lambda key: key[1] == "me") == 1
+    assert list(cache.keys()) == [("year", "you", 2022)]
+    cache.clear()
+    assert cache.stats().bytes == 0
+
+
+def test_estimate_size_walks_nested_items_and_buffers():
+    small = ({"created_at": "2022-01-01"},)
+    large = tuple(
+        {"created_at": "2022-01-01", "body": f"{index:<1000}"} for index in range(10)
+    )
+    days = array("I", range(1000))
+
+    assert estimate_size(large) > 10 * 1000 > estimate_size(small)
+    assert estimate_size(memoryview(days).toreadonly()) >= days.itemsize * 1000
+
+
+def test_estimate_size_charges_non_array_buffers():
+    payload = bytearray(4096)
+
+    assert estimate_size(memoryview(payload)) >= 4096
+
+
+def test_put_replaces_existing_entries():
+    cache = ContributionCache(max_bytes=100, sizeof=len)
+    cache.put("k", "x" * 30)
+    cache.put("k", "y" * 50)
+
+    assert "k" in cache
+    assert "missing" not in cache
+    assert cache.get("k") == "y" * 50
+    assert repr(cache) == "ContributionCache(entries=1, bytes=50, max_bytes=100)"
+    assert cache.stats().to_json() == {
+        "hits": 1,
+        "misses": 0,
+        "evictions": 0,
+        "expirations": 0,
+        "entries": 1,
+        "bytes": 50,
+        "max_bytes": 100,
+        "hit_rate": 1.0,
+    }
+
+
+def test_rejects_invalid_configuration():
+    with pytest.raises(ValueError):
+        ContributionCache(max_bytes=-1)
+    with pytest.raises(ValueError):
+        ContributionCache(ttl=0)
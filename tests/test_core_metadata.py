@@ -103,10 +103,20 @@ def test_metadata_writer_run_summary(tmp_path, writer: MetadataWriter, capsys):
     assert monthly_entry["scad"] == str(scad_path)
     assert monthly_entry["metadata"] == str(scad_path.with_suffix(".json"))
     assert monthly_entry["color_groups"] == 2
+    assert "fetch" not in payload
     captured = capsys.readouterr().out
     assert f"Wrote {summary_path}" in captured
 
 
+def test_metadata_writer_run_summary_includes_fetch_stats(tmp_path, writer, capsys):
+    writer.fetch_stats = {"requests": 3, "retries": 1}
+
+    payload = json.loads(writer.write_run_summary(tmp_path / "run.json").read_text())
+
+    assert payload["fetch"] == {"requests": 3, "retries": 1}
+    assert "fetch" not in writer._common_payload()
+
+
 def test_metadata_writer_includes_gridfinity_rows_in_summary(tmp_path, capsys):
     counts = {(2025, month): 0 for month in range(1, 13)}
     writer = MetadataWriter(
@@ -397,3 +407,66 @@ def test_metadata_writer_omits_gridfinity_rows_when_columns_disabled(tmp_path):
     payload = json.loads(metadata_path.read_text())
     assert payload["gridfinity"]["columns"] == 0
     assert "rows" not in payload["gridfinity"]
+
+
+def test_metadata_writer_reports_source_breakdown():
+    writer = MetadataWriter(
+        username="user",
+        start_year=2021,
+        end_year=2021,
+        monthly_counts={(2021, 1): 0, (2021, 2): 3},
+        daily_counts={(2021, 2, 1): 3},
+        months_per_row=12,
+        calendar_days_per_row=5,
+        colors=1,
+        gridfinity_layouts=False,
+        gridfinity_columns=6,
+        gridfinity_cubes=False,
+        baseplate_template="baseplate_2x6.scad",
+        monthly_sources={(2021, 2): {"prs": 1, "commits": 2}},
+        daily_sources={(2021, 2, 1): {"prs": 1, "commits": 2}},
+    )
+
+    monthly = writer.monthly_contributions()
+    assert monthly[0]["sources"] == {}
+    assert monthly[1]["sources"] == {"commits": 2, "prs": 1}
+    assert writer.daily_contributions()[0]["sources"] == {"commits": 2, "prs": 1}
+
+
+def test_run_summary_includes_rollup_stats(tmp_path):
+    from gitshelves.core.contributions import rollup_contributions
+    from gitshelves.core.grid import ContributionGrid
+
+    grid = ContributionGrid.from_maps(2021, 2021, daily={(2021, 2, 1): 3})
+    rollup = rollup_contributions(grid)
+    writer = MetadataWriter(
+        username="user",
+        start_year=2021,
+        end_year=2021,
+        monthly_counts=grid.monthly,
+        daily_counts=grid.daily,
+        months_per_row=12,
+        calendar_days_per_row=5,
+        colors=3,
+        gridfinity_layouts=False,
+        gridfinity_columns=6,
+        gridfinity_cubes=False,
+        baseplate_template="baseplate_2x6.scad",
+        rollup=rollup,
+    )
+
+    summary = json.loads(
+        writer.write_run_summary(tmp_path / "summary.json").read_text()
+    )
+
+    assert writer.color_groups == 1
+    assert summary["stats"]["total"] == 3
+    assert summary["stats"]["busiest_day"] == {"date": "2021-02-01", "count": 3}
+    assert summary["stats"]["years"]["2021"]["percentiles"]["p50"] == 3
+    assert {"iso_year": 2021, "week": 5, "count": 3} in summary["weekly_contributions"]
+    assert sum(week["count"] for week in summary["weekly_contributions"]) == 3
+
+
+def test_weekly_contributions_need_a_rollup(writer):
+    assert writer.rollup is None
+    assert writer.weekly_contributions() == []
@@ -0,0 +1,269 @@
+"""Tests for the shared rate-limit scheduler."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+
+from gitshelves.core import github
+from gitshelves.core.cache import SearchCache
+from gitshelves.core.ratelimit import DEFAULT_BACKOFF, RateLimiter
+
+
+class FakeClock:
+    def __init__(self, now=1_000.0):
+        self.now = now
+        self.sleeps: list[float] = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _response(status=200, **headers):
+    return SimpleNamespace(status_code=status, headers=headers)
+
+
+def test_token_bucket_paces_after_burst():
+    clock = FakeClock()
+    limiter = RateLimiter(rate=2.0, burst=2, clock=clock, sleep=clock.sleep)
+
+    for _ in range(4):
+        limiter.acquire()
+
+    assert clock.sleeps == [0.5, 0.5]
+
+
+def test_exhausted_quota_blocks_until_reset():
+    clock = FakeClock()
+    limiter = RateLimiter(rate=None, clock=clock, sleep=clock.sleep)
+
+    throttled = limiter.observe(
+        _response(**{"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1030"})
+    )
+    limiter.acquire()
+
+    assert throttled is False
+    assert limiter.remaining == 0
+    assert clock.sleeps == [30.0]
+
+
+def test_retry_after_marks_response_throttled():
+    clock = FakeClock()
+    limiter = RateLimiter(rate=None, clock=clock, sleep=clock.sleep)
+
+    assert limiter.observe(_response(429, **{"Retry-After": "7"})) is True
+    assert limiter.observe(_response(403)) is False
+    limiter.acquire()
+
+    assert clock.sleeps == [7.0]
+
+
+def test_secondary_rate_limit_body_backs_off():
+    clock = FakeClock()
+    limiter = RateLimiter(rate=None, clock=clock, sleep=clock.sleep)
+    body = "You have exceeded a secondary rate limit. Please wait."
+
+    assert limiter.observe(SimpleNamespace(status_code=403, headers={}, text=body))
+    assert not limiter.observe(SimpleNamespace(status_code=200, headers={}, text=body))
+    limiter.acquire()
+
+    assert clock.sleeps == [DEFAULT_BACKOFF]
+
+
+def test_unreadable_headers_and_bodies_are_not_throttled():
+    limiter = RateLimiter(rate=None)
+
+    class Unreadable:
+        status_code = 429
+        headers = {"X-RateLimit-Remaining": "soon", "Retry-After": None}
+
+        @property
+        def text(self):
+            raise ValueError("binary body")
+
+    assert limiter.observe(Unreadable()) is False
+    assert limiter.remaining is None
+
+
+def test_rejects_invalid_configuration():
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
+    with pytest.raises(ValueError):
+        RateLimiter(burst=0)
+
+
+class _ScriptedHandler(BaseHTTPRequestHandler):
+    script: list[tuple[int, dict]] = []
+    seen: list[str] = []
+
+    def do_GET(self):  # noqa: N802 - http.server naming
+        self.seen.append(self.path)
+        status, headers = self.script.pop(0)
+        body = json.dumps({"total_count": 1, "items": [{"id": 1}]}).encode()
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ScriptedHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_fetch_sleeps_through_stub_rate_limit(monkeypatch, stub_server):
+    clock = FakeClock()
+    _ScriptedHandler.seen = []
+    _ScriptedHandler.script = [
+        (403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1060"}),
+        (429, {"Retry-After": "5"}),
+        (200, {"X-RateLimit-Remaining": "29", "X-RateLimit-Reset": "1120"}),
+    ]
+    host, port = stub_server.server_address
+    monkeypatch.setattr(github, "GITHUB_API", f"http://{host}:{port}/search/issues")
+    limiter = RateLimiter(rate=None, clock=clock, sleep=clock.sleep)
+    monkeypatch.setattr(github, "rate_limiter", limiter)
+
+    items = github.fetch_user_contributions("me", start_year=2022, end_year=2022)
+
+    assert items == [{"id": 1}]
+    assert len(_ScriptedHandler.seen) == 3
+    assert clock.sleeps == [60.0, 5.0]
+    assert limiter.remaining == 29
+
+
+def test_fetch_raises_after_retries_exhausted(monkeypatch, stub_server):
+    clock = FakeClock()
+    _ScriptedHandler.seen = []
+    _ScriptedHandler.script = [(429, {"Retry-After": "1"})] * 2
+    host, port = stub_server.server_address
+    monkeypatch.setattr(github, "GITHUB_API", f"http://{host}:{port}/search/issues")
+    monkeypatch.setattr(
+        github,
+        "rate_limiter",
+        RateLimiter(rate=None, max_retries=1, clock=clock, sleep=clock.sleep),
+    )
+
+    with pytest.raises(github.requests.HTTPError):
+        github.fetch_user_contributions("me", start_year=2022, end_year=2022)
+    assert len(_ScriptedHandler.seen) == 2
+
+
+def test_token_pool_prefers_most_remaining_quota():
+    clock = FakeClock()
+    pool = github.TokenPool(
+        ["a", "b"],
+        limiter_factory=lambda: RateLimiter(rate=None, clock=clock, sleep=clock.sleep),
+        sleep=clock.sleep,
+    )
+    pool.limiter_for("a").observe(_response(**{"X-RateLimit-Remaining": "3"}))
+    pool.limiter_for("b").observe(_response(**{"X-RateLimit-Remaining": "20"}))
+
+    token, limiter = pool.acquire()
+
+    assert token == "b"
+    assert limiter is pool.limiter_for("b")
+    assert pool.remaining() == [3, 20]
+    assert "a" not in repr(pool)
+
+
+def test_token_pool_sleeps_until_first_token_resets():
+    clock = FakeClock()
+    pool = github.TokenPool(
+        ["a", "b"],
+        limiter_factory=lambda: RateLimiter(rate=None, clock=clock, sleep=clock.sleep),
+        sleep=clock.sleep,
+    )
+    pool.limiter_for("a").observe(
+        _response(**{"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1050"})
+    )
+    pool.limiter_for("b").observe(
+        _response(**{"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1020"})
+    )
+
+    token, _ = pool.acquire()
+
+    assert token == "b"
+    assert clock.sleeps == [20.0]
+
+
+def test_token_pool_identity_is_stable_and_opaque():
+    pool = github.TokenPool(["secret-a", "secret-b"])
+
+    assert pool.identity == github.TokenPool(["secret-b", "secret-a"]).identity
+    assert pool.identity != github.TokenPool(["secret-a"]).identity
+    assert pool.identity.startswith("pool:")
+    assert "secret" not in pool.identity + repr(pool)
+
+
+def test_token_pool_scopes_disk_cache_entries(monkeypatch, tmp_path):
+    def fake_get(url, headers=None, params=None, timeout=10):
+        return SimpleNamespace(
+            status_code=200,
+            headers={},
+            links={},
+            raise_for_status=lambda: None,
+            json=lambda: {"items": [{"id": 1}]},
+        )
+
+    monkeypatch.setattr(github, "http_session", lambda: SimpleNamespace(get=fake_get))
+    pool = github.TokenPool(["a", "b"])
+
+    github.fetch_user_contributions(
+        "me", token=pool, start_year=2020, end_year=2020, cache_dir=tmp_path
+    )
+
+    entry = SearchCache(tmp_path).load(
+        "me", "2020-01-01", "2020-12-31", token=pool.identity
+    )
+    assert entry.items == [{"id": 1}]
+
+
+def test_token_pool_rejects_empty_token_list():
+    with pytest.raises(ValueError):
+        github.TokenPool(["", None])
+
+
+def test_fetch_rotates_pool_tokens(monkeypatch):
+    seen = []
+    quota = {"a": 10, "b": 10}
+
+    def fake_get(url, headers=None, params=None, timeout=10):
+        token = headers["Authorization"].removeprefix("token ")
+        seen.append(token)
+        quota[token] -= 1
+        return SimpleNamespace(
+            status_code=200,
+            headers={"X-RateLimit-Remaining": str(quota[token])},
+            links={},
+            raise_for_status=lambda: None,
+            json=lambda: {"items": []},
+        )
+
+    monkeypatch.setattr(github, "http_session", lambda: SimpleNamespace(get=fake_get))
+    pool = github.TokenPool(["a", "b"], limiter_factory=lambda: RateLimiter(rate=None))
+
+    github.fetch_user_contributions(
+        "me", token=pool, start_year=2018, end_year=2021, max_workers=1
+    )
+
+    assert seen == ["a", "b", "a", "b"]
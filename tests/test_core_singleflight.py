@@ -0,0 +1,80 @@
+"""Tests for coalescing concurrent identical calls."""
+
+import asyncio
+import threading
+
+import pytest
+
+from gitshelves.core.singleflight import SingleFlight
+
+
+def test_concurrent_callers_share_one_execution():
+    flights = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return {"value": 42}
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flights.do("k", slow)))
+    leader.start()
+    started.wait(5)
+    followers = [
+        threading.Thread(target=lambda: results.append(flights.do("k", slow)))
+        for _ in range(4)
+    ]
+    for thread in followers:
+        thread.start()
+    threading.Event().wait(0.05)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join(5)
+
+    assert calls == [1]
+    assert len(results) == 5
+    assert all(result is results[0] for result in results)
+    assert len(flights) == 0
+
+
+def test_key_is_released_after_completion():
+    flights = SingleFlight()
+    counter = iter(range(10))
+
+    assert flights.do("k", next, counter) == 0
+    assert flights.do("k", next, counter) == 1
+
+
+def test_exceptions_propagate_and_release_key():
+    flights = SingleFlight()
+
+    def boom():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        flights.do("k", boom)
+    assert flights.do("k", lambda: "ok") == "ok"
+
+
+def test_async_callers_share_one_execution():
+    flights = SingleFlight()
+    calls = []
+    release = threading.Event()
+
+    def slow(value):
+        calls.append(value)
+        release.wait(5)
+        return value * 2
+
+    async def run():
+        tasks = [asyncio.create_task(flights.do_async("k", slow, 21)) for _ in range(5)]
+        await asyncio.sleep(0.05)
+        release.set()
+        return await asyncio.gather(*tasks)
+
+    assert asyncio.run(run()) == [42] * 5
+    assert calls == [21]
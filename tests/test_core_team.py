@@ -0,0 +1,103 @@
+"""Tests for merging team members' contribution grids."""
+
+import threading
+import time
+
+import pytest
+
+from gitshelves.core.grid import ContributionGrid
+from gitshelves.core.team import (
+    load_member_grids,
+    member_breakdowns,
+    read_logins,
+    sum_breakdowns,
+)
+from gitshelves.core.workers import current_budget
+
+
+def _grid(*days):
+    grid = ContributionGrid(2024, 2024)
+    for month, day, count in days:
+        grid.add(2024, month, day, count)
+    return grid
+
+
+def test_load_member_grids_runs_concurrently_and_dedupes():
+    barrier = threading.Barrier(2, timeout=5)
+    calls = []
+
+    def load(member):
+        calls.append(member)
+        barrier.wait()
+        return _grid((1, 1, len(member)))
+
+    grids = load_member_grids(["alice", "Bob", "ALICE"], load, max_workers=2)
+
+    assert list(grids) == ["alice", "Bob"]
+    assert sorted(calls) == ["Bob", "alice"]
+    assert grids["Bob"].count(2024, 1, 1) == 3
+
+
+def test_load_member_grids_propagates_errors():
+    def load(member):
+        raise RuntimeError(member)
+
+    with pytest.raises(RuntimeError):
+        load_member_grids(["alice"], load)
+    with pytest.raises(ValueError):
+        load_member_grids([], load)
+    with pytest.raises(ValueError):
+        load_member_grids(["alice"], load, max_workers=0)
+
+
+def test_load_member_grids_shares_one_budget_with_nested_fetches():
+    lock = threading.Lock()
+    active = peak = 0
+
+    def fetch_page(page):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+        return page
+
+    def load(member):
+        budget = current_budget()
+        assert budget is not None and budget.max_workers == 3
+        return _grid((1, 1, len(budget.map(fetch_page, range(6)))))
+
+    grids = load_member_grids(["alice", "bob", "carol", "dave"], load, max_workers=3)
+
+    assert [grid.total for grid in grids.values()] == [6, 6, 6, 6]
+    assert peak <= 3
+
+
+def test_read_logins_skips_blank_lines_and_comments(tmp_path):
+    path = tmp_path / "team.txt"
+    path.write_text("# core team\nalice\n\n  bob  # lead\n", encoding="utf-8")
+
+    assert read_logins(path) == ["alice", "bob"]
+    path.write_bytes(b"\xff\xfe")
+    with pytest.raises(UnicodeDecodeError):
+        read_logins(path)
+
+
+def test_member_breakdowns_list_nonzero_counts():
+    grids = {"alice": _grid((1, 2, 1), (3, 1, 2)), "bob": _grid((1, 2, 4))}
+
+    monthly, daily = member_breakdowns(grids)
+
+    assert monthly == {(2024, 1): {"alice": 1, "bob": 4}, (2024, 3): {"alice": 2}}
+    assert daily[(2024, 1, 2)] == {"alice": 1, "bob": 4}
+    assert list(daily) == [(2024, 1, 2), (2024, 3, 1)]
+
+
+def test_sum_breakdowns_adds_labels():
+    total = sum_breakdowns(
+        [{(2024, 1): {"prs": 1}}, {(2024, 1): {"prs": 2, "issues": 1}}]
+    )
+
+    assert total == {(2024, 1): {"prs": 3, "issues": 1}}
@@ -0,0 +1,217 @@
+"""Tests for pluggable transports and the local search API stub."""
+
+import json
+from datetime import date, timedelta
+
+import pytest
+
+from gitshelves.core import github, stubserver
+from gitshelves.core.stubserver import StubServer, synthetic_day_count
+from gitshelves.core.transport import Cassette, RecordingTransport, ReplayTransport
+
+
+def _expected_total(username, start, end, events_per_day):
+    day, total = start, 0
+    while day <= end:
+        total += synthetic_day_count(username, day, events_per_day)
+        day += timedelta(days=1)
+    return total
+
+
+def test_fetch_against_stub_paginates_and_bisects(monkeypatch):
+    with StubServer(events_per_day=4) as stub:
+        monkeypatch.setattr(github, "GITHUB_API", stub.search_url)
+        items = github.fetch_user_contributions(
+            "octocat", start_year=2021, end_year=2021
+        )
+
+    expected = _expected_total("octocat", date(2021, 1, 1), date(2021, 12, 31), 4)
+    assert expected > github.SEARCH_RESULT_CAP
+    assert len(items) == expected
+    assert len({item["id"] for item in items}) == expected
+    assert [item["created_at"] for item in items] == sorted(
+        item["created_at"] for item in items
+    )
+
+
+def test_recorded_session_replays_offline(monkeypatch, tmp_path):
+    with StubServer(events_per_day=1) as stub:
+        monkeypatch.setattr(github, "GITHUB_API", stub.search_url)
+        recorder = RecordingTransport(github.http_session())
+        with github.use_transport(recorder):
+            recorded = github.fetch_user_contributions(
+                "octocat", start_year=2020, end_year=2021
+            )
+        live_requests = stub.requests
+    cassette_path = recorder.cassette.save(tmp_path / "session.json")
+    github.contribution_cache.clear()
+
+    with github.use_transport(ReplayTransport(cassette_path)):
+        replayed = github.fetch_user_contributions(
+            "octocat", start_year=2020, end_year=2021
+        )
+
+    assert replayed == recorded
+    assert len(Cassette.load(cassette_path)) == live_requests
+    assert github.get_transport() is github.http_session()
+
+
+def test_replay_rejects_unrecorded_requests():
+    transport = ReplayTransport(Cassette())
+
+    with pytest.raises(github.requests.ConnectionError):
+        transport.get(github.GITHUB_API, params={"q": "author:me", "page": 1})
+
+
+def test_stub_replays_cassette_over_http(monkeypatch, tmp_path):
+    with StubServer() as live:
+        monkeypatch.setattr(github, "GITHUB_API", live.search_url)
+        recorder = RecordingTransport(github.http_session())
+        with github.use_transport(recorder):
+            recorded = github.fetch_user_contributions(
+                "octocat", start_year=2022, end_year=2022
+            )
+    github.contribution_cache.clear()
+
+    with StubServer(cassette=recorder.cassette) as replay:
+        monkeypatch.setattr(github, "GITHUB_API", replay.search_url)
+        replayed = github.fetch_user_contributions(
+            "octocat", start_year=2022, end_year=2022
+        )
+
+    assert replayed == recorded
+
+
+def test_stub_enforces_rate_limit_headers():
+    stub = StubServer(rate_limit=2, reset_interval=3600)
+    target = "/search/issues?q=author%3Ame+created%3A2022-01-01..2022-01-31"
+    try:
+        statuses = [stub.respond(target, {})[0] for _ in range(3)]
+        _, headers, _ = stub.respond(target, {})
+    finally:
+        stub.stop()
+
+    assert statuses == [200, 200, 403]
+    assert headers["X-RateLimit-Remaining"] == "0"
+    assert float(headers["X-RateLimit-Reset"]) > 0
+
+
+def test_stub_answers_matching_etag_with_not_modified():
+    stub = StubServer()
+    target = "/search/issues?q=author%3Ame+created%3A2022-01-01..2022-01-31"
+    try:
+        status, headers, body = stub.respond(target, {})
+        revalidated = stub.respond(target, {"If-None-Match": headers["ETag"]})
+    finally:
+        stub.stop()
+
+    assert status == 200
+    assert '"total_count"' in body
+    assert revalidated[0] == 304
+
+
+def test_stub_validates_configuration(tmp_path):
+    with pytest.raises(ValueError):
+        StubServer(events_per_day=-1)
+    with pytest.raises(ValueError):
+        StubServer(latency=-0.1)
+    with pytest.raises(ValueError):
+        StubServer(rate_limit=0)
+    cassette = tmp_path / "old.json"
+    cassette.write_text('{"version": 0}')
+    with pytest.raises(ValueError, match="unsupported cassette version"):
+        StubServer(cassette=cassette)
+
+
+def test_stub_replay_answers_unknown_requests_with_not_found(tmp_path):
+    path = Cassette().save(tmp_path / "empty.json")
+    stub = StubServer(cassette=path)
+    try:
+        status, headers, body = stub.respond("/search/issues?q=author%3Ame", {})
+    finally:
+        stub.stop()
+
+    assert status == 404
+    assert headers == {"Content-Type": "application/json"}
+    assert "message" in json.loads(body)
+
+
+@pytest.mark.parametrize(
+    "target, message",
+    [
+        ("/search/issues?q=author%3Ame", "Validation Failed"),
+        (
+            "/search/commits?q=author%3Ame+created%3A2022-01-01..2022-01-31",
+            "Validation Failed",
+        ),
+        (
+            "/search/issues?q=author%3Ame+created%3A2022-01-01..2022-01-31"
+            "&per_page=100&page=11",
+            "Only the first 1000 search results are available",
+        ),
+    ],
+)
+def test_stub_rejects_invalid_searches(target, message):
+    stub = StubServer()
+    try:
+        status, _headers, body = stub.respond(target, {})
+    finally:
+        stub.stop()
+
+    assert status == 422
+    assert json.loads(body)["message"] == message
+
+
+def test_stub_refills_quota_after_reset_interval(monkeypatch):
+    now = [1_000.0]
+    monkeypatch.setattr(stubserver.time, "time", lambda: now[0])
+    slept = []
+    monkeypatch.setattr(stubserver.time, "sleep", slept.append)
+    stub = StubServer(latency=0.25, rate_limit=1, reset_interval=10)
+    target = "/search/issues?q=author%3Ame+created%3A2022-01-01..2022-01-01"
+    try:
+        first = stub.respond(target, {})
+        exhausted = stub.respond(target, {})
+        now[0] += 10
+        refilled = stub.respond(target, {})
+    finally:
+        stub.stop()
+
+    assert [first[0], exhausted[0], refilled[0]] == [200, 403, 200]
+    assert json.loads(exhausted[2])["message"] == "API rate limit exceeded"
+    assert exhausted[1]["X-RateLimit-Reset"] == "1010"
+    assert refilled[1]["X-RateLimit-Reset"] == "1020"
+    assert slept == [0.25, 0.25, 0.25]
+
+
+def test_stub_main_serves_until_interrupted(monkeypatch, tmp_path, capsys):
+    path = Cassette().save(tmp_path / "session.json")
+    started = []
+
+    def interrupt(_seconds):
+        started.append(True)
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(stubserver.time, "sleep", interrupt)
+
+    stubserver.main(
+        [
+            "--port",
+            "0",
+            "--events-per-day",
+            "1",
+            "--latency",
+            "0",
+            "--rate-limit",
+            "5",
+            "--reset-interval",
+            "30",
+            "--replay",
+            str(path),
+        ]
+    )
+
+    assert started == [True]
+    assert capsys.readouterr().out.startswith(
+        "Serving GitHub search stub at http://127.0.0.1:"
+    )
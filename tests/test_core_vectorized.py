@@ -0,0 +1,133 @@
+"""Tests for the optional NumPy aggregation path."""
+
+import random
+from array import array
+from datetime import date
+
+import pytest
+
+from gitshelves.core import vectorized
+from gitshelves.core.contributions import (
+    ContributionAggregator,
+    build_contribution_maps,
+)
+from gitshelves.core.events import pack_event_days
+
+np = pytest.importorskip("numpy")
+
+ODD_TIMESTAMPS = [
+    "2024-02-29T10:00:00Z",
+    "2023-02-29T00:00:00Z",
+    "2023-13-01",
+    "2023-00-10",
+    "0000-01-01",
+    "1969-12-31T23:59:59Z",
+    "2023-W05-3",
+    "20230201",
+    "2023-2-01",
+    "2é23-02-01",
+    "bogus",
+    "",
+    None,
+]
+
+
+def _items(count, seed=7):
+    rng = random.Random(seed)
+    items = []
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.05:
+            created_at = rng.choice(ODD_TIMESTAMPS)
+        else:
+            created_at = (
+                f"{rng.randint(2018, 2024)}-{rng.randint(1, 12):02d}-"
+                f"{rng.randint(1, 28):02d}T{rng.randint(0, 23):02d}:00:00Z"
+            )
+        item = {"created_at": created_at}
+        if roll > 0.7:
+            item["source"] = rng.choice(["prs", "commits"])
+        items.append(item)
+    items.append({"id": 1})
+    return items
+
+
+def test_vectorized_maps_match_pure_python():
+    items = _items(5000)
+
+    expected = build_contribution_maps(items, 2019, 2023, vectorize=False)
+    actual = build_contribution_maps(items, 2019, 2023, vectorize=True)
+
+    assert actual == expected
+    assert list(actual[2]) == list(expected[2])
+
+
+def test_vectorized_source_maps_match_pure_python():
+    items = _items(2000, seed=11)
+    pure, fast = ContributionAggregator(), ContributionAggregator()
+
+    assert pure.update(items) == fast.update_batch(items)
+    assert fast.monthly == pure.monthly
+    assert fast.daily == pure.daily
+    assert fast.source_maps(2018, 2024) == pure.source_maps(2018, 2024)
+
+
+def test_vectorized_packed_days_match_pure_python():
+    packed = pack_event_days(_items(3000, seed=3))
+
+    expected = build_contribution_maps(packed, 2018, 2024, vectorize=False)
+
+    assert build_contribution_maps(memoryview(packed), 2018, 2024) == expected
+    assert build_contribution_maps(packed, 2018, 2024, vectorize=True) == expected
+
+
+def test_vectorized_path_is_chosen_for_large_sequences(monkeypatch):
+    calls = []
+    original = ContributionAggregator.update_batch
+
+    def spy(self, items):
+        calls.append(len(items))
+        return original(self, items)
+
+    monkeypatch.setattr(ContributionAggregator, "update_batch", spy)
+    monkeypatch.setattr(vectorized, "VECTORIZE_THRESHOLD", 3)
+    items = [{"created_at": "2023-05-01T00:00:00Z"}] * 3
+
+    build_contribution_maps(items, 2023, 2023)
+    build_contribution_maps(iter(items), 2023, 2023)
+    build_contribution_maps(items[:2], 2023, 2023)
+
+    assert calls == [3]
+
+
+def test_vectorized_requires_numpy(monkeypatch):
+    monkeypatch.setattr(vectorized, "np", None)
+
+    with pytest.raises(RuntimeError):
+        build_contribution_maps([], 2023, 2023, vectorize=True)
+    assert build_contribution_maps(array("I"), 2023, 2023, vectorize=False)[3] == {}
+
+
+def test_bin_epoch_days_counts_dense_bins():
+    monthly, daily = vectorized.bin_epoch_days(np.array([0, 0, 31, -1]))
+
+    assert monthly == {(1969, 12): 1, (1970, 1): 2, (1970, 2): 1}
+    assert daily == {(1969, 12, 31): 1, (1970, 1, 1): 2, (1970, 2, 1): 1}
+
+
+def test_parse_epoch_days_hands_non_strings_to_parse():
+    def parse(value):
+        if not isinstance(value, date):
+            raise ValueError(value)
+        return value
+
+    days, kept = vectorized.parse_epoch_days(
+        [date(1970, 1, 2), None, 7, date(1969, 12, 31)], parse
+    )
+
+    assert days.tolist() == [1, -1]
+    assert kept.tolist() == [0, 3]
+
+
+def test_bin_epoch_days_handles_no_days():
+    assert vectorized.bin_epoch_days([]) == ({}, {})
@@ -0,0 +1,120 @@
+"""Tests for incremental watermark refreshes."""
+
+import json
+from datetime import date
+
+import pytest
+
+from gitshelves.core.contributions import build_contribution_maps
+from gitshelves.core.watermark import (
+    WATERMARK_VERSION,
+    WatermarkStore,
+    refresh_contribution_maps,
+)
+
+
+class FakeSource:
+    def __init__(self, days):
+        self.days = list(days)
+        self.calls: list[date] = []
+
+    def __call__(self, username, since, token=None, **options):
+        self.calls.append(since)
+        self.options = options
+        return [
+            {"created_at": f"{day}T12:00:00Z"}
+            for day in self.days
+            if date.fromisoformat(day) >= since
+        ]
+
+
+def test_first_refresh_fetches_full_range(tmp_path):
+    source = FakeSource(["2023-01-05", "2023-02-10", "2024-03-01"])
+    store = WatermarkStore(tmp_path)
+
+    result = refresh_contribution_maps(
+        "me", store, start_year=2023, end_year=2024, fetch_since=source
+    )
+
+    assert source.calls == [date(2023, 1, 1)]
+    items = [{"created_at": f"{day}T12:00:00Z"} for day in source.days]
+    assert result == build_contribution_maps(items, 2023, 2024)
+    state = store.load("me")
+    assert state.watermark == date(2024, 3, 1)
+
+
+def test_refresh_only_fetches_since_watermark(tmp_path):
+    source = FakeSource(["2023-01-05", "2023-02-10"])
+    store = WatermarkStore(tmp_path)
+    refresh_contribution_maps(
+        "me", store, start_year=2023, end_year=2023, fetch_since=source
+    )
+
+    # Another event lands on the watermark day and one after it.
+    source.days += ["2023-02-10", "2023-03-01"]
+    _, _, monthly, daily = refresh_contribution_maps(
+        "me", store, start_year=2023, end_year=2023, fetch_since=source
+    )
+
+    assert source.calls == [date(2023, 1, 1), date(2023, 2, 10)]
+    assert daily == {(2023, 1, 5): 1, (2023, 2, 10): 2, (2023, 3, 1): 1}
+    assert monthly[(2023, 2)] == 2
+    assert store.load("me").watermark == date(2023, 3, 1)
+
+
+def test_refresh_refetches_when_range_starts_earlier(tmp_path):
+    source = FakeSource(["2022-06-01", "2023-01-05"])
+    store = WatermarkStore(tmp_path)
+    refresh_contribution_maps(
+        "me", store, start_year=2023, end_year=2023, fetch_since=source
+    )
+
+    _, _, monthly, daily = refresh_contribution_maps(
+        "me", store, start_year=2022, end_year=2023, fetch_since=source
+    )
+
+    assert source.calls[-1] == date(2022, 1, 1)
+    assert daily == {(2022, 6, 1): 1, (2023, 1, 5): 1}
+    assert len(monthly) == 24
+
+
+def test_store_ignores_corrupt_state(tmp_path):
+    store = WatermarkStore(tmp_path)
+    store.path_for("me").write_text("nope")
+
+    assert store.load("me") is None
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"version": WATERMARK_VERSION + 1, "username": "me"},
+        {"version": WATERMARK_VERSION, "username": "me", "start": "2023-01-01"},
+        {
+            "version": WATERMARK_VERSION,
+            "username": "me",
+            "start": "x",
+            "watermark": "y",
+        },
+    ],
+)
+def test_store_ignores_incompatible_state(tmp_path, payload):
+    store = WatermarkStore(tmp_path)
+    store.path_for("me").write_text(json.dumps(payload))
+
+    assert store.load("me") is None
+
+
+def test_refresh_forwards_max_workers(tmp_path):
+    source = FakeSource(["2023-01-05"])
+
+    refresh_contribution_maps(
+        "me",
+        WatermarkStore(tmp_path),
+        start_year=2023,
+        end_year=2023,
+        fetch_since=source,
+        max_workers=3,
+    )
+
+    assert source.options == {"max_workers": 3}
@@ -0,0 +1,87 @@
+"""Tests for the worker budget shared by nested fan-outs."""
+
+import threading
+import time
+
+import pytest
+
+from gitshelves.core.workers import WorkerBudget, current_budget
+
+
+class Gauge:
+    """Track how many calls run at once."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def __call__(self, value):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.01)
+        with self.lock:
+            self.active -= 1
+        return value
+
+
+def test_map_keeps_order_and_runs_concurrently():
+    gauge = Gauge()
+
+    with WorkerBudget(3) as budget:
+        results = budget.map(lambda value: gauge(value * 2), range(12))
+
+    assert results == [value * 2 for value in range(12)]
+    assert gauge.peak == 3
+
+
+def test_nested_maps_share_one_budget():
+    gauge = Gauge()
+    threads = set()
+
+    def leaf(value):
+        threads.add(threading.current_thread().name)
+        return gauge(value)
+
+    def branch(values):
+        return sum(current_budget().map(leaf, values))
+
+    with WorkerBudget(3) as budget:
+        totals = budget.map(branch, [range(5), range(5, 10), range(10, 15)] * 2)
+
+    assert totals == [10, 35, 60] * 2
+    assert gauge.peak <= 3
+    assert len(threads) <= 3
+    assert current_budget() is None
+
+
+def test_single_worker_runs_inline():
+    caller = threading.current_thread()
+
+    with WorkerBudget(1) as budget:
+        threads = budget.map(lambda _: threading.current_thread(), range(3))
+
+    assert threads == [caller] * 3
+
+
+def test_first_error_propagates_after_helpers_finish():
+    finished = []
+
+    def work(value):
+        if value == 2:
+            raise RuntimeError("boom")
+        time.sleep(0.02)
+        finished.append(value)
+        return value
+
+    with WorkerBudget(3) as budget:
+        with pytest.raises(RuntimeError, match="boom"):
+            budget.map(work, range(3))
+
+    assert sorted(finished) == [0, 1]
+
+
+def test_rejects_non_positive_budget():
+    with pytest.raises(ValueError):
+        WorkerBudget(0)
@@ -1,15 +1,15 @@
-from datetime import UTC, datetime, timezone
+import asyncio
+from datetime import UTC, date, datetime, timezone
+import threading
+import time
+
 import pytest
 
 import gitshelves.fetch as fetch
 from gitshelves.core import github
+from gitshelves.core.watermark import WatermarkStore, refresh_contribution_maps
 
-
-@pytest.fixture(autouse=True)
-def clear_fetch_cache():
-    github._cached_fetch.cache_clear()
-    yield
-    github._cached_fetch.cache_clear()
+from conftest import FakeSession
 
 
 def test_fetch_single_page(monkeypatch):
@@ -20,6 +20,9 @@ def test_fetch_single_page(monkeypatch):
         called["params"] = params.copy()
 
         class Resp:
+            headers: dict = {}
+            status_code = 200
+
             links = {}
 
             @staticmethod
@@ -32,7 +35,7 @@ def test_fetch_single_page(monkeypatch):
 
         return Resp()
 
-    monkeypatch.setattr(fetch.requests, "get", fake_get)
+    monkeypatch.setattr(fetch, "http_session", lambda: FakeSession(fake_get))
     items = fetch.fetch_user_contributions("me", start_year=2022, end_year=2022)
 
     assert items == [{"id": 1}]
@@ -53,6 +56,9 @@ def test_fetch_multiple_pages_with_token(monkeypatch):
         queries.append(params["q"])
 
         class Resp:
+            headers: dict = {}
+            status_code = 200
+
             def __init__(self, page):
                 self.links = {"next": "x"} if page == 1 else {}
                 self.page = page
@@ -75,7 +81,7 @@ def test_fetch_multiple_pages_with_token(monkeypatch):
             return datetime(2021, 1, 1, tzinfo=tz)
 
     monkeypatch.setattr(fetch, "datetime", DummyDateTime)
-    monkeypatch.setattr(fetch.requests, "get", fake_get)
+    monkeypatch.setattr(fetch, "http_session", lambda: FakeSession(fake_get))
 
     items = fetch.fetch_user_contributions("me", token="T")
 
@@ -110,6 +116,9 @@ def test_fetch_user_contributions_env_token(monkeypatch):
         called["headers"] = headers
 
         class Resp:
+            headers: dict = {}
+            status_code = 200
+
             links = {}
 
             @staticmethod
@@ -122,7 +131,7 @@ def test_fetch_user_contributions_env_token(monkeypatch):
 
         return Resp()
 
-    monkeypatch.setattr(fetch.requests, "get", fake_get)
+    monkeypatch.setattr(fetch, "http_session", lambda: FakeSession(fake_get))
     monkeypatch.setenv("GH_TOKEN", "T")
 
     fetch.fetch_user_contributions("me")
@@ -136,7 +145,7 @@ def test_fetch_user_contributions_rejects_invalid_year_range(monkeypatch):
     def fake_get(*args, **kwargs):  # pragma: no cover - should not be called
         raise AssertionError("network call not expected")
 
-    monkeypatch.setattr(fetch.requests, "get", fake_get)
+    monkeypatch.setattr(fetch, "http_session", lambda: FakeSession(fake_get))
 
     with pytest.raises(ValueError):
         fetch.fetch_user_contributions("me", start_year=2025, end_year=2024)
@@ -173,6 +182,9 @@ def test_fetch_user_contributions_caches_responses(monkeypatch):
         calls += 1
 
         class Resp:
+            headers: dict = {}
+            status_code = 200
+
             links = {}
 
             @staticmethod
@@ -185,7 +197,7 @@ def test_fetch_user_contributions_caches_responses(monkeypatch):
 
         return Resp()
 
-    monkeypatch.setattr(fetch.requests, "get", fake_get)
+    monkeypatch.setattr(fetch, "http_session", lambda: FakeSession(fake_get))
 
     fetch.fetch_user_contributions("me", start_year=2022, end_year=2022)
     fetch.fetch_user_contributions("me", start_year=2022, end_year=2022)
@@ -202,3 +214,766 @@ def test_fetch_shim_allows_github_rebinding():
         assert fetch._github is replacement
     finally:
         fetch._github = original
+
+
+def test_fetch_shards_years_concurrently(monkeypatch):
+    barrier = threading.Barrier(3, timeout=5)
+    windows = []
+
+    def fake_get(url, headers=None, params=None, timeout=10):
+        windows.append(params["q"])
+        barrier.wait()
+        year = params["q"].split("created:")[1][:4]
+
+        class Resp:
+            headers: dict = {}
+            status_code = 200
+            links = {}
+
+            @staticmethod
+            def raise_for_status():
+                pass
+
+            @staticmethod
+            def json():
+                return {"items": [{"year": year}]}
+
+        return Resp()
+
+    monkeypatch.setattr(fetch, "http_session", lambda: FakeSession(fake_get))
+
+    items = fetch.fetch_user_contributions(
+        "me", start_year=2020, end_year=2022, max_workers=3
+    )
+
+    assert items == [{"year": "2020"}, {"year": "2021"}, {"year": "2022"}]
+    assert sorted(windows) == [
+        f"author:me created:{year}-01-01..{year}-12-31" for year in (2020, 2021, 2022)
+    ]
+
+
+def test_fetch_rejects_non_positive_workers():
+    with pytest.raises(ValueError):
+        fetch.fetch_user_contributions("me", start_year=2022, max_workers=0)
+    with pytest.raises(ValueError):
+        github.fetch_contribution_days("me", start_year=2022, max_workers=0)
+
+
+def test_http_session_is_shared():
+    assert github.http_session() is github.http_session()
+
+
+def _synthetic_get(events, calls):
+    """Return a fake ``get`` serving ``events`` (ISO dates) like the Search API."""
+
+    def fake_get(url, headers=None, params=None, timeout=10):
+        calls.append((params["q"], params["page"]))
+        window = params["q"].split("created:")[1]
+        start, end = window.split("..")
+        matches = [day for day in events if start <= day <= end]
+        visible = matches[: github.SEARCH_RESULT_CAP]
+        per_page = params["per_page"]
+        offset = (params["page"] - 1) * per_page
+        page_items = visible[offset : offset + per_page]
+
+        class Resp:
+            headers: dict = {}
+            status_code = 200
+            links = {"next": {}} if offset + per_page < len(visible) else {}
+
+            @staticmethod
+            def raise_for_status():
+                pass
+
+            @staticmethod
+            def json():
+                return {
+                    "total_count": len(matches),
+                    "items": [{"created_at": f"{day}T00:00:00Z"} for day in page_items],
+                }
+
+        return Resp()
+
+    return fake_get
+
+
+def test_fetch_bisects_windows_over_result_cap(monkeypatch):
+    events = [f"2022-{month:02d}-15" for month in range(1, 13) for _ in range(200)]
+    calls = []
+    monkeypatch.setattr(
+        fetch, "http_session", lambda: FakeSession(_synthetic_get(events, calls))
+    )
+
+    items = fetch.fetch_user_contributions("me", start_year=2022, end_year=2022)
+
+    assert len(items) == 2400
+    assert [item["created_at"][:10] for item in items] == events
+    windows = {query for query, _ in calls}
+    assert "author:me created:2022-01-01..2022-12-31" in windows
+    # Leaves reuse their probe as page one, so only the root probe is extra.
+    leaf_pages = [page for _, page in calls]
+    assert leaf_pages.count(1) == len(windows)
+
+
+def test_fetch_stops_bisecting_single_days(monkeypatch):
+    events = ["2022-03-01"] * 1200
+    calls = []
+    monkeypatch.setattr(
+        fetch, "http_session", lambda: FakeSession(_synthetic_get(events, calls))
+    )
+
+    items = fetch.fetch_user_contributions("me", start_year=2022, end_year=2022)
+
+    assert len(items) == github.SEARCH_RESULT_CAP
+    assert ("author:me created:2022-03-01..2022-03-01", 1) in calls
+
+
+def _year_echo_get(calls, barrier=None):
+    def fake_get(url, headers=None, params=None, timeout=10):
+        calls.append(params["q"])
+        if barrier is not None:
+            barrier.wait()
+        user = params["q"].split()[0].removeprefix("author:")
+        year = params["q"].split("created:")[1][:4]
+
+        class Resp:
+            headers: dict = {}
+            status_code = 200
+            links = {}
+
+            @staticmethod
+            def raise_for_status():
+                pass
+
+            @staticmethod
+            def json():
+                return {"items": [{"user": user, "year": year}]}
+
+        return Resp()
+
+    return fake_get
+
+
+def test_fetch_async_serves_users_concurrently(monkeypatch):
+    calls = []
+    barrier = threading.Barrier(3, timeout=5)
+    monkeypatch.setattr(
+        fetch, "http_session", lambda: FakeSession(_year_echo_get(calls, barrier))
+    )
+
+    async def run():
+        return await asyncio.gather(
+            *(
+                github.fetch_user_contributions_async(
+                    user, start_year=2022, end_year=2022
+                )
+                for user in ("a", "b", "c")
+            )
+        )
+
+    results = asyncio.run(run())
+
+    assert results == [[{"user": user, "year": "2022"}] for user in ("a", "b", "c")]
+    assert len(calls) == 3
+
+
+def test_fetch_async_shares_sync_cache(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        fetch, "http_session", lambda: FakeSession(_year_echo_get(calls))
+    )
+
+    sync_items = fetch.fetch_user_contributions("me", start_year=2022, end_year=2022)
+    async_items = asyncio.run(
+        github.fetch_user_contributions_async("me", start_year=2022, end_year=2022)
+    )
+
+    assert async_items == sync_items
+    assert len(calls) == 1
+
+
+def test_iter_contribution_pages_async_yields_each_year(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        fetch, "http_session", lambda: FakeSession(_year_echo_get(calls))
+    )
+
+    async def collect():
+        return [
+            batch
+            async for batch in github.iter_contribution_pages_async(
+                "me", start_year=2020, end_year=2022
+            )
+        ]
+
+    batches = asyncio.run(collect())
+    again = asyncio.run(collect())
+
+    assert sorted(item["year"] for batch in batches for item in batch) == [
+        "2020",
+        "2021",
+        "2022",
+    ]
+    assert sorted(map(str, again)) == sorted(map(str, batches))
+    assert len(calls) == 3
+
+
+def test_fetch_contribution_days_packs_timestamps(monkeypatch):
+    events = ["2022-01-01", "2022-01-01", "2022-06-30"]
+    calls = []
+    monkeypatch.setattr(
+        fetch, "http_session", lambda: FakeSession(_synthetic_get(events, calls))
+    )
+
+    days = github.fetch_contribution_days("me", start_year=2022, end_year=2022)
+    again = github.fetch_contribution_days("me", start_year=2022, end_year=2022)
+
+    assert days.format == "I"
+    assert days.readonly
+    assert list(days) == [18993, 18993, 19173]
+    assert again.obj is days.obj
+    assert len(calls) == 1
+
+
+def test_fetch_contribution_days_packs_each_year_before_the_next(monkeypatch):
+    steps = []
+
+    def fake_year(username, token, year, *args):
+        steps.append(("fetch", year))
+        return ({"created_at": f"{year}-01-02T00:00:00Z"},)
+
+    def fake_pack(items):
+        steps.append(("pack", int(items[0]["created_at"][:4])))
+        return github.array("I", [len(items)])
+
+    monkeypatch.setattr(github, "_fetch_year", fake_year)
+    monkeypatch.setattr(github, "pack_event_days", fake_pack)
+
+    days = github.fetch_contribution_days(
+        "me", start_year=2020, end_year=2022, max_workers=1
+    )
+
+    assert list(days) == [1, 1, 1]
+    assert steps == [
+        ("fetch", 2020),
+        ("pack", 2020),
+        ("fetch", 2021),
+        ("pack", 2021),
+        ("fetch", 2022),
+        ("pack", 2022),
+    ]
+
+
+def test_iter_user_contributions_streams_pages_lazily(monkeypatch):
+    events = [f"2022-{month:02d}-15" for month in range(1, 13) for _ in range(100)]
+    calls = []
+    monkeypatch.setattr(
+        fetch, "http_session", lambda: FakeSession(_synthetic_get(events, calls))
+    )
+
+    stream = github.iter_user_contributions("me", start_year=2022, end_year=2022)
+    first = next(stream)
+    requested_before_drain = len(calls)
+    rest = list(stream)
+
+    assert first["created_at"].startswith("2022-01-15")
+    assert requested_before_drain < len(calls)
+    assert [item["created_at"][:10] for item in [first, *rest]] == events
+    assert len(github.contribution_cache) == 0
+
+
+def test_fetch_reuses_shared_years_in_memory(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        fetch, "http_session", lambda: FakeSession(_year_echo_get(calls))
+    )
+
+    fetch.fetch_user_contributions("me", start_year=2020, end_year=2022)
+    calls.clear()
+    items = fetch.fetch_user_contributions("me", start_year=2021, end_year=2023)
+
+    assert [item["year"] for item in items] == ["2021", "2022", "2023"]
+    assert calls == ["author:me created:2023-01-01..2023-12-31"]
+
+
+def test_fetch_fans_out_pages_once_total_count_is_known(monkeypatch):
+    events = [f"2022-{month:02d}-15" for month in range(1, 11) for _ in range(50)]
+    calls = []
+    in_flight = []
+    peak = []
+    lock = threading.Lock()
+    synthetic = _synthetic_get(events, calls)
+    barrier = threading.Barrier(4, timeout=5)
+
+    def fake_get(url, headers=None, params=None, timeout=10):
+        with lock:
+            in_flight.append(params["page"])
+            peak.append(len(in_flight))
+        if params["page"] > 1:
+            # Pages 2..5 wait for each other, so only a fan-out can finish.
+            barrier.wait()
+        try:
+            return synthetic(url, headers, params, timeout)
+        finally:
+            with lock:
+                in_flight.remove(params["page"])
+
+    monkeypatch.setattr(fetch, "http_session", lambda: FakeSession(fake_get))
+
+    items = fetch.fetch_user_contributions(
+        "me", start_year=2022, end_year=2022, max_workers=4
+    )
+
+    assert [item["created_at"][:10] for item in items] == events
+    assert sorted(page for _, page in calls) == [1, 2, 3, 4, 5]
+    assert max(peak) >= 4
+
+
+def test_streaming_follows_links_one_page_at_a_time(monkeypatch):
+    events = ["2022-06-01"] * 250
+    calls = []
+    monkeypatch.setattr(
+        fetch, "http_session", lambda: FakeSession(_synthetic_get(events, calls))
+    )
+
+    items = list(fetch.iter_user_contributions("me", start_year=2022, end_year=2022))
+
+    assert len(items) == 250
+    assert [page for _, page in calls] == [1, 2, 3]
+
+
+def test_concurrent_fetches_of_same_user_are_coalesced(monkeypatch):
+    calls = []
+    release = threading.Event()
+
+    def fake_get(url, headers=None, params=None, timeout=10):
+        calls.append(params["q"])
+        release.wait(5)
+        return _year_echo_get([])(url, headers, params, timeout)
+
+    monkeypatch.setattr(fetch, "http_session", lambda: FakeSession(fake_get))
+    results = []
+
+    def worker():
+        results.append(
+            fetch.fetch_user_contributions("me", start_year=2022, end_year=2022)
+        )
+
+    threads = [threading.Thread(target=worker) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    while not calls:
+        threading.Event().wait(0.01)
+    threading.Event().wait(0.05)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert len(results) == 6
+    assert all(result == results[0] for result in results)
+    assert results[0] is not results[1]
+
+
+def test_concurrent_async_fetches_are_coalesced(monkeypatch):
+    calls = []
+    release = threading.Event()
+
+    def fake_get(url, headers=None, params=None, timeout=10):
+        calls.append(params["q"])
+        release.wait(5)
+        return _year_echo_get([])(url, headers, params, timeout)
+
+    monkeypatch.setattr(fetch, "http_session", lambda: FakeSession(fake_get))
+
+    async def run():
+        tasks = [
+            asyncio.create_task(
+                github.fetch_user_contributions_async(
+                    "me", start_year=2022, end_year=2022
+                )
+            )
+            for _ in range(20)
+        ]
+        await asyncio.sleep(0.05)
+        release.set()
+        return await asyncio.gather(*tasks)
+
+    results = asyncio.run(run())
+
+    assert len(calls) == 1
+    assert len(results) == 20
+    assert results[0] == results[-1]
+
+
+def test_memory_cache_reports_stats_and_invalidates_users(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        fetch, "http_session", lambda: FakeSession(_year_echo_get(calls))
+    )
+    monkeypatch.setattr(github, "contribution_cache", github.ContributionCache())
+
+    fetch.fetch_user_contributions("me", start_year=2021, end_year=2022)
+    fetch.fetch_user_contributions("me", start_year=2021, end_year=2022)
+    stats = github.contribution_cache.stats()
+
+    assert len(calls) == 2
+    assert (stats.hits, stats.misses, stats.entries) == (2, 2, 2)
+    assert stats.bytes > 0
+
+    assert github.invalidate_user_cache("ME") == 2
+    fetch.fetch_user_contributions("me", start_year=2022, end_year=2022)
+    assert len(calls) == 3
+
+
+def test_memory_cache_budget_bounds_retained_years(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        fetch, "http_session", lambda: FakeSession(_year_echo_get(calls))
+    )
+    monkeypatch.setattr(
+        github, "contribution_cache", github.ContributionCache(max_bytes=1)
+    )
+
+    fetch.fetch_user_contributions("me", start_year=2022, end_year=2022)
+    fetch.fetch_user_contributions("me", start_year=2022, end_year=2022)
+
+    assert len(calls) == 2
+    assert len(github.contribution_cache) == 0
+
+
+def _multi_source_get(calls):
+    """Return a fake ``get`` serving issue, PR and commit searches."""
+
+    def fake_get(url, headers=None, params=None, timeout=10):
+        calls.append((url.rsplit("/", 1)[-1], params["q"]))
+        if url.endswith("/commits"):
+            items = [
+                {"sha": "b", "commit": {"author": {"date": "2022-03-02T00:00:00Z"}}},
+                {"sha": "a", "commit": {"author": {"date": "2022-01-05T00:00:00Z"}}},
+                {"sha": "a", "commit": {"author": {"date": "2022-01-05T00:00:00Z"}}},
+            ]
+        elif "type:pr" in params["q"]:
+            items = [{"id": 7, "created_at": "2022-02-01T00:00:00Z"}]
+        else:
+            items = [{"id": 7, "created_at": "2022-01-01T00:00:00Z"}]
+
+        class Resp:
+            headers: dict = {}
+            status_code = 200
+            links = {}
+
+            @staticmethod
+            def raise_for_status():
+                pass
+
+            @staticmethod
+            def json():
+                return {"total_count": len(items), "items": items}
+
+        return Resp()
+
+    return fake_get
+
+
+def test_fetch_merges_requested_sources(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        fetch, "http_session", lambda: FakeSession(_multi_source_get(calls))
+    )
+
+    items = fetch.fetch_user_contributions(
+        "me", start_year=2022, end_year=2022, sources=["issues", "prs", "commits"]
+    )
+
+    assert [(item["source"], item["created_at"][:10]) for item in items] == [
+        ("issues", "2022-01-01"),
+        ("commits", "2022-01-05"),
+        ("prs", "2022-02-01"),
+        ("commits", "2022-03-02"),
+    ]
+    assert {endpoint for endpoint, _query in calls} == {"issues", "commits"}
+    assert any("author-date:2022-01-01..2022-12-31" in q for _e, q in calls)
+
+
+def test_iter_contribution_pages_async_matches_sync_sources(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        fetch, "http_session", lambda: FakeSession(_multi_source_get(calls))
+    )
+    sources = ["issues", "prs", "commits"]
+
+    async def collect():
+        return [
+            batch
+            async for batch in github.iter_contribution_pages_async(
+                "me", start_year=2022, end_year=2022, sources=sources, max_workers=1
+            )
+        ]
+
+    batches = asyncio.run(collect())
+    items = sorted(
+        (item for batch in batches for item in batch),
+        key=lambda item: item["created_at"],
+    )
+
+    assert len(batches) == 3
+    assert items == fetch.fetch_user_contributions(
+        "me", start_year=2022, end_year=2022, sources=sources
+    )
+
+
+def test_iter_contribution_pages_async_refreshes_and_validates(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        fetch, "http_session", lambda: FakeSession(_year_echo_get(calls))
+    )
+
+    async def collect(**options):
+        return [
+            batch
+            async for batch in github.iter_contribution_pages_async(
+                "me", start_year=2021, end_year=2022, **options
+            )
+        ]
+
+    asyncio.run(collect())
+    asyncio.run(collect())
+    assert len(calls) == 2
+    refreshed = asyncio.run(collect(refresh=True))
+    assert len(calls) == 4
+    assert sorted(batch[0]["year"] for batch in refreshed) == ["2021", "2022"]
+    asyncio.run(collect())
+    assert len(calls) == 4
+    with pytest.raises(ValueError):
+        asyncio.run(collect(max_workers=0))
+
+
+@pytest.mark.parametrize(
+    "sources, message", [(["stars"], "unknown source"), ([], "at least one source")]
+)
+def test_fetch_rejects_unknown_or_missing_sources(sources, message):
+    with pytest.raises(ValueError, match=message):
+        fetch.fetch_user_contributions(
+            "me", start_year=2022, end_year=2022, sources=sources
+        )
+
+
+def test_fetch_contributions_since_clips_year_windows(monkeypatch):
+    events = ["2022-11-19", "2022-11-20", "2022-12-31", "2023-01-01", "2023-02-04"]
+    calls = []
+    monkeypatch.setattr(
+        github, "http_session", lambda: FakeSession(_synthetic_get(events, calls))
+    )
+
+    items = github.fetch_contributions_since(
+        "me", date(2022, 11, 20), until=date(2023, 2, 3)
+    )
+
+    assert [item["created_at"][:10] for item in items] == [
+        "2022-11-20",
+        "2022-12-31",
+        "2023-01-01",
+    ]
+    assert sorted(query for query, _page in calls) == [
+        "author:me created:2022-11-20..2022-12-31",
+        "author:me created:2023-01-01..2023-02-03",
+    ]
+
+
+def test_refresh_refetches_the_watermark_day_once(monkeypatch, tmp_path):
+    events = ["2023-01-05", "2023-02-10"]
+    calls = []
+    monkeypatch.setattr(
+        github, "http_session", lambda: FakeSession(_synthetic_get(events, calls))
+    )
+
+    class DummyDateTime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime(2023, 3, 1, tzinfo=tz)
+
+    monkeypatch.setattr(github, "datetime", DummyDateTime)
+    store = WatermarkStore(tmp_path)
+    refresh_contribution_maps("me", store, start_year=2023, end_year=2023)
+
+    events += ["2023-02-10", "2023-02-20"]
+    _, _, _monthly, daily = refresh_contribution_maps(
+        "me", store, start_year=2023, end_year=2023
+    )
+
+    assert calls[-1] == ("author:me created:2023-02-10..2023-03-01", 1)
+    assert daily == {(2023, 1, 5): 1, (2023, 2, 10): 2, (2023, 2, 20): 1}
+
+
+def test_fetch_contributions_since_empty_range(monkeypatch):
+    monkeypatch.setattr(github, "http_session", lambda: pytest.fail("no request"))
+
+    assert (
+        github.fetch_contributions_since("me", date(2024, 1, 2), until=date(2024, 1, 1))
+        == []
+    )
+    with pytest.raises(ValueError):
+        github.fetch_contributions_since("me", date(2024, 1, 1), max_workers=0)
+
+
+def test_nested_fan_out_shares_max_workers(monkeypatch):
+    lock = threading.Lock()
+    in_flight = []
+    peak = []
+
+    def fake_get(url, headers=None, params=None, timeout=10):
+        with lock:
+            in_flight.append(1)
+            peak.append(len(in_flight))
+        time.sleep(0.005)
+        with lock:
+            in_flight.pop()
+        page = params["page"]
+
+        class Resp:
+            headers: dict = {}
+            status_code = 200
+            links = {"next": {}} if page < 3 else {}
+
+            @staticmethod
+            def raise_for_status():
+                pass
+
+            @staticmethod
+            def json():
+                items = [{"id": f"{params['q']}:{page}", "created_at": "2022-01-01"}]
+                return {"total_count": 250, "items": items}
+
+        return Resp()
+
+    monkeypatch.setattr(fetch, "http_session", lambda: FakeSession(fake_get))
+
+    items = fetch.fetch_user_contributions(
+        "me",
+        start_year=2020,
+        end_year=2022,
+        max_workers=3,
+        sources=["issues", "prs", "commits", "reviews"],
+    )
+
+    assert len(items) == 4 * 3 * 3
+    assert 1 < max(peak) <= 3
+
+
+def test_connection_pool_grows_with_worker_budget(monkeypatch):
+    monkeypatch.setattr(github, "_session", None)
+    monkeypatch.setattr(github, "_pool_size", github.DEFAULT_MAX_WORKERS)
+    session = github.http_session()
+
+    def pool_size():
+        return session.get_adapter(github.GITHUB_API)._pool_maxsize
+
+    assert pool_size() == github.DEFAULT_MAX_WORKERS
+    github._map_concurrently(lambda value: value, range(3), 8)
+    assert pool_size() == 8
+    github._map_concurrently(lambda value: value, range(3), 2)
+    assert pool_size() == 8
+
+
+def test_connection_pool_covers_concurrent_budgets(monkeypatch):
+    monkeypatch.setattr(github, "_session", None)
+    monkeypatch.setattr(github, "_pool_size", github.DEFAULT_MAX_WORKERS)
+    monkeypatch.setattr(github, "_active_budgets", {})
+    session = github.http_session()
+    both_active = threading.Barrier(2, timeout=5)
+    sizes = []
+
+    def fetch_page(_page):
+        both_active.wait()
+        sizes.append(session.get_adapter(github.GITHUB_API)._pool_maxsize)
+
+    threads = [
+        threading.Thread(target=github._map_concurrently, args=(fetch_page, [0], 3))
+        for _user in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sizes == [6, 6]
+    assert github._active_budgets == {}
+
+
+def test_async_range_and_year_fetches_do_not_deadlock(monkeypatch):
+    flights = github.SingleFlight()
+    monkeypatch.setattr(github, "_flights", flights)
+    monkeypatch.setattr(github, "ASYNC_MAX_CONCURRENCY", 2)
+    monkeypatch.setattr(github, "_async_executors", {})
+    echo = _year_echo_get([])
+
+    def slow_get(*args, **kwargs):
+        time.sleep(0.02)
+        return echo(*args, **kwargs)
+
+    monkeypatch.setattr(fetch, "http_session", lambda: FakeSession(slow_get))
+
+    async def pages():
+        return [
+            batch
+            async for batch in github.iter_contribution_pages_async(
+                "me", start_year=2023, end_year=2023
+            )
+        ]
+
+    async def run():
+        # Both pool threads run range fetches that reach 2023 after the
+        # coroutine below has claimed that year.
+        ranges = [
+            github.fetch_user_contributions_async(
+                "me", start_year=2020, end_year=2023, max_workers=workers
+            )
+            for workers in (1, 2)
+        ]
+        return await asyncio.wait_for(asyncio.gather(*ranges, pages()), timeout=10)
+
+    try:
+        first, second, batches = asyncio.run(run())
+    finally:
+        # Unblock stranded threads if the pools ever deadlock again.
+        for future in list(flights._calls.values()):
+            future.set_exception(RuntimeError("deadlocked"))
+
+    assert first == second
+    assert [item["year"] for item in first] == ["2020", "2021", "2022", "2023"]
+    assert batches == [[{"user": "me", "year": "2023"}]]
+
+
+def test_async_fetch_accepts_list_options(monkeypatch, tmp_path):
+    calls = []
+    monkeypatch.setattr(
+        fetch, "http_session", lambda: FakeSession(_multi_source_get(calls))
+    )
+    scanned = []
+
+    def fake_local(author, repositories, start, end, *, max_workers):
+        scanned.append((author, repositories))
+        return [{"created_at": "2022-05-01T00:00:00Z"}]
+
+    monkeypatch.setattr(github, "fetch_local_contributions", fake_local)
+
+    async def run():
+        return await asyncio.gather(
+            github.fetch_user_contributions_async(
+                "me", start_year=2022, end_year=2022, sources=["prs", "commits"]
+            ),
+            github.fetch_user_contributions_async(
+                "me", start_year=2022, end_year=2022, sources=["commits", "prs"]
+            ),
+            github.fetch_user_contributions_async(
+                "me", start_year=2022, end_year=2022, repositories=[tmp_path]
+            ),
+        )
+
+    by_source, reordered, local = asyncio.run(run())
+
+    assert by_source == reordered
+    assert {item["source"] for item in by_source} == {"prs", "commits"}
+    assert local == [{"created_at": "2022-05-01T00:00:00Z"}]
+    assert scanned == [("me", (tmp_path,))]
@@ -1,3 +1,4 @@
+from gitshelves.core.contributions import ContributionAggregator
 from gitshelves.readme import write_year_readme
 
 
@@ -55,3 +56,34 @@ def test_write_year_readme_includes_baseplate_stl_when_requested(tmp_path):
     text = readme.read_text()
     assert "[`baseplate_2x6.scad`](baseplate_2x6.scad)" in text
     assert "[`baseplate_2x6.stl`](baseplate_2x6.stl)" in text
+
+
+def test_write_year_readme_highlights_from_stats(tmp_path):
+    aggregator = ContributionAggregator()
+    aggregator.update(
+        {"created_at": day}
+        for day in ["2024-03-01", "2024-03-02", "2024-03-02", "2024-06-10"]
+    )
+    rollup = aggregator.rollup(2024, 2024)
+
+    readme = write_year_readme(
+        2024, rollup.monthly, outdir=tmp_path, stats=rollup.year_stats[2024]
+    )
+    text = readme.read_text()
+
+    assert "## Highlights" in text
+    assert "- Total: 4 contributions over 3 active days" in text
+    assert "- Longest streak: 2 days (2024-03-01 \u2192 2024-03-02)" in text
+    assert "- Busiest day: 2024-03-02 with 2 contributions" in text
+    assert "- Busiest month: March with 3 contributions" in text
+    assert "- Active days: median 1 contribution, 90th percentile 2" in text
+
+
+def test_write_year_readme_highlights_without_contributions(tmp_path):
+    rollup = ContributionAggregator().rollup(2024, 2024)
+
+    readme = write_year_readme(
+        2024, rollup.monthly, outdir=tmp_path, stats=rollup.year_stats[2024]
+    )
+
+    assert "- No contributions recorded" in readme.read_text()
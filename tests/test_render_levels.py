@@ -0,0 +1,86 @@
+"""Tests for threshold-based block level scales."""
+
+import pytest
+
+from gitshelves.render import levels as levels_mod
+from gitshelves.render.levels import (
+    LOG_SCALE,
+    LevelScale,
+    capped_log_scale,
+    fit_scale,
+    linear_scale,
+    quantile_scale,
+)
+from gitshelves.render.scad import (
+    blocks_for_contributions,
+    generate_scad_monthly,
+    levels_for_contributions,
+)
+
+
+def test_log_scale_matches_decades_without_float_rounding():
+    counts = [-3, 0, 1, 9, 10, 99, 100, 10**15 - 1, 10**16 - 1, 10**16]
+
+    assert LOG_SCALE.levels(counts) == [0, 0, 1, 1, 2, 2, 3, 15, 16, 17]
+    assert [blocks_for_contributions(count) for count in counts] == (
+        levels_for_contributions(counts)
+    )
+
+
+def test_batch_levels_use_numpy_for_large_inputs(monkeypatch):
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(levels_mod, "BATCH_THRESHOLD", 4)
+    counts = [0, 5, 50, 500, 5000, 0]
+
+    assert LOG_SCALE.levels(counts) == [0, 1, 2, 3, 4, 0]
+    assert LOG_SCALE.levels(tuple(counts)) == LOG_SCALE.levels(iter(counts))
+
+
+def test_capped_and_linear_scales():
+    assert capped_log_scale(2).levels([5, 50, 5000]) == [1, 2, 2]
+
+    linear = linear_scale(40, 4)
+    assert linear.thresholds == (1, 11, 21, 31)
+    assert linear.levels([0, 1, 10, 11, 40]) == [0, 1, 1, 2, 4]
+    assert linear_scale(2, 5).levels([1, 2]) == [1, 2]
+
+
+def test_quantile_scale_splits_active_counts_evenly():
+    scale = quantile_scale([0, 8, 1, 2, 3, 4, 5, 6, 7], 4)
+
+    assert scale.thresholds == (1, 3, 5, 7)
+    assert scale.levels(range(9)) == [0, 1, 1, 2, 2, 3, 3, 4, 4]
+    assert quantile_scale([5, 5, 5], 4).thresholds == (1,)
+    assert quantile_scale([], 3).thresholds == (1,)
+
+
+def test_fit_scale_validates_names_and_levels():
+    assert fit_scale("log") is LOG_SCALE
+    assert fit_scale("linear", [0, 100], 2).thresholds == (1, 51)
+    assert fit_scale("capped-log").max_level == 5
+    with pytest.raises(ValueError):
+        fit_scale("log", max_level=3)
+    with pytest.raises(ValueError):
+        fit_scale("cubic")
+    with pytest.raises(ValueError):
+        fit_scale("linear", [1], 0)
+    with pytest.raises(ValueError):
+        LevelScale("bad", (1, 1))
+    for thresholds in ((), (0, 1)):
+        with pytest.raises(ValueError):
+            LevelScale("bad", thresholds)
+
+
+def test_fit_scale_builds_quantile_scales_and_serialises():
+    scale = fit_scale("quantile", [1, 2, 3, 4], 2)
+
+    assert scale.to_json() == {"name": "quantile", "thresholds": [1, 3]}
+
+
+def test_generators_accept_a_scale():
+    counts = {(2024, 1): 1, (2024, 2): 1000}
+
+    capped = generate_scad_monthly(counts, scale=capped_log_scale(2))
+
+    assert generate_scad_monthly(counts) != capped
+    assert capped.count("// 2024-02") == 2